@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Cached, gitignore-aware inventory of UI component files.
+
+Shared by component_mapper, design_analyzer, design_system_auditor and the
+visual-regression story generator. The inventory is persisted under
+.agent/cache/ as one record per directory (mtime, .gitignore signature,
+component files, subdirectories). A refresh stats each directory and only
+rescans the ones whose mtime changed, so repeated design handoffs don't
+rewalk large trees.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+INVENTORY_FILE = os.path.join('.agent', 'cache', 'component-inventory.json')
+INVENTORY_VERSION = 1
+
+COMPONENT_EXTENSIONS = ('tsx', 'jsx', 'vue', 'svelte')
+
+# Test, story and spec files are not components
+NON_COMPONENT_MARKERS = ('.test', '.spec', '.stories', '.story')
+
+# Directories never worth descending into
+PRUNE_DIRS = {
+    '.git', 'node_modules', 'dist', 'build', 'out', '.next', '.nuxt', '.svelte-kit',
+    'coverage', 'storybook-static', '.turbo', '.cache', '.agent', 'vendor', '.venv', 'venv',
+}
+
+
+# Copy of GitignoreRules in skills/os-layer/core/nav-onboard/functions/file_index.py
+# (the skills ship separately, so neither can import the other). Keep the
+# pattern parsing and matching in sync; only load() takes a file path here.
+class GitignoreRules:
+    """Minimal .gitignore matcher: basename/anchored globs, dir-only and negation."""
+
+    def __init__(self, base: str, patterns: List[Tuple[str, bool, bool, bool]]):
+        self.base = base
+        # (glob, negated, dir_only, anchored)
+        self.patterns = patterns
+
+    @classmethod
+    def load(cls, path: str, base: str) -> Optional['GitignoreRules']:
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return None
+
+        patterns = []
+        for line in lines:
+            line = line.rstrip()
+            if not line or line.startswith('#'):
+                continue
+            negated = line.startswith('!')
+            line = line.lstrip('!')
+            dir_only = line.endswith('/')
+            line = line.strip('/') if dir_only else line
+            if line.startswith('**/'):
+                line = line[3:]
+            anchored = '/' in line
+            line = line.lstrip('/')
+            if line:
+                # fnmatch's "*" already crosses "/", so "**" collapses to "*"
+                patterns.append((line.replace('**', '*'), negated, dir_only, anchored))
+
+        return cls(base, patterns) if patterns else None
+
+    def ignores(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """True/False if a rule decides, None if no rule applies."""
+        local = rel_path[len(self.base) + 1:] if self.base else rel_path
+        name = local.rpartition('/')[2]
+        decision = None
+        for glob, negated, dir_only, anchored in self.patterns:
+            if dir_only and not is_dir:
+                continue
+            if fnmatch.fnmatchcase(local if anchored else name, glob):
+                decision = not negated
+        return decision
+
+
+def _ignored(rules: Sequence[GitignoreRules], rel_path: str, is_dir: bool) -> bool:
+    # Deeper .gitignore files override shallower ones
+    for rule_set in reversed(rules):
+        decision = rule_set.ignores(rel_path, is_dir)
+        if decision is not None:
+            return decision
+    return False
+
+
+def _signature(path: str) -> Optional[List[int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _is_component(stem: str) -> bool:
+    lowered = stem.lower()
+    return not any(marker in lowered for marker in NON_COMPONENT_MARKERS)
+
+
+class ComponentInventory:
+    """Per-directory component file records for one project root."""
+
+    def __init__(self, project_root: str, extensions: Sequence[str] = COMPONENT_EXTENSIONS):
+        self.project_root = project_root
+        self.root = os.path.abspath(project_root)
+        self.extensions = sorted(set(extensions))
+        # rel_dir ("/"-separated, "" for root) -> record
+        self.dirs: Dict[str, Dict] = {}
+        self.stats = {'scanned': 0, 'reused': 0}
+
+    @property
+    def cache_path(self) -> str:
+        return os.path.join(self.root, INVENTORY_FILE)
+
+    def load(self) -> bool:
+        """Load the persisted inventory; False if missing, stale or incompatible."""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get('version') != INVENTORY_VERSION or data.get('root') != self.root:
+            return False
+        if not set(self.extensions) <= set(data.get('extensions', [])):
+            # Cached records were filtered to fewer extensions; rebuild with the union
+            self.extensions = sorted(set(self.extensions) | set(data.get('extensions', [])))
+            return False
+        self.extensions = data['extensions']
+        self.dirs = data.get('dirs', {})
+        return True
+
+    def save(self) -> Optional[str]:
+        """Persist the inventory (only in Navigator projects, i.e. when .agent/ exists)."""
+        if not os.path.isdir(os.path.join(self.root, '.agent')):
+            return None
+        path = self.cache_path
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': INVENTORY_VERSION,
+                    'root': self.root,
+                    'extensions': self.extensions,
+                    'dirs': self.dirs,
+                }, f, separators=(',', ':'))
+            os.replace(temp_path, path)
+        except OSError:
+            return None
+        return path
+
+    def _scan(self, rel_dir: str, rules: Tuple[GitignoreRules, ...]) -> Tuple[List[str], List[str]]:
+        directory = os.path.join(self.root, rel_dir)
+        suffixes = tuple(f'.{ext}' for ext in self.extensions)
+        files, subdirs = [], []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if entry.name in PRUNE_DIRS:
+                            continue
+                    elif not entry.name.endswith(suffixes):
+                        continue
+                    rel_path = f'{rel_dir}/{entry.name}' if rel_dir else entry.name
+                    if _ignored(rules, rel_path, is_dir):
+                        continue
+                    (subdirs if is_dir else files).append(entry.name)
+        except OSError:
+            pass
+        return sorted(files), sorted(subdirs)
+
+    def refresh(self) -> 'ComponentInventory':
+        """
+        Bring records up to date, rescanning only directories whose mtime changed.
+
+        A changed .gitignore forces a rescan of its whole subtree.
+
+        Returns:
+            self
+        """
+        previous, self.dirs = self.dirs, {}
+        self.stats = {'scanned': 0, 'reused': 0}
+
+        stack: List[Tuple[str, Tuple[GitignoreRules, ...], bool]] = [('', (), False)]
+        while stack:
+            rel_dir, rules, force = stack.pop()
+            directory = os.path.join(self.root, rel_dir)
+            mtime = _signature(directory)
+            if mtime is None:
+                continue
+
+            gitignore_path = os.path.join(directory, '.gitignore')
+            gitignore = _signature(gitignore_path)
+            cached = previous.get(rel_dir)
+            if cached is not None and cached.get('gitignore') != gitignore:
+                force = True
+
+            local = GitignoreRules.load(gitignore_path, rel_dir) if gitignore else None
+            if local:
+                rules = rules + (local,)
+
+            if not force and cached is not None and cached.get('mtime') == mtime[0]:
+                record = cached
+                self.stats['reused'] += 1
+            else:
+                files, subdirs = self._scan(rel_dir, rules)
+                record = {'mtime': mtime[0], 'gitignore': gitignore, 'files': files, 'dirs': subdirs}
+                self.stats['scanned'] += 1
+
+            self.dirs[rel_dir] = record
+            for name in reversed(record['dirs']):
+                stack.append((f'{rel_dir}/{name}' if rel_dir else name, rules, force))
+
+        return self
+
+    def components(self, extensions: Optional[Sequence[str]] = None) -> List[Dict[str, object]]:
+        """
+        Component files in the inventory.
+
+        Args:
+            extensions: Restrict to these extensions (default: all inventoried)
+
+        Returns:
+            List of component info (name, path, full_path, has_story), ordered by path
+        """
+        wanted = set(extensions or self.extensions)
+        components = []
+        for rel_dir in sorted(self.dirs):
+            files = self.dirs[rel_dir]['files']
+            storied = set()
+            for file in files:
+                stem = file.rpartition('.')[0]
+                for marker in ('.stories', '.story'):
+                    if stem.endswith(marker):
+                        storied.add(stem[:-len(marker)])
+
+            for file in files:
+                stem, _, ext = file.rpartition('.')
+                if ext not in wanted or not _is_component(stem):
+                    continue
+                rel_path = os.path.join(*rel_dir.split('/'), file) if rel_dir else file
+                components.append({
+                    'name': stem,
+                    'path': rel_path,
+                    'full_path': os.path.join(self.project_root, rel_path),
+                    'has_story': stem in storied,
+                })
+        return components
+
+
+# (root, extensions) -> inventory refreshed during this process
+_INVENTORIES: Dict[Tuple[str, Tuple[str, ...]], ComponentInventory] = {}
+
+
+def load_inventory(project_root: str, extensions: Optional[Sequence[str]] = None,
+                   rebuild: bool = False) -> ComponentInventory:
+    """
+    Load, refresh and persist the component inventory for a project.
+
+    Refreshed at most once per process per root; later calls reuse it.
+
+    Args:
+        project_root: Project root directory
+        extensions: Component file extensions (default: tsx, jsx, vue, svelte)
+        rebuild: Ignore the persisted inventory and rescan everything
+
+    Returns:
+        ComponentInventory
+    """
+    extensions = tuple(sorted(set(extensions or COMPONENT_EXTENSIONS)))
+    key = (os.path.abspath(project_root), extensions)
+    if not rebuild and key in _INVENTORIES:
+        return _INVENTORIES[key]
+
+    inventory = ComponentInventory(project_root, extensions)
+    if not rebuild:
+        inventory.load()
+    inventory.refresh()
+    inventory.save()
+
+    _INVENTORIES[key] = inventory
+    return inventory
+
+
+def find_components(project_root: str, extensions: Optional[Sequence[str]] = None) -> List[Dict[str, object]]:
+    """Component files in a project, served from the cached inventory."""
+    return load_inventory(project_root, extensions).components(extensions)
+
+
+def ui_kit_inventory(project_root: str) -> Dict[str, object]:
+    """Inventory in ui-kit-inventory.json shape, for tools that take one."""
+    return {
+        'components': [{'name': comp['name'], 'path': comp['path']} for comp in find_components(project_root)],
+        'tokens': {}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Build or refresh the cached component inventory'
+    )
+    parser.add_argument(
+        '--project-root',
+        default='.',
+        help='Project root directory (default: current directory)'
+    )
+    parser.add_argument(
+        '--rebuild',
+        action='store_true',
+        help='Ignore the cached inventory and rescan everything'
+    )
+    parser.add_argument(
+        '--output',
+        help='Output file path (default: stdout)'
+    )
+
+    args = parser.parse_args()
+
+    inventory = load_inventory(args.project_root, rebuild=args.rebuild)
+    output_json = json.dumps({
+        'components': inventory.components(),
+        'directories': inventory.stats,
+    }, indent=2)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output_json)
+    else:
+        print(output_json)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,10 +5,12 @@ Map Figma components to codebase components using Code Connect data and fuzzy ma
 
 import json
 import argparse
-import os
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from difflib import SequenceMatcher
 
+from component_inventory import find_components
+from similarity_index import SimilarityIndex, batch_top_k
+
 
 def calculate_similarity(str1: str, str2: str) -> float:
     """Calculate similarity ratio between two strings."""
@@ -19,9 +21,12 @@ def find_component_files(project_root: str, extensions: List[str] = None) -> Lis
     """
     Find all component files in project.
 
+    Served from the cached component inventory (.agent/cache/), which skips
+    .gitignore'd and build directories and only rescans changed directories.
+
     Args:
         project_root: Project root directory
-        extensions: File extensions to search (default: ['tsx', 'jsx', 'vue'])
+        extensions: File extensions to search (default: ['tsx', 'jsx', 'vue', 'svelte'])
 
     Returns:
         List of component file info (path, name)
@@ -29,35 +34,15 @@ def find_component_files(project_root: str, extensions: List[str] = None) -> Lis
     if extensions is None:
         extensions = ['tsx', 'jsx', 'vue', 'svelte']
 
-    components = []
-
-    for root, dirs, files in os.walk(project_root):
-        # Skip node_modules, dist, build directories
-        dirs[:] = [d for d in dirs if d not in ['node_modules', 'dist', 'build', '.git', '.next']]
-
-        for file in files:
-            if any(file.endswith(f'.{ext}') for ext in extensions):
-                full_path = os.path.join(root, file)
-                rel_path = os.path.relpath(full_path, project_root)
-
-                # Extract component name (filename without extension)
-                comp_name = os.path.splitext(file)[0]
-
-                # Skip test files, stories, etc.
-                if any(suffix in comp_name.lower() for suffix in ['.test', '.spec', '.stories', '.story']):
-                    continue
-
-                components.append({
-                    'name': comp_name,
-                    'path': rel_path,
-                    'full_path': full_path
-                })
-
-    return components
+    return [
+        {'name': comp['name'], 'path': comp['path'], 'full_path': comp['full_path']}
+        for comp in find_components(project_root, extensions)
+    ]
 
 
 def fuzzy_match_component(figma_name: str, codebase_components: List[Dict[str, str]],
-                         threshold: float = 0.6) -> List[Dict[str, Any]]:
+                         threshold: float = 0.6,
+                         index: Optional[SimilarityIndex] = None) -> List[Dict[str, Any]]:
     """
     Fuzzy match Figma component name to codebase components.
 
@@ -65,6 +50,8 @@ def fuzzy_match_component(figma_name: str, codebase_components: List[Dict[str, s
         figma_name: Figma component name
         codebase_components: List of codebase component info
         threshold: Minimum similarity threshold
+        index: SimilarityIndex over codebase component names (built once per
+            run by map_components; built on the fly if omitted)
 
     Returns:
         List of matches with confidence scores
@@ -75,18 +62,18 @@ def fuzzy_match_component(figma_name: str, codebase_components: List[Dict[str, s
     # "Button/Primary/Large" → "Button"
     base_name = figma_name.split('/')[0].strip()
 
-    for comp in codebase_components:
-        comp_name = comp['name']
-        similarity = calculate_similarity(base_name, comp_name)
-
-        if similarity >= threshold:
-            matches.append({
-                'figma_name': figma_name,
-                'code_component': comp_name,
-                'code_path': comp['path'],
-                'confidence': round(similarity, 3),
-                'match_type': 'fuzzy'
-            })
+    if index is None:
+        index = SimilarityIndex([comp['name'] for comp in codebase_components])
+
+    for position, similarity in index.matches(base_name, threshold):
+        comp = codebase_components[position]
+        matches.append({
+            'figma_name': figma_name,
+            'code_component': comp['name'],
+            'code_path': comp['path'],
+            'confidence': round(similarity, 3),
+            'match_type': 'fuzzy'
+        })
 
     # Sort by confidence
     matches.sort(key=lambda x: x['confidence'], reverse=True)
@@ -94,6 +81,39 @@ def fuzzy_match_component(figma_name: str, codebase_components: List[Dict[str, s
     return matches
 
 
+def batch_match_components(figma_names: List[str], codebase_components: List[Dict[str, str]],
+                           threshold: float = 0.6, k: int = 3) -> List[List[Dict[str, Any]]]:
+    """
+    Match many Figma component names at once by n-gram cosine similarity.
+
+    Vectorized counterpart of fuzzy_match_component for whole design systems;
+    confidence is the cosine of the names' trigram count vectors.
+
+    Args:
+        figma_names: Figma component names
+        codebase_components: List of codebase component info
+        threshold: Minimum cosine similarity
+        k: Matches to keep per name
+
+    Returns:
+        Matches per Figma name (same order), best first
+    """
+    base_names = [name.split('/')[0].strip() for name in figma_names]
+    code_names = [comp['name'] for comp in codebase_components]
+
+    results = []
+    for figma_name, top in zip(figma_names, batch_top_k(base_names, code_names, k=k, threshold=threshold)):
+        results.append([{
+            'figma_name': figma_name,
+            'code_component': codebase_components[position]['name'],
+            'code_path': codebase_components[position]['path'],
+            'confidence': round(similarity, 3),
+            'match_type': 'ngram'
+        } for position, similarity in top])
+
+    return results
+
+
 def extract_variant_mapping(figma_name: str) -> Dict[str, str]:
     """
     Extract variant information from Figma component name.
@@ -164,7 +184,8 @@ def extract_variant_mapping(figma_name: str) -> Dict[str, str]:
 
 def map_components(figma_components: List[Dict[str, Any]],
                   code_connect_map: Dict[str, Any],
-                  project_root: str) -> Dict[str, Any]:
+                  project_root: str,
+                  batch: bool = False) -> Dict[str, Any]:
     """
     Main mapping function: map Figma components to codebase components.
 
@@ -172,6 +193,7 @@ def map_components(figma_components: List[Dict[str, Any]],
         figma_components: List of Figma components from design_analyzer
         code_connect_map: Figma Code Connect mappings
         project_root: Project root directory for component search
+        batch: Score all fuzzy matches in one vectorized n-gram pass
 
     Returns:
         Component mappings with confidence scores
@@ -179,6 +201,14 @@ def map_components(figma_components: List[Dict[str, Any]],
     # Find all component files in codebase
     codebase_components = find_component_files(project_root)
 
+    if batch:
+        # Score every Figma component without Code Connect in one vectorized pass
+        unconnected = [comp.get('name') for comp in figma_components
+                       if not (comp.get('id') and comp.get('id') in code_connect_map)]
+        batch_matches = iter(batch_match_components(unconnected, codebase_components, threshold=0.6))
+    else:
+        index = SimilarityIndex([comp['name'] for comp in codebase_components])
+
     mappings = {
         'mapped': [],
         'unmapped': [],
@@ -204,7 +234,10 @@ def map_components(figma_components: List[Dict[str, Any]],
             })
         else:
             # Fallback to fuzzy matching
-            matches = fuzzy_match_component(comp_name, codebase_components, threshold=0.6)
+            if batch:
+                matches = next(batch_matches)
+            else:
+                matches = fuzzy_match_component(comp_name, codebase_components, threshold=0.6, index=index)
 
             if matches and matches[0]['confidence'] >= 0.8:
                 # High confidence match
@@ -264,6 +297,11 @@ def main():
         '--output',
         help='Output file path (default: stdout)'
     )
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Vectorized n-gram cosine matching for large design systems'
+    )
 
     args = parser.parse_args()
 
@@ -278,7 +316,7 @@ def main():
             code_connect_map = json.load(f)
 
     # Run mapping
-    mappings = map_components(figma_components, code_connect_map, args.project_root)
+    mappings = map_components(figma_components, code_connect_map, args.project_root, batch=args.batch)
 
     # Output results
     output_json = json.dumps(mappings, indent=2)
@@ -7,9 +7,24 @@ Compares against existing UI kit to identify new components and potential reuse
 import json
 import sys
 import argparse
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable, Optional, Set
 from difflib import SequenceMatcher
 
+from component_inventory import ui_kit_inventory as project_ui_kit_inventory
+from metadata_stream import descendant_ids, iter_nodes, walk_nodes
+from screenshot_store import load_unchanged_nodes
+from similarity_index import SimilarityIndex, batch_top_k
+
+# Node types reported as components (COMPONENT, COMPONENT_SET, or instances)
+COMPONENT_TYPES = ('COMPONENT', 'COMPONENT_SET', 'INSTANCE')
+
+# Node fields read by extract_components_from_metadata / extract_node_properties
+NODE_FIELDS = (
+    'id', 'name', 'type', 'layoutMode', 'layoutDirection', 'itemSpacing',
+    'paddingTop', 'paddingRight', 'paddingBottom', 'paddingLeft',
+    'absoluteBoundingBox', 'componentProperties',
+)
+
 
 def calculate_similarity(str1: str, str2: str) -> float:
     """
@@ -25,52 +40,62 @@ def calculate_similarity(str1: str, str2: str) -> float:
     return SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
 
 
-def extract_components_from_metadata(metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+def extract_components_from_metadata(metadata: Dict[str, Any],
+                                     page: Optional[str] = None,
+                                     subtree: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Extract component information from Figma metadata.
 
     Args:
         metadata: Figma MCP get_metadata response or manual structure
+        page: Only include components on this page (CANVAS name or ID)
+        subtree: Only include components under this node ID
 
     Returns:
         List of components with their properties
     """
-    components = []
-
-    def traverse_nodes(node, depth=0):
-        """Recursively traverse Figma node tree."""
-        if not isinstance(node, dict):
-            return
-
-        node_type = node.get('type', '')
-        node_name = node.get('name', 'Unnamed')
-        node_id = node.get('id', '')
-
-        # Identify components (COMPONENT, COMPONENT_SET, or instances)
-        if node_type in ['COMPONENT', 'COMPONENT_SET', 'INSTANCE']:
-            components.append({
-                'id': node_id,
-                'name': node_name,
-                'type': node_type,
-                'depth': depth,
-                'properties': extract_node_properties(node)
-            })
+    # Iterative traversal: deep trees don't hit the recursion limit
+    return [component_entry(node, depth) for node, depth in walk_nodes(metadata, COMPONENT_TYPES, page, subtree)]
+
+
+def stream_components(figma_data_path: str, page: Optional[str] = None,
+                      subtree: Optional[str] = None,
+                      sections: Optional[Dict[str, Any]] = None,
+                      unchanged_nodes: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Extract components from a combined Figma data file without loading it whole.
 
-        # Traverse children
-        children = node.get('children', [])
-        for child in children:
-            traverse_nodes(child, depth + 1)
+    Streams the 'metadata' section with ijson when installed, keeping only the
+    fields components need; otherwise loads the file.
 
-    # Handle both MCP format and manual format
-    if 'document' in metadata:
-        traverse_nodes(metadata['document'])
-    elif 'nodes' in metadata:
-        for node in metadata['nodes']:
-            traverse_nodes(node)
-    elif isinstance(metadata, dict):
-        traverse_nodes(metadata)
+    Args:
+        figma_data_path: Path to JSON file with Figma MCP data
+        page: Only include components on this page (CANVAS name or ID)
+        subtree: Only include components under this node ID
+        sections: Dict whose keys name other top-level sections to collect in
+            the same pass (e.g. 'variables', 'code_connect_map')
+        unchanged_nodes: Unchanged frame/component IDs, extended in place with
+            every node under them, since analyze_design can't expand them
+            without loaded metadata
 
-    return components
+    Returns:
+        List of components with their properties
+    """
+    nodes = iter_nodes(figma_data_path, COMPONENT_TYPES, fields=NODE_FIELDS, page=page,
+                       subtree=subtree, root_key='metadata', sections=sections,
+                       expand=unchanged_nodes)
+    return [component_entry(node, depth) for node, depth in nodes]
+
+
+def component_entry(node: Dict[str, Any], depth: int) -> Dict[str, Any]:
+    """Component record for a COMPONENT/COMPONENT_SET/INSTANCE node."""
+    return {
+        'id': node.get('id', ''),
+        'name': node.get('name', 'Unnamed'),
+        'type': node.get('type', ''),
+        'depth': depth,
+        'properties': extract_node_properties(node)
+    }
 
 
 def extract_node_properties(node: Dict[str, Any]) -> Dict[str, Any]:
@@ -156,7 +181,8 @@ def categorize_component_by_name(component_name: str) -> str:
 
 def find_similar_components(new_component: Dict[str, Any],
                            ui_kit_inventory: List[Dict[str, Any]],
-                           threshold: float = 0.7) -> List[Dict[str, Any]]:
+                           threshold: float = 0.7,
+                           index: Optional[SimilarityIndex] = None) -> List[Dict[str, Any]]:
     """
     Find similar components in existing UI kit.
 
@@ -164,6 +190,8 @@ def find_similar_components(new_component: Dict[str, Any],
         new_component: Component from Figma design
         ui_kit_inventory: List of existing UI kit components
         threshold: Similarity threshold (0.0 to 1.0)
+        index: SimilarityIndex over UI kit names (built once per run by
+            analyze_design; built on the fly if omitted)
 
     Returns:
         List of similar components with similarity scores
@@ -171,17 +199,18 @@ def find_similar_components(new_component: Dict[str, Any],
     similar = []
     new_name = new_component.get('name', '')
 
-    for existing in ui_kit_inventory:
+    if index is None:
+        index = SimilarityIndex([existing.get('name', '') for existing in ui_kit_inventory])
+
+    for position, similarity in index.matches(new_name, threshold):
+        existing = ui_kit_inventory[position]
         existing_name = existing.get('name', '')
-        similarity = calculate_similarity(new_name, existing_name)
-
-        if similarity >= threshold:
-            similar.append({
-                'name': existing_name,
-                'path': existing.get('path', ''),
-                'similarity': similarity,
-                'recommendation': generate_recommendation(similarity, new_name, existing_name)
-            })
+        similar.append({
+            'name': existing_name,
+            'path': existing.get('path', ''),
+            'similarity': similarity,
+            'recommendation': generate_recommendation(similarity, new_name, existing_name)
+        })
 
     # Sort by similarity descending
     similar.sort(key=lambda x: x['similarity'], reverse=True)
@@ -189,6 +218,39 @@ def find_similar_components(new_component: Dict[str, Any],
     return similar
 
 
+def batch_similar_components(new_components: List[Dict[str, Any]],
+                             ui_kit_inventory: List[Dict[str, Any]],
+                             threshold: float = 0.7, k: int = 5) -> List[List[Dict[str, Any]]]:
+    """
+    Find similar UI kit components for many Figma components at once.
+
+    Vectorized counterpart of find_similar_components: similarity is the
+    cosine of the names' trigram count vectors, computed as one matrix.
+
+    Args:
+        new_components: Components from Figma design
+        ui_kit_inventory: List of existing UI kit components
+        threshold: Minimum cosine similarity (0.0 to 1.0)
+        k: Similar components to keep per Figma component
+
+    Returns:
+        Similar components per Figma component (same order), best first
+    """
+    new_names = [component.get('name', '') for component in new_components]
+    existing_names = [existing.get('name', '') for existing in ui_kit_inventory]
+
+    results = []
+    for new_name, top in zip(new_names, batch_top_k(new_names, existing_names, k=k, threshold=threshold)):
+        results.append([{
+            'name': existing_names[position],
+            'path': ui_kit_inventory[position].get('path', ''),
+            'similarity': similarity,
+            'recommendation': generate_recommendation(similarity, new_name, existing_names[position])
+        } for position, similarity in top])
+
+    return results
+
+
 def generate_recommendation(similarity: float, new_name: str, existing_name: str) -> str:
     """
     Generate recommendation based on similarity score.
@@ -210,13 +272,27 @@ def generate_recommendation(similarity: float, new_name: str, existing_name: str
 
 
 def analyze_design(figma_data: Dict[str, Any],
-                  ui_kit_inventory: Dict[str, Any]) -> Dict[str, Any]:
+                  ui_kit_inventory: Dict[str, Any],
+                  batch: bool = False,
+                  page: Optional[str] = None,
+                  subtree: Optional[str] = None,
+                  figma_components: Optional[List[Dict[str, Any]]] = None,
+                  unchanged_nodes: Optional[Iterable[str]] = None) -> Dict[str, Any]:
     """
     Main analysis function: extract patterns from Figma and compare with UI kit.
 
     Args:
         figma_data: Combined Figma MCP data (metadata, variables, code_connect_map)
         ui_kit_inventory: Current UI kit inventory
+        batch: Score all similarities in one vectorized n-gram pass
+        page: Only analyze components on this page (CANVAS name or ID)
+        subtree: Only analyze components under this node ID
+        figma_components: Components already extracted (e.g. by stream_components);
+            figma_data['metadata'] is ignored when given
+        unchanged_nodes: Node IDs whose screenshots are unchanged since the last
+            review (see screenshot_store); components in or under them are skipped.
+            With figma_components from stream_components, pass the set that
+            stream_components(unchanged_nodes=...) expanded
 
     Returns:
         Analysis results with new tokens, components, similarities, breaking changes
@@ -230,22 +306,42 @@ def analyze_design(figma_data: Dict[str, Any],
     }
 
     # Extract components from Figma metadata
-    metadata = figma_data.get('metadata', {})
-    figma_components = extract_components_from_metadata(metadata)
+    if figma_components is None:
+        metadata = figma_data.get('metadata', {})
+        figma_components = extract_components_from_metadata(metadata, page, subtree)
 
     # Extract existing UI kit components
     existing_components = ui_kit_inventory.get('components', [])
 
+    # Skip system components (starting with _, . or #)
+    design_components = [comp for comp in figma_components
+                         if not comp.get('name', '').startswith(('_', '.', '#'))]
+
+    # Skip components that are visually unchanged since the last review
+    skipped = 0
+    if unchanged_nodes is not None:
+        unchanged = set(unchanged_nodes)
+        if unchanged and figma_data.get('metadata'):
+            # Unchanged frames cover the components drawn in them
+            unchanged = descendant_ids(figma_data['metadata'], unchanged)
+        analyzed = [comp for comp in design_components if comp.get('id') not in unchanged]
+        skipped = len(design_components) - len(analyzed)
+        design_components = analyzed
+
+    if batch:
+        batch_similar = iter(batch_similar_components(design_components, existing_components, threshold=0.7))
+    else:
+        index = SimilarityIndex([existing.get('name', '') for existing in existing_components])
+
     # Analyze each Figma component
-    for figma_comp in figma_components:
+    for figma_comp in design_components:
         comp_name = figma_comp.get('name', '')
 
-        # Skip system components (starting with _, . or #)
-        if comp_name.startswith(('_', '.', '#')):
-            continue
-
         # Find similar components
-        similar = find_similar_components(figma_comp, existing_components, threshold=0.7)
+        if batch:
+            similar = next(batch_similar)
+        else:
+            similar = find_similar_components(figma_comp, existing_components, threshold=0.7, index=index)
 
         if similar:
             # Component has similarities - potential reuse
@@ -287,8 +383,10 @@ def analyze_design(figma_data: Dict[str, Any],
         'similar_components_count': len(results['similar_components']),
         'new_tokens_count': len(results['new_tokens']),
         'breaking_changes_count': len(results['breaking_changes']),
-        'reuse_potential': f"{(len(results['similar_components']) / max(len(figma_components), 1)) * 100:.1f}%"
+        'reuse_potential': f"{(len(results['similar_components']) / max(len(figma_components) - skipped, 1)) * 100:.1f}%"
     }
+    if unchanged_nodes is not None:
+        results['summary']['unchanged_components_skipped'] = skipped
 
     return results
 
@@ -410,26 +508,67 @@ def main():
     )
     parser.add_argument(
         '--ui-kit-inventory',
-        required=True,
         help='Path to UI kit inventory JSON file'
     )
+    parser.add_argument(
+        '--project-root',
+        help='Build the UI kit inventory from this project (cached component inventory)'
+    )
     parser.add_argument(
         '--output',
         help='Output file path (default: stdout)'
     )
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Vectorized n-gram cosine similarity for whole design-system audits'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Stream Figma metadata instead of loading it (bounded memory with ijson installed)'
+    )
+    parser.add_argument(
+        '--page',
+        help='Only analyze components on this page (name or node ID)'
+    )
+    parser.add_argument(
+        '--subtree',
+        help='Only analyze components under this node ID'
+    )
+    parser.add_argument(
+        '--unchanged-nodes',
+        help='Screenshot diff JSON (screenshot_store.py output); skips visually unchanged frames/components'
+    )
 
     args = parser.parse_args()
 
+    unchanged_nodes = load_unchanged_nodes(args.unchanged_nodes) if args.unchanged_nodes else None
+
     # Load Figma data
-    with open(args.figma_data, 'r') as f:
-        figma_data = json.load(f)
+    figma_components = None
+    if args.stream:
+        figma_data = {'variables': None, 'code_connect_map': None}
+        # Unchanged frames are expanded to their descendants in the same pass
+        figma_components = stream_components(args.figma_data, args.page, args.subtree, sections=figma_data,
+                                             unchanged_nodes=unchanged_nodes)
+    else:
+        with open(args.figma_data, 'r') as f:
+            figma_data = json.load(f)
 
     # Load UI kit inventory
-    with open(args.ui_kit_inventory, 'r') as f:
-        ui_kit_inventory = json.load(f)
+    if args.ui_kit_inventory:
+        with open(args.ui_kit_inventory, 'r') as f:
+            ui_kit_inventory = json.load(f)
+    elif args.project_root:
+        ui_kit_inventory = project_ui_kit_inventory(args.project_root)
+    else:
+        parser.error('one of --ui-kit-inventory or --project-root is required')
 
     # Run analysis
-    results = analyze_design(figma_data, ui_kit_inventory)
+    results = analyze_design(figma_data, ui_kit_inventory, batch=args.batch, page=args.page,
+                             subtree=args.subtree, figma_components=figma_components,
+                             unchanged_nodes=unchanged_nodes)
 
     # Output results
     output_json = json.dumps(results, indent=2)
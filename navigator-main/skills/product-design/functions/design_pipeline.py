@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Run the product-design stages in one process with in-memory handoff.
+
+Replaces chaining design_analyzer -> token_extractor -> component_mapper ->
+design_system_auditor -> implementation_planner through JSON files. Figma
+data, the component inventory and the existing tokens are loaded once and
+shared as objects; design analysis, token extraction and component mapping
+don't depend on each other and run concurrently, then the audit and the
+task document run on their results. All artifacts are written at the end,
+with per-stage timings.
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from component_inventory import load_inventory, ui_kit_inventory as project_ui_kit_inventory
+from component_mapper import map_components
+from design_analyzer import analyze_design, extract_components_from_metadata, stream_components
+from design_system_auditor import audit_design_system
+from implementation_planner import generate_task_document
+from screenshot_store import load_unchanged_nodes
+from token_extractor import extract_tokens
+from token_set import TokenSet, as_token_set
+from token_snapshot import SNAPSHOT_DIR, snapshot_file
+
+DEFAULT_TOKENS_PATH = os.path.join('.agent', 'design-system', 'design-tokens.json')
+
+# Artifact name -> file written by write_artifacts()
+ARTIFACT_FILES = {
+    'analysis': 'analysis.json',
+    'tokens': 'tokens.json',
+    'mappings': 'mappings.json',
+    'audit': 'audit.json',
+    'task_document': 'task.md',
+}
+
+
+def _timed(timings: Dict[str, float], stage: str, func: Callable, *args, **kwargs) -> Any:
+    start = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        timings[stage] = round(time.perf_counter() - start, 4)
+
+
+def run_pipeline(figma_data: Dict[str, Any],
+                 project_root: str = '.',
+                 existing_tokens: Union[Dict[str, Any], TokenSet, None] = None,
+                 code_connect_map: Optional[Dict[str, Any]] = None,
+                 ui_kit_inventory: Optional[Dict[str, Any]] = None,
+                 figma_components: Optional[List[Dict[str, Any]]] = None,
+                 tailwind_config: Optional[str] = None,
+                 task: Optional[Dict[str, str]] = None,
+                 batch: bool = False,
+                 page: Optional[str] = None,
+                 subtree: Optional[str] = None,
+                 incremental: bool = False,
+                 existing_snapshot=None,
+                 unchanged_nodes: Optional[Iterable[str]] = None,
+                 max_workers: int = 3) -> Dict[str, Any]:
+    """
+    Run every product-design stage, passing results in memory.
+
+    Args:
+        figma_data: Combined Figma MCP data (metadata, variables, code_connect_map)
+        project_root: Project to inventory and map components against
+        existing_tokens: Current design-tokens.json (dict or TokenSet), flattened
+            once and shared by token extraction and the audit
+        code_connect_map: Code Connect mappings (default: figma_data['code_connect_map'])
+        ui_kit_inventory: UI kit inventory (default: built from project_root)
+        figma_components: Components already extracted (e.g. streamed);
+            otherwise extracted once from figma_data['metadata']
+        tailwind_config: Tailwind config/CSS file or app directory for the audit
+        task: {'task_id', 'feature_name', 'review_reference'} to also
+            generate the implementation task document
+        batch: Vectorized similarity scoring in analysis and mapping
+        page: Only analyze components on this page (name or node ID)
+        subtree: Only analyze components under this node ID
+        incremental: Report only changed tokens (see token_extractor)
+        existing_snapshot: Persisted snapshot of the existing tokens (implies incremental)
+        unchanged_nodes: Frames/components unchanged per screenshot diff;
+            skipped by analysis and therefore by the task document (with
+            figma_components, already expanded by stream_components)
+        max_workers: Threads for the concurrent stages
+
+    Returns:
+        Artifacts (analysis, tokens, mappings, audit, optional task_document)
+        plus per-stage 'timings' in seconds
+    """
+    timings: Dict[str, float] = {}
+    started = time.perf_counter()
+
+    def load():
+        components = figma_components
+        if components is None:
+            components = extract_components_from_metadata(figma_data.get('metadata', {}), page, subtree)
+        # Shared by analysis (UI kit) and mapping; refreshed once per process
+        load_inventory(project_root)
+        inventory = ui_kit_inventory if ui_kit_inventory is not None else project_ui_kit_inventory(project_root)
+        existing = as_token_set(existing_tokens) if existing_tokens else None
+        return components, inventory, existing
+
+    components, inventory, existing = _timed(timings, 'load', load)
+    connect_map = code_connect_map if code_connect_map is not None else figma_data.get('code_connect_map') or {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        analysis_future = pool.submit(
+            _timed, timings, 'analysis', analyze_design,
+            figma_data, inventory, batch=batch, figma_components=components,
+            unchanged_nodes=unchanged_nodes
+        )
+        tokens_future = pool.submit(
+            _timed, timings, 'tokens', extract_tokens,
+            figma_data.get('variables') or {}, existing, incremental, existing_snapshot
+        )
+        mapping_future = pool.submit(
+            _timed, timings, 'mapping', map_components,
+            components, connect_map, project_root, batch=batch
+        )
+        analysis = analysis_future.result()
+        tokens = tokens_future.result()
+        mappings = mapping_future.result()
+
+        audit_future = pool.submit(
+            _timed, timings, 'audit', audit_design_system,
+            {'tokens': tokens['dtcg_tokens'], 'components': components, 'component_mappings': mappings},
+            {'design_tokens': existing if existing is not None else {}, 'ui_kit_inventory': inventory},
+            project_root=project_root,
+            tailwind_config=tailwind_config
+        )
+        plan_future = None
+        if task:
+            plan_future = pool.submit(
+                _timed, timings, 'plan', generate_task_document,
+                task['task_id'],
+                task['feature_name'],
+                {**analysis, 'token_diff': tokens['diff']},
+                task.get('review_reference', '')
+            )
+        audit = audit_future.result()
+        task_document = plan_future.result() if plan_future else None
+
+    results = {
+        'analysis': analysis,
+        'tokens': tokens,
+        'mappings': mappings,
+        'audit': audit,
+    }
+    if task_document is not None:
+        results['task_document'] = task_document
+
+    timings['total'] = round(time.perf_counter() - started, 4)
+    results['timings'] = timings
+    return results
+
+
+def write_artifacts(results: Dict[str, Any], output_dir: str) -> Dict[str, str]:
+    """
+    Write pipeline artifacts and a pipeline.json with timings.
+
+    Args:
+        results: run_pipeline() output
+        output_dir: Directory to write into (created if missing)
+
+    Returns:
+        Artifact name -> written path
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    written = {}
+    for name, filename in ARTIFACT_FILES.items():
+        if name not in results:
+            continue
+        path = os.path.join(output_dir, filename)
+        with open(path, 'w') as f:
+            if filename.endswith('.json'):
+                f.write(json.dumps(results[name], indent=2))
+            else:
+                f.write(results[name])
+        written[name] = path
+
+    summary_path = os.path.join(output_dir, 'pipeline.json')
+    with open(summary_path, 'w') as f:
+        f.write(json.dumps({'artifacts': written, 'timings': results['timings']}, indent=2))
+    written['pipeline'] = summary_path
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Run design analysis, token extraction, component mapping, audit and planning in one process'
+    )
+    parser.add_argument(
+        '--figma-data',
+        required=True,
+        help='Path to JSON file with Figma MCP data (metadata, variables, code_connect_map)'
+    )
+    parser.add_argument(
+        '--project-root',
+        default='.',
+        help='Project root directory (default: current directory)'
+    )
+    parser.add_argument(
+        '--existing-tokens',
+        help=f'Path to existing design-tokens.json (default: {DEFAULT_TOKENS_PATH} if present)'
+    )
+    parser.add_argument(
+        '--code-connect-map',
+        help='Path to Code Connect map JSON (default: code_connect_map in --figma-data)'
+    )
+    parser.add_argument(
+        '--ui-kit-inventory',
+        help='Path to UI kit inventory JSON (default: built from --project-root)'
+    )
+    parser.add_argument(
+        '--tailwind-config',
+        help='Tailwind config, @theme CSS file or app directory (default: --project-root)'
+    )
+    parser.add_argument(
+        '--task-id',
+        help='Also generate the task document (e.g., TASK-16; requires --feature-name)'
+    )
+    parser.add_argument(
+        '--feature-name',
+        help='Feature name for the task document'
+    )
+    parser.add_argument(
+        '--review-reference',
+        default='',
+        help='Path to design review report, referenced by the task document'
+    )
+    parser.add_argument(
+        '--output-dir',
+        required=True,
+        help='Directory for all artifacts'
+    )
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Vectorized n-gram similarity in analysis and mapping'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Stream Figma metadata instead of loading it (bounded memory with ijson installed)'
+    )
+    parser.add_argument(
+        '--page',
+        help='Only analyze components on this page (name or node ID)'
+    )
+    parser.add_argument(
+        '--subtree',
+        help='Only analyze components under this node ID'
+    )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Report only changed tokens, reusing a persisted snapshot of the existing tokens'
+    )
+    parser.add_argument(
+        '--unchanged-nodes',
+        help='Screenshot diff JSON (screenshot_store.py output); skips visually unchanged frames/components'
+    )
+
+    args = parser.parse_args()
+
+    if args.task_id and not args.feature_name:
+        parser.error('--task-id requires --feature-name')
+
+    unchanged_nodes = load_unchanged_nodes(args.unchanged_nodes) if args.unchanged_nodes else None
+
+    # Load Figma data
+    figma_components = None
+    if args.stream:
+        figma_data = {'variables': None, 'code_connect_map': None}
+        # Unchanged frames are expanded to their descendants in the same pass
+        figma_components = stream_components(args.figma_data, args.page, args.subtree, sections=figma_data,
+                                             unchanged_nodes=unchanged_nodes)
+    else:
+        with open(args.figma_data, 'r') as f:
+            figma_data = json.load(f)
+
+    # Load existing tokens (or their snapshot)
+    tokens_path = args.existing_tokens
+    if tokens_path is None and os.path.isfile(os.path.join(args.project_root, DEFAULT_TOKENS_PATH)):
+        tokens_path = os.path.join(args.project_root, DEFAULT_TOKENS_PATH)
+    existing_tokens = None
+    existing_snapshot = None
+    if tokens_path and args.incremental:
+        # The persisted snapshot is already flattened; no need to reparse the file
+        existing_snapshot, _ = snapshot_file(tokens_path, SNAPSHOT_DIR)
+        existing_tokens = TokenSet({path: token for path, (_, token) in existing_snapshot.entries.items()})
+    elif tokens_path:
+        with open(tokens_path, 'r') as f:
+            existing_tokens = json.load(f)
+
+    code_connect_map = None
+    if args.code_connect_map:
+        with open(args.code_connect_map, 'r') as f:
+            code_connect_map = json.load(f)
+
+    ui_kit_inventory = None
+    if args.ui_kit_inventory:
+        with open(args.ui_kit_inventory, 'r') as f:
+            ui_kit_inventory = json.load(f)
+
+    task = None
+    if args.task_id:
+        task = {
+            'task_id': args.task_id,
+            'feature_name': args.feature_name,
+            'review_reference': args.review_reference
+        }
+
+    results = run_pipeline(
+        figma_data,
+        project_root=args.project_root,
+        existing_tokens=existing_tokens,
+        code_connect_map=code_connect_map,
+        ui_kit_inventory=ui_kit_inventory,
+        figma_components=figma_components,
+        tailwind_config=args.tailwind_config,
+        task=task,
+        batch=args.batch,
+        page=args.page,
+        subtree=args.subtree,
+        incremental=args.incremental,
+        existing_snapshot=existing_snapshot,
+        unchanged_nodes=unchanged_nodes
+    )
+
+    written = write_artifacts(results, args.output_dir)
+    print(json.dumps({'artifacts': written, 'timings': results['timings']}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
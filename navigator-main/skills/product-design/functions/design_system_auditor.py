@@ -6,34 +6,27 @@ Compares tokens, components, and generates recommendations.
 
 import json
 import argparse
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Union
 
+from component_mapper import map_components
+from tailwind_theme import CATEGORIES, join_theme, load_tailwind_theme, token_key
+from token_set import TokenSet, as_token_set
 
-def audit_token_alignment(figma_tokens: Dict[str, Any],
-                          code_tokens: Dict[str, Any]) -> Dict[str, Any]:
+
+def audit_token_alignment(figma_tokens: Union[Dict[str, Any], TokenSet],
+                          code_tokens: Union[Dict[str, Any], TokenSet]) -> Dict[str, Any]:
     """
     Audit token alignment between Figma and code.
 
     Args:
-        figma_tokens: Tokens from Figma (DTCG format)
-        code_tokens: Tokens from code (design-tokens.json)
+        figma_tokens: Tokens from Figma (DTCG format or TokenSet)
+        code_tokens: Tokens from code (design-tokens.json or TokenSet)
 
     Returns:
         Alignment report with drift analysis
     """
-    def flatten_tokens(tokens, prefix=''):
-        """Flatten nested tokens to dot notation."""
-        flat = {}
-        for key, value in tokens.items():
-            path = f"{prefix}.{key}" if prefix else key
-            if isinstance(value, dict) and '$value' in value:
-                flat[path] = value
-            elif isinstance(value, dict):
-                flat.update(flatten_tokens(value, path))
-        return flat
-
-    figma_flat = flatten_tokens(figma_tokens)
-    code_flat = flatten_tokens(code_tokens)
+    figma_flat = as_token_set(figma_tokens)
+    code_flat = as_token_set(code_tokens)
 
     alignment = {
         'in_sync': [],
@@ -126,61 +119,72 @@ def analyze_component_reuse(figma_components: List[Dict[str, Any]],
     return opportunities
 
 
-def audit_tailwind_config(tokens: Dict[str, Any], tailwind_config_path: str = None) -> Dict[str, Any]:
+def audit_tailwind_config(tokens: Union[Dict[str, Any], TokenSet], tailwind_config_path: str = None) -> Dict[str, Any]:
     """
     Audit Tailwind config alignment with design tokens.
 
+    The theme is extracted statically from tailwind.config.{js,ts,cjs,mjs}
+    and Tailwind v4 @theme CSS (see tailwind_theme.py), then joined with the
+    tokens on CSS variable key.
+
     Args:
-        tokens: Design tokens (DTCG format)
-        tailwind_config_path: Path to tailwind.config.js (optional)
+        tokens: Design tokens (DTCG format or TokenSet)
+        tailwind_config_path: Tailwind config/CSS file or app directory (optional)
 
     Returns:
         Tailwind alignment report
     """
-    # This is a simplified version - real implementation would parse tailwind.config.js
-    # For now, return structure for manual audit
-
-    alignment = {
-        'status': 'manual_audit_required',
-        'recommendations': []
-    }
-
-    def flatten_tokens(tokens, prefix=''):
-        flat = {}
-        for key, value in tokens.items():
-            path = f"{prefix}.{key}" if prefix else key
-            if isinstance(value, dict) and '$value' in value:
-                flat[path] = value
-            elif isinstance(value, dict):
-                flat.update(flatten_tokens(value, path))
-        return flat
-
-    flat_tokens = flatten_tokens(tokens)
-
-    # Generate recommendations based on token types
-    color_tokens = [t for t in flat_tokens.keys() if t.startswith('color.')]
-    spacing_tokens = [t for t in flat_tokens.keys() if t.startswith('spacing.')]
-    typography_tokens = [t for t in flat_tokens.keys() if t.startswith('typography.')]
-
-    if color_tokens:
-        alignment['recommendations'].append({
-            'category': 'colors',
-            'action': f'Add {len(color_tokens)} color tokens to Tailwind theme.extend.colors',
-            'example': f'"{color_tokens[0]}": "var(--{color_tokens[0].replace(".", "-")})"'
-        })
-
-    if spacing_tokens:
-        alignment['recommendations'].append({
-            'category': 'spacing',
-            'action': f'Add {len(spacing_tokens)} spacing tokens to Tailwind theme.extend.spacing',
-            'example': f'"{spacing_tokens[0].split(".")[-1]}": "var(--{spacing_tokens[0].replace(".", "-")})"'
-        })
+    flat_tokens = as_token_set(tokens)
+
+    theme = load_tailwind_theme(tailwind_config_path) if tailwind_config_path else None
+    if not theme or not theme['files']:
+        # No config to parse - return structure for manual audit
+        alignment = {
+            'status': 'manual_audit_required',
+            'recommendations': []
+        }
+        missing = {
+            namespace: [(path, f'--{path.replace(".", "-")}') for path in flat_tokens.group(group)]
+            for namespace, group in (('color', 'color'), ('spacing', 'spacing'), ('text', 'typography'))
+        }
+    else:
+        report = join_theme(theme, flat_tokens)
+        drifted = bool(report['drift_detected'] or report['missing_in_config'])
+        alignment = {
+            'status': 'drift_detected' if drifted else 'in_sync',
+            'config_files': theme['files'],
+            **report,
+            'recommendations': []
+        }
+        missing = {}
+        for token in report['missing_in_config']:
+            namespace = token['css_variable'][2:].split('-', 1)[0]
+            missing.setdefault(namespace, []).append((token['path'], token['css_variable']))
+
+        if report['drift_detected']:
+            first = report['drift_detected'][0]['path']
+            alignment['recommendations'].append({
+                'category': 'drift',
+                'action': f"Update {len(report['drift_detected'])} Tailwind theme values to match design tokens",
+                'example': f'"{first}": "var(--{token_key(first)})"'
+            })
 
-    if typography_tokens:
+    # Generate recommendations for tokens not yet in the Tailwind theme
+    for namespace, tokens_missing in missing.items():
+        if not tokens_missing:
+            continue
+        category, noun, target = CATEGORIES.get(namespace, (namespace, namespace, f'theme.extend.{namespace}'))
+        path, variable = tokens_missing[0]
+        if namespace == 'text':
+            example = 'Use Style Dictionary to generate Tailwind @theme directive'
+        elif namespace == 'color':
+            example = f'"{path}": "var({variable})"'
+        else:
+            example = f'"{path.split(".")[-1]}": "var({variable})"'
         alignment['recommendations'].append({
-            'category': 'typography',
-            'action': f'Add {len(typography_tokens)} typography tokens to Tailwind theme.extend.fontSize',
-            'example': 'Use Style Dictionary to generate Tailwind @theme directive'
+            'category': category,
+            'action': f'Add {len(tokens_missing)} {noun} tokens to Tailwind {target}',
+            'example': example
         })
 
     return alignment
@@ -279,13 +283,20 @@ def generate_top_recommendations(token_alignment: Dict[str, Any],
 
 
 def audit_design_system(figma_data: Dict[str, Any],
-                       code_data: Dict[str, Any]) -> Dict[str, Any]:
+                       code_data: Dict[str, Any],
+                       project_root: Optional[str] = None,
+                       tailwind_config: Optional[str] = None) -> Dict[str, Any]:
     """
     Main audit function: comprehensive design system health check.
 
     Args:
         figma_data: Combined Figma data (tokens, components, mappings)
         code_data: Combined code data (design-tokens.json, ui-kit-inventory, etc.)
+        project_root: Project to map Figma components against when
+            figma_data has no component_mappings (also searched for a
+            Tailwind config when none is given)
+        tailwind_config: Tailwind config/CSS file or app directory (defaults
+            to code_data['tailwind_config'], then project_root)
 
     Returns:
         Complete audit report with recommendations
@@ -295,13 +306,21 @@ def audit_design_system(figma_data: Dict[str, Any],
     figma_components = figma_data.get('components', [])
     component_mappings = figma_data.get('component_mappings', {})
 
-    code_tokens = code_data.get('design_tokens', {})
+    # Flattened once and shared by the token and Tailwind audits
+    code_tokens = as_token_set(code_data.get('design_tokens', {}))
     ui_kit_inventory = code_data.get('ui_kit_inventory', {})
 
+    if project_root and not component_mappings and figma_components:
+        # Map against the cached component inventory instead of requiring a mapper run
+        component_mappings = map_components(figma_components, {}, project_root)
+
     # Run audits
     token_alignment = audit_token_alignment(figma_tokens, code_tokens)
     component_reuse = analyze_component_reuse(figma_components, component_mappings)
-    tailwind_alignment = audit_tailwind_config(code_tokens)
+    tailwind_alignment = audit_tailwind_config(
+        code_tokens,
+        tailwind_config or code_data.get('tailwind_config') or project_root
+    )
 
     # Generate summary
     summary = generate_audit_summary(token_alignment, component_reuse)
@@ -328,6 +347,14 @@ def main():
         required=True,
         help='Path to JSON file with code data (design-tokens.json, ui-kit-inventory)'
     )
+    parser.add_argument(
+        '--project-root',
+        help='Project root to map components against when figma data has no mappings'
+    )
+    parser.add_argument(
+        '--tailwind-config',
+        help='Tailwind config, @theme CSS file or app directory to audit against the tokens'
+    )
     parser.add_argument(
         '--output',
         help='Output file path (default: stdout)'
@@ -343,7 +370,12 @@ def main():
         code_data = json.load(f)
 
     # Run audit
-    audit_results = audit_design_system(figma_data, code_data)
+    audit_results = audit_design_system(
+        figma_data,
+        code_data,
+        project_root=args.project_root,
+        tailwind_config=args.tailwind_config
+    )
 
     # Output results
     output_json = json.dumps(audit_results, indent=2)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Fake Figma Desktop MCP server for exercising FigmaMCPClient locally.
+
+Serves get_metadata and get_screenshot over streamable HTTP like Figma
+Desktop does, answering for whichever file is "open" (switch with the
+open_file tool). Each call sleeps briefly so concurrency is observable;
+stats reports call counts and the peak number of concurrent calls.
+
+Usage:
+    python fake_figma_mcp.py --port 3999
+"""
+
+import argparse
+import asyncio
+import json
+
+from mcp.server.fastmcp import FastMCP
+
+CALL_DELAY = 0.05
+
+
+def build_server(port: int) -> FastMCP:
+    server = FastMCP("fake-figma", port=port, log_level="WARNING")
+    state = {"file": "file-a", "calls": 0, "active": 0, "peak": 0}
+
+    async def call() -> None:
+        state["calls"] += 1
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        try:
+            await asyncio.sleep(CALL_DELAY)
+        finally:
+            state["active"] -= 1
+
+    @server.tool()
+    async def get_metadata(nodeId: str = "") -> str:
+        await call()
+        return json.dumps({"file": state["file"], "id": nodeId, "type": "FRAME"})
+
+    @server.tool()
+    async def get_screenshot(nodeId: str = "") -> str:
+        await call()
+        return f"{state['file']}:{nodeId}"
+
+    @server.tool()
+    async def open_file(key: str) -> str:
+        state["file"] = key
+        return key
+
+    @server.tool()
+    async def stats() -> str:
+        return json.dumps({"calls": state["calls"], "peak": state["peak"]})
+
+    @server.tool()
+    async def reset() -> str:
+        state.update(calls=0, peak=0)
+        return "ok"
+
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Fake Figma Desktop MCP server for local client tests'
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=3999,
+        help='Port to serve /mcp on (default: 3999)'
+    )
+
+    args = parser.parse_args()
+    build_server(args.port).run(transport="streamable-http")
+
+
+if __name__ == '__main__':
+    main()
@@ -16,6 +16,13 @@ Usage:
         # Get code mappings
         mappings = await client.get_code_connect_map()
 
+        # Fetch many nodes concurrently (cached on disk between runs when
+        # FigmaMCPClient(file_key=..., file_version=...) identifies the file)
+        screenshots = await client.fetch_many("get_screenshot", ["1:23", "1:24"])
+
+        # Which frames changed visually since the last review
+        changes = await client.screenshot_changes(["1:23", "1:24"])
+
 Requirements:
     - Figma Desktop app must be running
     - MCP server enabled in Figma Preferences
@@ -23,9 +30,11 @@ Requirements:
     - pip install mcp
 """
 
+import asyncio
 import json
 import logging
-from typing import Optional, Dict, Any, List
+import re
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 
 try:
     from mcp import ClientSession
@@ -35,9 +44,33 @@ except ImportError as e:
         "MCP SDK not installed. Install with: pip install mcp"
     ) from e
 
+from response_cache import MISS, ResponseCache
+from screenshot_store import ScreenshotStore
+
 
 logger = logging.getLogger(__name__)
 
+# Read-only, node-scoped tools whose responses can be cached
+CACHEABLE_TOOLS = {
+    "get_metadata",
+    "get_variable_defs",
+    "get_code_connect_map",
+    "get_design_context",
+    "get_screenshot",
+}
+
+# Without a file version, cached responses may lag edits; when the caller
+# opts in (cache_unversioned=True) they are only reused this long
+UNVERSIONED_MAX_AGE = 600
+
+FILE_KEY_PATTERN = re.compile(r"figma\.com/(?:design|file|proto|board)/([A-Za-z0-9]+)")
+
+
+def file_key_from_url(url: str) -> Optional[str]:
+    """Figma file key from a file URL (figma.com/design/<key>/...), or None."""
+    match = FILE_KEY_PATTERN.search(url)
+    return match.group(1) if match else None
+
 
 class FigmaMCPError(Exception):
     """Base exception for Figma MCP client errors."""
@@ -62,18 +95,44 @@ class FigmaMCPClient:
             print(f"Found {len(variables)} design tokens")
     """
 
-    def __init__(self, mcp_url: str = "http://127.0.0.1:3845/mcp"):
+    def __init__(self, mcp_url: str = "http://127.0.0.1:3845/mcp",
+                 max_concurrency: int = 8,
+                 cache: Optional[ResponseCache] = None,
+                 use_cache: bool = True,
+                 file_key: Optional[str] = None,
+                 file_version: Optional[str] = None,
+                 cache_unversioned: bool = False):
         """
         Initialize Figma MCP client.
 
+        Responses are only cached for a known file (file_key) at a known
+        version; otherwise every call goes to the server.
+
         Args:
             mcp_url: URL of Figma Desktop MCP server (default: http://127.0.0.1:3845/mcp)
+            max_concurrency: Maximum in-flight tool calls on the session
+            cache: Response cache (default: ResponseCache() in ~/.cache/navigator/figma)
+            use_cache: Set False to always call the server
+            file_key: Figma file key (see file_key_from_url); node IDs repeat
+                across files, so nothing is cached without it
+            file_version: Figma file version; cached responses are keyed by it
+            cache_unversioned: Also cache calls without file_version, reused for
+                UNVERSIONED_MAX_AGE seconds (edits may show up that late)
         """
         self.mcp_url = mcp_url
         self.session = None
         self.transport = None
         self.session_context = None
 
+        self.max_concurrency = max_concurrency
+        self.cache = (cache or ResponseCache()) if use_cache else None
+        self.file_key = file_key
+        self.file_version = file_version
+        self.cache_unversioned = cache_unversioned
+        self.cache_stats = {"hits": 0, "misses": 0}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+
     async def __aenter__(self):
         """Async context manager entry - establishes MCP connection."""
         try:
@@ -85,6 +144,8 @@ class FigmaMCPClient:
             self.session_context = ClientSession(self.read_stream, self.write_stream)
             self.session = await self.session_context.__aenter__()
 
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
             # Initialize MCP protocol
             init_result = await self.session.initialize()
             logger.info(
@@ -107,6 +168,8 @@ class FigmaMCPClient:
 
     async def __aexit__(self, *args):
         """Async context manager exit - closes MCP connection."""
+        if self.cache:
+            self.cache.evict()
         try:
             if self.session_context:
                 await self.session_context.__aexit__(*args)
@@ -163,6 +226,99 @@ class FigmaMCPClient:
             logger.error(f"Error calling {tool_name}: {e}")
             raise FigmaMCPError(f"Failed to call {tool_name}: {e}") from e
 
+    async def _fetch(self, tool_name: str, node_id: Optional[str], fresh: bool = False) -> Any:
+        """
+        Call a node-scoped tool through the concurrency limit and response cache.
+
+        Selection-based calls (node_id None) are never cached, nor are calls
+        without a file key, or without a file version unless the client opted
+        in. Concurrent requests for the same (tool, node) share one server
+        call. With fresh=True the cache is bypassed on read but still refreshed.
+        """
+        params = {"nodeId": node_id} if node_id else {}
+        if not self.session:
+            raise FigmaMCPError("Client not connected. Use 'async with FigmaMCPClient()'")
+
+        if (node_id is None or self.cache is None or tool_name not in CACHEABLE_TOOLS
+                or not self.file_key or not (self.file_version or self.cache_unversioned)):
+            async with self._semaphore:
+                return await self._call_tool(tool_name, params)
+
+        version = self.file_version or ""
+        max_age = None if self.file_version else UNVERSIONED_MAX_AGE
+        cached = MISS if fresh else self.cache.get(tool_name, node_id, version, max_age=max_age,
+                                                   file_key=self.file_key)
+        if cached is not MISS:
+            self.cache_stats["hits"] += 1
+            return cached
+
+        key = (tool_name, node_id)
+        pending = self._inflight.get(key)
+        if pending is None:
+            self.cache_stats["misses"] += 1
+
+            async def call():
+                try:
+                    async with self._semaphore:
+                        result = await self._call_tool(tool_name, params)
+                    if result is not None:
+                        self.cache.put(tool_name, node_id, version, result, file_key=self.file_key)
+                    return result
+                finally:
+                    self._inflight.pop(key, None)
+
+            pending = self._inflight[key] = asyncio.ensure_future(call())
+        return await pending
+
+    async def fetch_many(self, tool_name: str, node_ids: Iterable[str],
+                         return_exceptions: bool = False, fresh: bool = False) -> Dict[str, Any]:
+        """
+        Call one tool for many nodes concurrently.
+
+        Requests fan out over the single session, at most max_concurrency at
+        a time; cached responses are returned without a server call.
+
+        Args:
+            tool_name: Node-scoped tool, e.g. "get_metadata" or "get_screenshot"
+            node_ids: Figma node IDs (duplicates are fetched once)
+            return_exceptions: Return per-node exceptions instead of raising the first
+            fresh: Skip cached responses (results still refresh the cache)
+
+        Returns:
+            Dictionary mapping node ID to response
+
+        Example:
+            shots = await client.fetch_many("get_screenshot", component_ids)
+        """
+        unique = list(dict.fromkeys(node_ids))
+        results = await asyncio.gather(
+            *(self._fetch(tool_name, node_id, fresh) for node_id in unique),
+            return_exceptions=return_exceptions
+        )
+        return dict(zip(unique, results))
+
+    async def batch(self, requests: Iterable[Tuple[str, str]],
+                    return_exceptions: bool = False) -> Dict[Tuple[str, str], Any]:
+        """
+        Call several tools for several nodes concurrently.
+
+        Args:
+            requests: (tool_name, node_id) pairs
+            return_exceptions: Return per-request exceptions instead of raising the first
+
+        Returns:
+            Dictionary mapping (tool_name, node_id) to response
+
+        Example:
+            results = await client.batch([("get_metadata", "1:2"), ("get_screenshot", "1:2")])
+        """
+        unique = list(dict.fromkeys(requests))
+        results = await asyncio.gather(
+            *(self._fetch(tool_name, node_id) for tool_name, node_id in unique),
+            return_exceptions=return_exceptions
+        )
+        return dict(zip(unique, results))
+
     async def get_metadata(self, node_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Get metadata for a node or page in XML format.
@@ -181,8 +337,7 @@ class FigmaMCPClient:
             metadata = await client.get_metadata(node_id="0:1")
             # Parse to find component node IDs
         """
-        params = {"nodeId": node_id} if node_id else {}
-        return await self._call_tool("get_metadata", params)
+        return await self._fetch("get_metadata", node_id)
 
     async def get_variable_defs(self, node_id: Optional[str] = None) -> Dict[str, str]:
         """
@@ -202,8 +357,7 @@ class FigmaMCPClient:
             for name, value in tokens.items():
                 print(f"{name}: {value}")
         """
-        params = {"nodeId": node_id} if node_id else {}
-        return await self._call_tool("get_variable_defs", params)
+        return await self._fetch("get_variable_defs", node_id)
 
     async def get_code_connect_map(self, node_id: Optional[str] = None) -> Dict[str, Dict[str, str]]:
         """
@@ -228,8 +382,7 @@ class FigmaMCPClient:
             for node_id, mapping in mappings.items():
                 print(f"{node_id} → {mapping['codeConnectName']}")
         """
-        params = {"nodeId": node_id} if node_id else {}
-        return await self._call_tool("get_code_connect_map", params)
+        return await self._fetch("get_code_connect_map", node_id)
 
     async def get_design_context(self, node_id: Optional[str] = None) -> str:
         """
@@ -248,8 +401,7 @@ class FigmaMCPClient:
             code = await client.get_design_context(node_id="1:23")
             # Returns React component code
         """
-        params = {"nodeId": node_id} if node_id else {}
-        return await self._call_tool("get_design_context", params)
+        return await self._fetch("get_design_context", node_id)
 
     async def get_screenshot(self, node_id: Optional[str] = None) -> str:
         """
@@ -265,8 +417,36 @@ class FigmaMCPClient:
             screenshot = await client.get_screenshot(node_id="1:23")
             # Save or process screenshot data
         """
-        params = {"nodeId": node_id} if node_id else {}
-        return await self._call_tool("get_screenshot", params)
+        return await self._fetch("get_screenshot", node_id)
+
+    async def screenshot_changes(self, node_ids: Iterable[str],
+                                 store: Optional[ScreenshotStore] = None,
+                                 update: bool = True) -> Dict[str, Any]:
+        """
+        Detect which nodes changed visually since the last review.
+
+        Fetches current screenshots (bypassing the response cache, which
+        may predate the edit) and compares them with the screenshot store:
+        byte-identical unless the store was created with perceptual=True.
+
+        Args:
+            node_ids: Frame or component node IDs
+            store: Screenshot store (default: ScreenshotStore() in .agent/cache/screenshots)
+            update: Record new and changed screenshots as the next baseline
+
+        Returns:
+            {'new', 'changed', 'unchanged', 'distances'} from ScreenshotStore.diff
+
+        Example:
+            changes = await client.screenshot_changes(frame_ids)
+            analysis = analyze_design(figma_data, inventory, unchanged_nodes=changes['unchanged'])
+        """
+        screenshots = await self.fetch_many("get_screenshot", node_ids, return_exceptions=True, fresh=True)
+        for node_id, result in screenshots.items():
+            if isinstance(result, BaseException):
+                logger.warning(f"Screenshot of {node_id} failed: {result}")
+        store = store if store is not None else ScreenshotStore()
+        return store.diff(screenshots, update=update)
 
     async def create_design_system_rules(self) -> str:
         """
@@ -7,7 +7,9 @@ Creates phased breakdown with acceptance criteria and complexity estimates.
 import json
 import argparse
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable, Optional
+
+from screenshot_store import load_unchanged_nodes
 
 
 def estimate_complexity(component_category: str, has_variants: bool, breaking_change: bool) -> tuple:
@@ -163,7 +165,8 @@ def generate_component_phase(component: Dict[str, Any], phase_number: int) -> Di
 def generate_task_document(task_id: str,
                           feature_name: str,
                           analysis_results: Dict[str, Any],
-                          review_reference: str) -> str:
+                          review_reference: str,
+                          unchanged_nodes: Optional[Iterable[str]] = None) -> str:
     """
     Generate complete Navigator task document.
 
@@ -172,6 +175,8 @@ def generate_task_document(task_id: str,
         feature_name: Feature name (e.g., "Dashboard Redesign")
         analysis_results: Combined analysis from all functions
         review_reference: Path to design review report
+        unchanged_nodes: Component node IDs visually unchanged since the last
+            review (see screenshot_store); they get no implementation phase
 
     Returns:
         Markdown task document
@@ -185,6 +190,16 @@ def generate_task_document(task_id: str,
     similar_components = analysis_results.get('similar_components', [])
     breaking_changes = analysis_results.get('breaking_changes', [])
 
+    # Components skipped by design_analyzer or unchanged per screenshot diff
+    skipped = analysis_results.get('summary', {}).get('unchanged_components_skipped')
+    if unchanged_nodes is not None:
+        unchanged = set(unchanged_nodes)
+        count = len(new_components) + len(similar_components)
+        new_components = [comp for comp in new_components if comp.get('id') not in unchanged]
+        similar_components = [comp for comp in similar_components if comp.get('figma_id') not in unchanged]
+        skipped = (skipped or 0) + count - len(new_components) - len(similar_components)
+    unchanged_line = f"\n- Unchanged Since Last Review: {skipped} components skipped" if skipped is not None else ''
+
     # Generate phases
     phases = []
 
@@ -224,7 +239,7 @@ Implement {feature_name} from Figma mockup with design system integration.
 **Changes Required**:
 - Design Tokens: {len(new_tokens)} new, {len(modified_tokens)} modified
 - Components: {len(new_components)} new, {len(similar_components)} to extend
-- Breaking Changes: {len(breaking_changes)}
+- Breaking Changes: {len(breaking_changes)}{unchanged_line}
 
 **Implementation Strategy**: Phased approach following atomic design hierarchy
 
@@ -360,6 +375,10 @@ def main():
         required=True,
         help='Path to design review report'
     )
+    parser.add_argument(
+        '--unchanged-nodes',
+        help='Screenshot diff JSON (screenshot_store.py output); unchanged components get no phase'
+    )
     parser.add_argument(
         '--output',
         help='Output file path (default: stdout)'
@@ -376,7 +395,8 @@ def main():
         args.task_id,
         args.feature_name,
         analysis_results,
-        args.review_reference
+        args.review_reference,
+        load_unchanged_nodes(args.unchanged_nodes) if args.unchanged_nodes else None
     )
 
     # Output
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Iterative and streaming traversal of Figma node trees.
+
+walk_nodes() replaces recursive traversal of loaded metadata with an
+explicit stack, so deep trees can't hit the recursion limit. iter_nodes()
+reads a JSON file with ijson's event parser when it is installed: only the
+wanted fields of matching nodes are kept, so memory is bounded by the
+matches rather than the document. Without ijson it falls back to json.load
+plus walk_nodes, with the same results.
+
+Both yield (node, depth) in document pre-order and can be restricted to a
+page (CANVAS node name or ID) or to the subtree under a node ID.
+"""
+
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    import ijson
+except ImportError:  # Optional; iter_nodes falls back to json.load
+    ijson = None
+
+
+def _roots(metadata: Any) -> List[Any]:
+    """Top-level nodes of an MCP get_metadata response or manual structure."""
+    if not isinstance(metadata, dict):
+        return []
+    if 'document' in metadata:
+        return [metadata['document']]
+    if 'nodes' in metadata:
+        return list(metadata['nodes'])
+    return [metadata]
+
+
+def walk_nodes(metadata: Any, types: Iterable[str], page: Optional[str] = None,
+               subtree: Optional[str] = None) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """
+    Nodes of the given types in loaded metadata, without recursion.
+
+    Args:
+        metadata: Figma metadata ({'document': ...}, {'nodes': [...]} or a node)
+        types: Node types to yield (e.g. COMPONENT, INSTANCE)
+        page: Only descend into the CANVAS node with this name or ID
+        subtree: Only yield nodes inside the node with this ID (inclusive)
+
+    Returns:
+        Iterator of (node, depth)
+    """
+    types = set(types)
+    stack = [(node, 0, subtree is None) for node in reversed(_roots(metadata))]
+
+    while stack:
+        node, depth, inside = stack.pop()
+        if not isinstance(node, dict):
+            continue
+
+        node_type = node.get('type')
+        if page is not None and node_type == 'CANVAS' and page not in (node.get('id'), node.get('name')):
+            continue
+
+        inside = inside or node.get('id') == subtree
+        if inside and node_type in types:
+            yield node, depth
+
+        children = node.get('children', [])
+        if isinstance(children, list):
+            stack.extend((child, depth + 1, inside) for child in reversed(children))
+
+
+def descendant_ids(metadata: Any, node_ids: Iterable[str]) -> Set[str]:
+    """
+    IDs of the given nodes and everything under them, without recursion.
+
+    Args:
+        metadata: Figma metadata ({'document': ...}, {'nodes': [...]} or a node)
+        node_ids: Subtree root IDs (e.g. frames)
+
+    Returns:
+        Set of node IDs, including node_ids themselves
+    """
+    roots = set(node_ids)
+    found = set(roots)
+    stack = [(node, False) for node in _roots(metadata)]
+
+    while stack:
+        node, inside = stack.pop()
+        if not isinstance(node, dict):
+            continue
+
+        node_id = node.get('id')
+        inside = inside or node_id in roots
+        if inside and node_id is not None:
+            found.add(node_id)
+
+        children = node.get('children', [])
+        if isinstance(children, list):
+            stack.extend((child, inside) for child in children)
+    return found
+
+
+class _Frame:
+    """An open JSON object while streaming: a node, the metadata root or the file root."""
+
+    __slots__ = ('node', 'depth', 'parent', 'key', 'buffer', 'ids', 'is_node', 'is_meta', 'is_outer')
+
+    def __init__(self, depth: int, parent: Optional['_Frame'], is_node: bool = True,
+                 is_meta: bool = False, is_outer: bool = False):
+        self.node: Dict[str, Any] = {}
+        self.depth = depth
+        self.parent = parent
+        self.key: Optional[str] = None
+        # Matches from the subtree, held until this node's own fields are known
+        self.buffer: List[Tuple[Dict[str, Any], int]] = []
+        # Descendant IDs for expand, held while an ancestor's ID is still unknown
+        self.ids: List[str] = []
+        self.is_node = is_node
+        self.is_meta = is_meta
+        self.is_outer = is_outer
+
+
+def _stream(fp, types: set, fields: Optional[set], page: Optional[str], subtree: Optional[str],
+            root_key: Optional[str], sections: Optional[Dict[str, Any]],
+            expand: Optional[Set[str]] = None) -> Iterator[Tuple[Dict[str, Any], int]]:
+    wanted_sections = set(sections.keys()) if sections is not None else set()
+    if sections is not None:
+        sections.clear()
+
+    def cover(frame: _Frame) -> None:
+        # Add this node and its held descendants to expand if it lies under one of its IDs
+        ids = frame.ids
+        frame.ids = []
+        if 'id' in frame.node:
+            ids.append(frame.node['id'])
+        if not ids:
+            return
+        holder = None
+        ancestor = frame
+        while ancestor is not None:
+            if ancestor.is_node:
+                node_id = ancestor.node.get('id')
+                if node_id in expand:
+                    expand.update(ids)
+                    return
+                if node_id is None and ancestor is not frame and holder is None:
+                    holder = ancestor
+            ancestor = ancestor.parent
+        if holder is not None:
+            # Decided once an ancestor's ID arrives (i.e. when it closes)
+            holder.ids.extend(ids)
+
+    def holds_matches(frame: _Frame) -> bool:
+        # Descendants must wait while this node may still be yielded (or dropped) before them
+        if subtree is not None:
+            return True
+        node_type = frame.node.get('type')
+        return node_type is None or node_type in types or (page is not None and node_type == 'CANVAS')
+
+    def off_page(frame: _Frame) -> bool:
+        node = frame.node
+        return page is not None and node.get('type') == 'CANVAS' and page not in (node.get('id'), node.get('name'))
+
+    def on_page(frame: Optional[_Frame]) -> Optional[bool]:
+        # Whether a node lies on the wanted page; None while an ancestor's fields are incomplete
+        if page is None:
+            return True
+        while frame is not None:
+            if frame.is_node:
+                node = frame.node
+                if 'type' not in node:
+                    return None
+                if node['type'] == 'CANVAS' and page not in (node.get('id'), node.get('name')):
+                    return False if 'id' in node and 'name' in node else None
+            frame = frame.parent
+        return True
+
+    def close(frame: _Frame) -> List[Tuple[Dict[str, Any], int]]:
+        node = frame.node
+        node_type = node.get('type')
+        if off_page(frame):
+            return []
+        matches = [(node, frame.depth)] if node_type in types else []
+        matches.extend(frame.buffer)
+        frame.buffer = []
+        return matches
+
+    # Contexts: ('frame', frame), ('array', parent, depth), ('build', builder, target, key, level), ('skip', level)
+    stack: List[tuple] = []
+    finished = False
+    # Subtree matches waiting for an enclosing page's name/ID to arrive
+    pending: List[Tuple[Dict[str, Any], int]] = []
+    pending_ancestors: List[_Frame] = []
+
+    for event, value in ijson.basic_parse(fp, use_float=True):
+        context = stack[-1] if stack else None
+        kind = context[0] if context else None
+
+        if kind == 'build':
+            _, builder, target, key, level = context
+            builder.event(event, value)
+            level += 1 if event in ('start_map', 'start_array') else -1 if event in ('end_map', 'end_array') else 0
+            if level == 0:
+                target[key] = builder.value
+                stack.pop()
+            else:
+                stack[-1] = ('build', builder, target, key, level)
+            continue
+
+        if kind == 'skip':
+            level = context[1] + (1 if event in ('start_map', 'start_array') else
+                                  -1 if event in ('end_map', 'end_array') else 0)
+            if level == 0:
+                stack.pop()
+            else:
+                stack[-1] = ('skip', level)
+            continue
+
+        if kind is None:
+            if event == 'start_map':
+                outer = root_key is not None
+                stack.append(('frame', _Frame(0, None, is_node=not outer, is_meta=not outer, is_outer=outer)))
+            continue
+
+        if kind == 'array':
+            _, parent, depth = context
+            if event == 'start_map':
+                stack.append(('frame', _Frame(depth, parent)))
+            elif event == 'start_array':
+                stack.append(('skip', 1))
+            elif event == 'end_array':
+                stack.pop()
+            continue
+
+        frame = context[1]
+        if event == 'map_key':
+            frame.key = value
+            continue
+
+        if event == 'end_map':
+            stack.pop()
+            if not frame.is_node:
+                continue
+            if expand is not None:
+                cover(frame)
+            if finished:
+                if pending and any(frame is a for a in pending_ancestors) and off_page(frame):
+                    pending = []
+                continue
+            matches = close(frame)
+            if subtree is not None and frame.node.get('id') == subtree:
+                verdict = on_page(frame.parent)
+                if verdict is None:
+                    pending = matches
+                    ancestor = frame.parent
+                    while ancestor is not None:
+                        pending_ancestors.append(ancestor)
+                        ancestor = ancestor.parent
+                elif verdict:
+                    yield from matches
+                    if not wanted_sections and expand is None:
+                        return
+                finished = True
+                continue
+            target = frame.parent
+            while target is not None and not (target.is_node and holds_matches(target)):
+                target = target.parent
+            if target is not None:
+                target.buffer.extend(matches)
+            elif subtree is None:
+                yield from matches
+            continue
+
+        # A value for frame.key
+        key = frame.key
+        starts = event in ('start_map', 'start_array')
+        if frame.is_outer:
+            if key == root_key and event == 'start_map':
+                stack.append(('frame', _Frame(0, frame, is_meta=True)))
+            elif key in wanted_sections:
+                if starts:
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    stack.append(('build', builder, sections, key, 1))
+                else:
+                    sections[key] = value
+            elif starts:
+                stack.append(('skip', 1))
+        elif frame.is_meta and key == 'document' and event == 'start_map':
+            frame.is_node = False
+            stack.append(('frame', _Frame(0, frame)))
+        elif frame.is_meta and key == 'nodes' and event == 'start_array':
+            frame.is_node = False
+            stack.append(('array', frame, 0))
+        elif frame.is_node and key == 'children' and event == 'start_array':
+            stack.append(('array', frame, frame.depth + 1))
+        elif frame.is_node and (fields is None or key in fields):
+            if starts:
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                stack.append(('build', builder, frame.node, key, 1))
+            else:
+                frame.node[key] = value
+        elif starts:
+            stack.append(('skip', 1))
+
+    yield from pending
+
+
+def iter_nodes(path: str, types: Iterable[str], fields: Optional[Iterable[str]] = None,
+               page: Optional[str] = None, subtree: Optional[str] = None,
+               root_key: Optional[str] = None,
+               sections: Optional[Dict[str, Any]] = None,
+               expand: Optional[Set[str]] = None) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """
+    Stream nodes of the given types from a Figma metadata JSON file.
+
+    Args:
+        path: JSON file path
+        types: Node types to yield
+        fields: Node fields to keep (default: all but 'children'); only applies
+            when streaming, the json.load fallback yields full nodes
+        page: Only descend into the CANVAS node with this name or ID
+        subtree: Only yield nodes inside the node with this ID (inclusive);
+            streaming stops once that node is closed
+        root_key: Metadata lives under this top-level key (e.g. 'metadata' in
+            combined design_analyzer input) instead of at the root
+        sections: Dict whose keys name other top-level values to collect in the
+            same pass (e.g. 'variables'); filled in once iteration completes
+        expand: Node IDs (e.g. unchanged frames) to extend in place with the
+            IDs of every node under them; complete once iteration completes
+
+    Returns:
+        Iterator of (node, depth) in document pre-order
+    """
+    types = set(types)
+
+    if ijson is None:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        metadata = data.get(root_key, {}) if root_key is not None and isinstance(data, dict) else data
+        if sections is not None:
+            for key in list(sections):
+                if isinstance(data, dict) and key in data:
+                    sections[key] = data[key]
+                else:
+                    del sections[key]
+        if expand is not None:
+            expand.update(descendant_ids(metadata, expand))
+        yield from walk_nodes(metadata, types, page, subtree)
+        return
+
+    if expand is not None and fields is not None:
+        fields = set(fields) | {'id'}
+    with open(path, 'rb') as f:
+        yield from _stream(f, types, set(fields) if fields is not None else None,
+                           page, subtree, root_key, sections, expand)
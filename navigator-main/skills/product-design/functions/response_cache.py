@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+On-disk cache for Figma MCP tool responses.
+
+Entries are keyed by (Figma file key, tool, node_id, file version) and
+stored one JSON file per key; node IDs like "1:23" repeat across files, so
+the file key is part of every key. A file's mtime is when it was stored and
+its atime when it was last used (set on every hit), so reads and eviction
+expire entries by the same clock, and eviction can drop the least recently
+used entries beyond a size cap without opening them. Standard library only,
+so it works without the MCP SDK.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+DEFAULT_TTL = 24 * 3600
+DEFAULT_MAX_ENTRIES = 2000
+CACHE_VERSION = 2
+
+# Returned by get() on a miss (None is a valid cached value)
+MISS = object()
+
+
+def default_cache_dir() -> Path:
+    """Where responses are stored (NAVIGATOR_FIGMA_CACHE overrides)."""
+    override = os.environ.get("NAVIGATOR_FIGMA_CACHE")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "navigator" / "figma"
+
+
+class ResponseCache:
+    """TTL + LRU response cache, one file per (file_key, tool, node_id, version)."""
+
+    def __init__(self, directory: Optional[str] = None, ttl: float = DEFAULT_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            directory: Cache directory (default: default_cache_dir())
+            ttl: Seconds an entry stays valid after it was stored
+            max_entries: Entries kept by evict(), most recently used first
+        """
+        self.directory = Path(directory) if directory else default_cache_dir()
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    def _path(self, file_key: str, tool: str, node_id: str, version: str) -> Path:
+        digest = hashlib.sha256(f"{file_key}\0{tool}\0{node_id}\0{version}".encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, tool: str, node_id: str, version: str = "", max_age: Optional[float] = None,
+            file_key: str = "") -> Any:
+        """
+        Cached response, or MISS if absent, expired or unreadable.
+
+        Args:
+            tool: MCP tool name
+            node_id: Figma node ID
+            version: Figma file version ("" if unknown)
+            max_age: Stricter TTL for this lookup (seconds)
+            file_key: Figma file key the node belongs to
+        """
+        path = self._path(file_key, tool, node_id, version)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return MISS
+
+        age = time.time() - entry.get("stored_at", 0)
+        if entry.get("version") != CACHE_VERSION or age > self.ttl:
+            try:
+                os.remove(path)  # Dead either way; don't let it hold a max_entries slot
+            except OSError:
+                pass
+            return MISS
+        if max_age is not None and age > max_age:
+            return MISS
+
+        try:
+            # LRU: mark as used now, keeping the mtime (store time) for expiry
+            os.utime(path, ns=(time.time_ns(), os.stat(path).st_mtime_ns))
+        except OSError:
+            pass
+        return entry["value"]
+
+    def put(self, tool: str, node_id: str, version: str, value: Any, file_key: str = "") -> bool:
+        """
+        Store a response atomically.
+
+        Returns:
+            False if the value isn't JSON-serializable or the write failed
+        """
+        path = self._path(file_key, tool, node_id, version)
+        try:
+            payload = json.dumps({
+                "version": CACHE_VERSION,
+                "file_key": file_key,
+                "tool": tool,
+                "node_id": node_id,
+                "file_version": version,
+                "stored_at": time.time(),
+                "value": value,
+            }, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return False
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(temp_path, path)
+        except OSError:
+            return False
+        return True
+
+    def evict(self) -> int:
+        """
+        Drop entries stored longer ago than the TTL, then the least recently
+        used ones beyond max_entries.
+
+        Returns:
+            Number of entries removed
+        """
+        try:
+            with os.scandir(self.directory) as it:
+                stats = [(e.stat(), e.path) for e in it if e.name.endswith(".json")]
+        except OSError:
+            return 0
+
+        cutoff = time.time() - self.ttl
+        live = [(st.st_atime, path) for st, path in stats if st.st_mtime >= cutoff]
+        live.sort(reverse=True)
+        doomed = [path for st, path in stats if st.st_mtime < cutoff]
+        doomed.extend(path for _, path in live[self.max_entries:])
+
+        removed = 0
+        for path in doomed:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        max_entries, self.max_entries = self.max_entries, 0
+        try:
+            self.evict()
+        finally:
+            self.max_entries = max_entries
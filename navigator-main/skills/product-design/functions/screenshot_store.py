@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Per-node Figma screenshot store.
+
+Keeps the SHA-256 of the last reviewed screenshot of every node under
+.agent/cache/screenshots/ (plus the image itself in perceptual mode). Diffing a new set of
+screenshots classifies each node as new, changed or unchanged. By default
+only byte-identical screenshots are unchanged; any other difference counts
+as a change. The unchanged node IDs let design_analyzer and
+implementation_planner skip re-analysis on iterative design reviews.
+
+Opt-in perceptual mode (needs Pillow) also accepts re-encoded screenshots:
+both images are reduced to the mean RGBA of every TILE_SIZE x TILE_SIZE
+tile, and the node is unchanged only if no tile channel moved by more than
+the tolerance. Tiles are small enough that a recolor, a changed label or
+an added control always moves some tile well past it.
+"""
+
+import argparse
+import base64
+import binascii
+import hashlib
+import io
+import json
+import math
+import os
+import re
+import time
+from typing import Any, Dict, Optional, Set, Union
+
+try:
+    from PIL import Image
+except ImportError:  # Optional; perceptual mode falls back to exact (SHA-256) matching
+    Image = None
+
+STORE_DIR = os.path.join('.agent', 'cache', 'screenshots')
+STORE_VERSION = 2
+
+# Edge in pixels of the tiles compared in perceptual mode
+TILE_SIZE = 8
+# Max change of any tile's mean channel value (0-255) for "unchanged";
+# one fully flipped pixel moves its tile by 255 / TILE_SIZE**2 ~ 4
+DEFAULT_TOLERANCE = 2
+
+
+def image_bytes(data: Union[str, bytes]) -> bytes:
+    """
+    Raw image bytes from an MCP screenshot response.
+
+    Accepts bytes, base64 strings (MCP image content) and data URLs.
+    """
+    if isinstance(data, (bytes, bytearray)):
+        return bytes(data)
+    if isinstance(data, str):
+        if data.startswith('data:'):
+            data = data.partition(',')[2]
+        try:
+            return base64.b64decode(data, validate=False)
+        except (binascii.Error, ValueError):
+            return data.encode('utf-8')
+    raise TypeError(f'Unsupported screenshot data: {type(data).__name__}')
+
+
+def tile_signature(data: Union[str, bytes]) -> Optional[bytes]:
+    """
+    Mean RGBA of every TILE_SIZE x TILE_SIZE tile, row-major.
+
+    Returns:
+        Signature bytes, or None without Pillow or for undecodable data
+    """
+    if Image is None:
+        return None
+    try:
+        with Image.open(io.BytesIO(image_bytes(data))) as image:
+            width, height = image.size
+            tiles = (math.ceil(width / TILE_SIZE), math.ceil(height / TILE_SIZE))
+            return image.convert('RGBA').resize(tiles, Image.BOX).tobytes()
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return None
+
+
+def tile_distance(a: Union[str, bytes], b: Union[str, bytes]) -> Optional[int]:
+    """
+    Largest per-tile channel difference between two screenshots.
+
+    Returns:
+        0-255, or None if either image can't be decoded or the sizes differ
+    """
+    first, second = tile_signature(a), tile_signature(b)
+    if first is None or second is None or len(first) != len(second):
+        return None
+    return max((abs(x - y) for x, y in zip(first, second)), default=0)
+
+
+def fingerprint(data: Union[str, bytes]) -> Dict[str, Any]:
+    """
+    Identity of one screenshot.
+
+    Returns:
+        {'sha256', 'size'}; size is None without Pillow or for undecodable data
+    """
+    raw = image_bytes(data)
+    result = {'sha256': hashlib.sha256(raw).hexdigest(), 'size': None}
+    if Image is None:
+        return result
+    try:
+        with Image.open(io.BytesIO(raw)) as image:
+            result['size'] = list(image.size)
+    except (OSError, ValueError, Image.DecompressionBombError):
+        pass
+    return result
+
+
+class ScreenshotStore:
+    """Last reviewed screenshot and its hash per Figma node ID."""
+
+    def __init__(self, directory: str = STORE_DIR, perceptual: bool = False,
+                 tolerance: int = DEFAULT_TOLERANCE):
+        """
+        Args:
+            directory: Store directory (index.json plus one image per node)
+            perceptual: Also accept re-encoded screenshots whose tiles match
+                the stored image within tolerance (needs Pillow)
+            tolerance: Max per-tile channel difference for "unchanged" in
+                perceptual mode
+        """
+        self.directory = directory
+        self.perceptual = perceptual
+        self.tolerance = tolerance
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.load()
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.directory, 'index.json')
+
+    def load(self) -> bool:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get('version') != STORE_VERSION:
+            return False
+        self.nodes = data.get('nodes', {})
+        return True
+
+    def save(self) -> Optional[str]:
+        """Persist the index atomically."""
+        path = self.index_path
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': STORE_VERSION, 'nodes': self.nodes}, f, separators=(',', ':'))
+            os.replace(temp_path, path)
+        except OSError:
+            return None
+        return path
+
+    def _image_path(self, node_id: str) -> str:
+        return os.path.join(self.directory, re.sub(r'[^\w.-]', '_', node_id) + '.png')
+
+    def compare(self, node_id: str, print_: Dict[str, Any],
+                data: Optional[Union[str, bytes]] = None) -> Dict[str, Any]:
+        """
+        Classify a fingerprinted screenshot against the stored one.
+
+        Args:
+            node_id: Figma node ID
+            print_: fingerprint() of the new screenshot
+            data: The new screenshot, needed for the perceptual comparison
+
+        Returns:
+            {'status': 'new' | 'changed' | 'unchanged', 'distance': int or None};
+            distance is the largest tile difference when perceptual mode compared
+            the images
+        """
+        previous = self.nodes.get(node_id)
+        if previous is None:
+            return {'status': 'new', 'distance': None}
+        if previous['sha256'] == print_['sha256']:
+            return {'status': 'unchanged', 'distance': 0}
+        if not self.perceptual or data is None or previous.get('size') != print_['size']:
+            return {'status': 'changed', 'distance': None}
+
+        try:
+            with open(os.path.join(self.directory, previous.get('file') or ''), 'rb') as f:
+                baseline = f.read()
+        except OSError:
+            return {'status': 'changed', 'distance': None}
+        distance = tile_distance(baseline, data)
+        if distance is None:
+            return {'status': 'changed', 'distance': None}
+        return {'status': 'unchanged' if distance <= self.tolerance else 'changed', 'distance': distance}
+
+    def record(self, node_id: str, data: Union[str, bytes], print_: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Store a screenshot as the node's new baseline (call save() to persist the index).
+
+        The image is only written in perceptual mode, the only reader of it;
+        otherwise the hash is enough and a stale image is removed.
+        """
+        raw = image_bytes(data)
+        print_ = print_ or fingerprint(raw)
+        path = None
+        if self.perceptual:
+            path = self._image_path(node_id)
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                with open(path, 'wb') as f:
+                    f.write(raw)
+            except OSError:
+                path = None
+        elif self.nodes.get(node_id, {}).get('file'):
+            try:
+                os.remove(os.path.join(self.directory, self.nodes[node_id]['file']))
+            except OSError:
+                pass
+        self.nodes[node_id] = dict(print_, file=path and os.path.basename(path), updated=time.time())
+
+    def diff(self, screenshots: Dict[str, Union[str, bytes]], update: bool = True) -> Dict[str, Any]:
+        """
+        Classify screenshots against the store.
+
+        Unchanged nodes keep their baseline, so in perceptual mode small
+        differences can't accumulate past the tolerance across reviews.
+
+        Args:
+            screenshots: Node ID -> screenshot data (e.g. FigmaMCPClient.fetch_many output)
+            update: Record new and changed screenshots and save the index
+
+        Returns:
+            {'new', 'changed', 'unchanged'} node ID lists plus per-node 'distances'
+        """
+        result: Dict[str, Any] = {'new': [], 'changed': [], 'unchanged': [], 'distances': {}}
+        for node_id, data in screenshots.items():
+            if data is None or isinstance(data, BaseException):
+                continue
+            print_ = fingerprint(data)
+            verdict = self.compare(node_id, print_, data)
+            result[verdict['status']].append(node_id)
+            result['distances'][node_id] = verdict['distance']
+            if update and verdict['status'] != 'unchanged':
+                self.record(node_id, data, print_)
+
+        if update and (result['new'] or result['changed']):
+            self.save()
+        return result
+
+
+def load_unchanged_nodes(path: str) -> Set[str]:
+    """Unchanged node IDs from a screenshot diff JSON file (or a plain ID list)."""
+    with open(path, 'r') as f:
+        data = json.load(f)
+    return set(data.get('unchanged', []) if isinstance(data, dict) else data)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Diff Figma node screenshots against the last reviewed ones'
+    )
+    parser.add_argument(
+        '--screenshots',
+        required=True,
+        help='JSON file mapping node ID -> screenshot (base64, data URL)'
+    )
+    parser.add_argument(
+        '--store',
+        default=STORE_DIR,
+        help=f'Screenshot store directory (default: {STORE_DIR})'
+    )
+    parser.add_argument(
+        '--perceptual',
+        action='store_true',
+        help='Also treat re-encoded screenshots with matching tiles as unchanged (needs Pillow)'
+    )
+    parser.add_argument(
+        '--tolerance',
+        type=int,
+        default=DEFAULT_TOLERANCE,
+        help=f'Max per-tile channel difference in perceptual mode (default: {DEFAULT_TOLERANCE})'
+    )
+    parser.add_argument(
+        '--no-update',
+        action='store_true',
+        help='Only report; keep the stored baselines'
+    )
+    parser.add_argument(
+        '--output',
+        help='Output file path (default: stdout)'
+    )
+
+    args = parser.parse_args()
+
+    with open(args.screenshots, 'r') as f:
+        screenshots = json.load(f)
+
+    store = ScreenshotStore(args.store, perceptual=args.perceptual, tolerance=args.tolerance)
+    result = store.diff(screenshots, update=not args.no_update)
+    result['perceptual'] = args.perceptual and Image is not None
+
+    output_json = json.dumps(result, indent=2)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output_json)
+    else:
+        print(output_json)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Candidate-pruned name similarity index shared by component_mapper and design_analyzer.
+
+Built once per run over the codebase/UI kit names, then queried for every
+Figma component. Returns exactly what a SequenceMatcher(None, query, name)
+ratio loop over all names would, but only scores the names that can reach
+the threshold.
+
+Pruning uses an inverted index of (character, occurrence) pairs - the n=1
+case of an n-gram index, and the only order whose overlap is a true upper
+bound on SequenceMatcher's ratio (longer n-grams can miss matches built
+from short blocks). Summing posting hits gives every name's quick_ratio in
+one pass; names whose bound falls below the threshold are skipped before
+the exact, quadratic ratio is computed.
+
+batch_top_k() is the whole-design-system mode: every name becomes a
+character trigram count vector and all query x name cosine similarities are
+computed as one matrix product (NumPy when installed, sparse dot products
+otherwise), with top-k cut per row by partition. Scores are cosines, not
+SequenceMatcher ratios; SequenceMatcher only breaks ties.
+"""
+
+import math
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Dict, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Optional; batch_top_k falls back to sparse dot products
+    np = None
+
+NGRAM_SIZE = 3
+# Query rows per matrix product, bounding the dense score block to ROW_CHUNK x names
+ROW_CHUNK = 256
+
+
+def _occurrences(text: str) -> List[Tuple[str, int]]:
+    """(char, k) for the k-th occurrence of every character in text."""
+    return [(char, k) for char, count in Counter(text).items() for k in range(1, count + 1)]
+
+
+class SimilarityIndex:
+    """Inverted character-occurrence index over a list of names."""
+
+    def __init__(self, names: List[str]):
+        """
+        Index names for repeated similarity queries.
+
+        Args:
+            names: Candidate names; results refer to positions in this list
+        """
+        self.names = names
+
+        # Duplicate names (index.tsx, Button.tsx in several folders) are scored once
+        self._positions: Dict[str, List[int]] = {}
+        for position, name in enumerate(names):
+            self._positions.setdefault(name.lower(), []).append(position)
+        self._keys = list(self._positions)
+
+        self._postings: Dict[Tuple[str, int], List[int]] = {}
+        for key_id, key in enumerate(self._keys):
+            for pair in _occurrences(key):
+                self._postings.setdefault(pair, []).append(key_id)
+
+        # SequenceMatcher caches its analysis of seq2, so keep one per candidate
+        self._matchers: Dict[int, SequenceMatcher] = {}
+        self._results: Dict[Tuple[str, float], List[Tuple[int, float]]] = {}
+
+    def _ratio(self, key_id: int, query: str) -> float:
+        matcher = self._matchers.get(key_id)
+        if matcher is None:
+            matcher = self._matchers[key_id] = SequenceMatcher(None, b=self._keys[key_id])
+        matcher.set_seq1(query)
+        return matcher.ratio()
+
+    def _candidates(self, query: str, threshold: float) -> List[int]:
+        if threshold <= 0 or not query:
+            # Every name (or only empty names) can qualify; nothing to prune
+            return list(range(len(self._keys)))
+
+        shared = Counter()
+        for pair in _occurrences(query):
+            shared.update(self._postings.get(pair, ()))
+
+        # quick_ratio bound: matched characters never exceed the multiset overlap
+        length = len(query)
+        keys = self._keys
+        return [key_id for key_id, overlap in shared.items()
+                if 2.0 * overlap / (length + len(keys[key_id])) >= threshold]
+
+    def matches(self, query: str, threshold: float) -> List[Tuple[int, float]]:
+        """
+        Names at least `threshold` similar to query (case-insensitive).
+
+        Args:
+            query: Name to look up
+            threshold: Minimum SequenceMatcher ratio
+
+        Returns:
+            (position, ratio) pairs in original list order
+        """
+        query = query.lower()
+        cache_key = (query, threshold)
+        cached = self._results.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        found = []
+        for key_id in self._candidates(query, threshold):
+            ratio = self._ratio(key_id, query)
+            if ratio >= threshold:
+                found.extend((position, ratio) for position in self._positions[self._keys[key_id]])
+        found.sort()
+
+        self._results[cache_key] = found
+        return list(found)
+
+
+def ngram_counts(name: str, n: int = NGRAM_SIZE) -> Counter:
+    """Character n-gram counts of a lowercased, space-padded name."""
+    padded = f' {name.lower()} '
+    if len(padded) <= n:
+        return Counter([padded])
+    return Counter(padded[i:i + n] for i in range(len(padded) - n + 1))
+
+
+def _rank(query: str, names: Sequence[str], scored: List[Tuple[int, float]], k: int) -> List[Tuple[int, float]]:
+    """Order by score, breaking exact ties by SequenceMatcher ratio, then position."""
+    ties = Counter(score for _, score in scored)
+    ratios = {}
+    for position, score in scored:
+        if ties[score] > 1:
+            ratios[position] = SequenceMatcher(None, query.lower(), names[position].lower()).ratio()
+    scored.sort(key=lambda item: (-item[1], -ratios.get(item[0], 0.0), item[0]))
+    return scored[:k]
+
+
+def _top_k_numpy(queries: List[Counter], names: List[Counter], k: int,
+                 threshold: float) -> List[List[Tuple[int, float]]]:
+    # Only n-grams present in some query contribute to a dot product
+    vocab: Dict[str, int] = {}
+    for counts in queries:
+        for gram in counts:
+            vocab.setdefault(gram, len(vocab))
+
+    def encode(vectors: List[Counter]):
+        matrix = np.zeros((len(vectors), len(vocab)), dtype=np.float32)
+        norms = np.ones(len(vectors), dtype=np.float32)
+        for row, counts in enumerate(vectors):
+            for gram, count in counts.items():
+                column = vocab.get(gram)
+                if column is not None:
+                    matrix[row, column] = count
+            norms[row] = math.sqrt(sum(c * c for c in counts.values())) or 1.0
+        return matrix / norms[:, None]
+
+    query_matrix = encode(queries)
+    name_matrix_t = encode(names).T
+
+    results = []
+    for start in range(0, len(queries), ROW_CHUNK):
+        scores = np.round(query_matrix[start:start + ROW_CHUNK] @ name_matrix_t, 6)
+        if k < scores.shape[1]:
+            # k-th best score per row; everything tied with it stays in the running
+            cutoff = -np.partition(-scores, k - 1, axis=1)[:, k - 1]
+        else:
+            cutoff = scores.min(axis=1)
+        cutoff = np.maximum(cutoff, threshold)
+        for row in range(scores.shape[0]):
+            positions = np.nonzero((scores[row] >= cutoff[row]) & (scores[row] > 0))[0]
+            results.append([(int(p), round(float(scores[row, p]), 6)) for p in positions])
+    return results
+
+
+def _top_k_sparse(queries: List[Counter], names: List[Counter], k: int,
+                  threshold: float) -> List[List[Tuple[int, float]]]:
+    postings: Dict[str, List[Tuple[int, int]]] = {}
+    norms = []
+    for position, counts in enumerate(names):
+        for gram, count in counts.items():
+            postings.setdefault(gram, []).append((position, count))
+        norms.append(math.sqrt(sum(c * c for c in counts.values())) or 1.0)
+
+    results = []
+    for counts in queries:
+        dots: Dict[int, float] = {}
+        for gram, count in counts.items():
+            for position, other in postings.get(gram, ()):
+                dots[position] = dots.get(position, 0.0) + count * other
+        query_norm = math.sqrt(sum(c * c for c in counts.values())) or 1.0
+        scored = [(position, round(dot / (query_norm * norms[position]), 6)) for position, dot in dots.items()]
+        scored = [item for item in scored if item[1] >= threshold]
+        if len(scored) > k:
+            cutoff = sorted((score for _, score in scored), reverse=True)[k - 1]
+            scored = [item for item in scored if item[1] >= cutoff]
+        results.append(scored)
+    return results
+
+
+def batch_top_k(queries: Sequence[str], names: Sequence[str], k: int = 3,
+                threshold: float = 0.0, n: int = NGRAM_SIZE) -> List[List[Tuple[int, float]]]:
+    """
+    Top-k most similar names for every query by n-gram cosine similarity.
+
+    Args:
+        queries: Names to look up (duplicates are computed once)
+        names: Candidate names
+        k: Matches to keep per query
+        threshold: Minimum cosine similarity; names sharing no n-gram never match
+        n: N-gram size
+
+    Returns:
+        Per query, up to k (position, cosine) pairs, best first
+    """
+    if not queries:
+        return []
+    if not names or k <= 0:
+        return [[] for _ in queries]
+
+    unique = list(dict.fromkeys(query.lower() for query in queries))
+    query_vectors = [ngram_counts(query, n) for query in unique]
+    name_vectors = [ngram_counts(name, n) for name in names]
+
+    top_k = _top_k_numpy if np is not None else _top_k_sparse
+    candidates = top_k(query_vectors, name_vectors, k, threshold)
+
+    ranked = {query: _rank(query, names, scored, k) for query, scored in zip(unique, candidates)}
+    return [list(ranked[query.lower()]) for query in queries]
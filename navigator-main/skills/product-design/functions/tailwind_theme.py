@@ -0,0 +1,599 @@
+#!/usr/bin/env python3
+"""
+Static Tailwind theme extraction and token join, without running Node.
+
+Reads the theme/extend object of tailwind.config.{js,ts,cjs,mjs} with a
+small tokenizer and object-literal parser (string/number literals, nested
+objects and arrays, spreads and references to top-level literal consts),
+and Tailwind v4 @theme blocks from CSS. Values that need evaluation
+(functions, require(), template interpolation) are reported as unresolved.
+
+Every entry is indexed by its CSS variable name (color-primary-500), the
+same key design tokens map to (color.primary.500 -> --color-primary-500),
+so comparing a theme against DTCG tokens is a single hash join.
+"""
+
+import argparse
+import json
+import os
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from component_inventory import PRUNE_DIRS
+from token_set import TokenSet, as_token_set
+
+CONFIG_NAMES = tuple(f'tailwind.config.{ext}' for ext in ('js', 'ts', 'cjs', 'mjs'))
+
+# Tailwind v3 theme keys -> v4 CSS variable namespaces
+THEME_NAMESPACES = {
+    'colors': 'color',
+    'spacing': 'spacing',
+    'borderRadius': 'radius',
+    'boxShadow': 'shadow',
+    'dropShadow': 'drop-shadow',
+    'fontSize': 'text',
+    'fontFamily': 'font',
+    'fontWeight': 'font-weight',
+    'lineHeight': 'leading',
+    'letterSpacing': 'tracking',
+    'screens': 'breakpoint',
+    'transitionTimingFunction': 'ease',
+    'animation': 'animate',
+}
+
+# DTCG top-level groups -> CSS variable namespaces (others are used as is)
+TOKEN_NAMESPACES = {
+    'color': 'color',
+    'colors': 'color',
+    'spacing': 'spacing',
+    'space': 'spacing',
+    'radius': 'radius',
+    'borderradius': 'radius',
+    'shadow': 'shadow',
+    'boxshadow': 'shadow',
+    'typography': 'text',
+    'fontsize': 'text',
+    'fontfamily': 'font',
+}
+
+# Namespaces checked for tokens missing from the theme
+THEMED_NAMESPACES = ('color', 'spacing', 'radius', 'shadow', 'text')
+
+# Recommendation (category, token noun, theme key) per namespace
+CATEGORIES = {
+    'color': ('colors', 'color', 'theme.extend.colors'),
+    'spacing': ('spacing', 'spacing', 'theme.extend.spacing'),
+    'text': ('typography', 'typography', 'theme.extend.fontSize'),
+    'radius': ('radius', 'radius', 'theme.extend.borderRadius'),
+    'shadow': ('shadows', 'shadow', 'theme.extend.boxShadow'),
+}
+
+_JS_TOKEN = re.compile(r'''
+    (?P<skip>\s+|//[^\n]*|/\*.*?\*/)
+  | (?P<str>'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*"|`(?:[^`\\]|\\.)*`)
+  | (?P<num>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<name>[A-Za-z_$][\w$]*)
+  | (?P<punct>\.\.\.|=>|[^\s])
+''', re.S | re.X)
+
+_STATEMENT_KEYWORDS = {'const', 'let', 'var', 'export', 'import', 'function', 'class', 'module'}
+_CLOSERS = {')', ']', '}'}
+_OPENERS = {'(': ')', '[': ']', '{': '}'}
+
+
+class Unresolved:
+    """A config value that can't be known without executing the config."""
+
+    __slots__ = ('expression',)
+
+    def __init__(self, expression: str):
+        self.expression = expression
+
+
+def _tokenize(source: str) -> List[Tuple[str, str]]:
+    return [(m.lastgroup, m.group()) for m in _JS_TOKEN.finditer(source) if m.lastgroup != 'skip']
+
+
+def _unquote(text: str) -> str:
+    return re.sub(r'\\(.)', r'\1', text[1:-1])
+
+
+class _ConfigParser:
+    """Recursive-descent reader for the literal subset of a Tailwind config."""
+
+    def __init__(self, source: str):
+        self.tokens = _tokenize(source)
+        self.consts: Dict[str, Any] = {}
+
+    def _text(self, i: int) -> Optional[str]:
+        return self.tokens[i][1] if i < len(self.tokens) else None
+
+    def _skip_expression(self, i: int, stops: Sequence[str] = (',', ';')) -> int:
+        """Index of the token ending the expression starting at i."""
+        start, stack = i, []
+        while i < len(self.tokens):
+            kind, text = self.tokens[i]
+            if stack:
+                if text in _OPENERS:
+                    stack.append(_OPENERS[text])
+                elif text == stack[-1]:
+                    stack.pop()
+            elif text in _CLOSERS or text in stops:
+                break
+            elif kind == 'name' and text in _STATEMENT_KEYWORDS and i > start and self._text(i - 1) != '.':
+                break
+            elif text in _OPENERS:
+                stack.append(_OPENERS[text])
+            i += 1
+        return i
+
+    def _expression(self, start: int, end: int) -> str:
+        return ' '.join(text for _, text in self.tokens[start:end])
+
+    def value(self, i: int) -> Tuple[Any, int]:
+        """Parse the value starting at token i; returns (value, next index)."""
+        start = i
+        kind, text = self.tokens[i] if i < len(self.tokens) else ('', '')
+
+        if text == '{':
+            value, i = self._object(i + 1)
+        elif text == '[':
+            value, i = self._array(i + 1)
+        elif kind == 'str':
+            value = Unresolved(text) if text.startswith('`') and '${' in text else _unquote(text)
+            i += 1
+        elif kind == 'num' or (text == '-' and self.tokens[i + 1:i + 2] and self.tokens[i + 1][0] == 'num'):
+            negative = text == '-'
+            i += negative
+            number = self.tokens[i][1]
+            value = float(number) if any(c in number for c in '.eE') else int(number)
+            value = -value if negative else value
+            i += 1
+        elif kind == 'name' and text in ('true', 'false', 'null'):
+            value = {'true': True, 'false': False, 'null': None}[text]
+            i += 1
+        elif kind == 'name' and text in self.consts and self._text(i + 1) not in ('.', '(', '['):
+            value = self.consts[text]
+            i += 1
+        else:
+            end = self._skip_expression(i)
+            return Unresolved(self._expression(start, end)), end
+
+        # "as const" / "satisfies Config" keep the literal; any other operator needs evaluation
+        following = self._text(i)
+        if following in ('as', 'satisfies'):
+            i = self._skip_expression(i)
+        elif following is not None and following not in _CLOSERS and following not in (',', ';'):
+            if self.tokens[i][0] != 'name' or following not in _STATEMENT_KEYWORDS:
+                end = self._skip_expression(i)
+                return Unresolved(self._expression(start, end)), end
+        return value, i
+
+    def _object(self, i: int) -> Tuple[Dict[str, Any], int]:
+        obj: Dict[str, Any] = {}
+        while i < len(self.tokens):
+            kind, text = self.tokens[i]
+            if text == '}':
+                return obj, i + 1
+            if text == ',':
+                i += 1
+                continue
+
+            if text == '...':
+                spread, i = self.value(i + 1)
+                if isinstance(spread, dict):
+                    obj.update(spread)
+                else:
+                    obj[f'...{len(obj)}'] = Unresolved('...' + (spread.expression if isinstance(spread, Unresolved) else repr(spread)))
+                continue
+
+            if text == '[':
+                # Computed key
+                end = self._skip_expression(i + 1)
+                key, i = None, end + 1
+            elif kind in ('name', 'num'):
+                key, i = text, i + 1
+            elif kind == 'str':
+                key, i = _unquote(text), i + 1
+            else:
+                i = self._skip_expression(i + 1)
+                continue
+
+            following = self._text(i)
+            if following == ':':
+                value, i = self.value(i + 1)
+            elif following == '(':
+                # Method shorthand: key(...) { ... }
+                end = self._skip_expression(i)
+                value, i = Unresolved(self._expression(i - 1, end)), end
+            else:
+                # Shorthand property { colors }
+                value = self.consts.get(key, Unresolved(key or ''))
+
+            if key is None:
+                obj[f'[computed {len(obj)}]'] = Unresolved('computed key')
+            else:
+                obj[key] = value
+        return obj, i
+
+    def _array(self, i: int) -> Tuple[List[Any], int]:
+        items: List[Any] = []
+        while i < len(self.tokens):
+            text = self.tokens[i][1]
+            if text == ']':
+                return items, i + 1
+            if text == ',':
+                i += 1
+                continue
+            if text == '...':
+                spread, i = self.value(i + 1)
+                if isinstance(spread, list):
+                    items.extend(spread)
+                else:
+                    items.append(Unresolved('...' + (spread.expression if isinstance(spread, Unresolved) else repr(spread))))
+                continue
+            item, i = self.value(i)
+            items.append(item)
+        return items, i
+
+    def config(self) -> Optional[Any]:
+        """The exported config value (object, or Unresolved)."""
+        tokens, exported = self.tokens, None
+        depth, i = 0, 0
+        while i < len(tokens):
+            kind, text = tokens[i]
+            if text in _OPENERS:
+                depth += 1
+            elif text in _CLOSERS:
+                depth -= 1
+            elif depth == 0 and kind == 'name':
+                if text in ('const', 'let', 'var') and self._text(i + 1) and tokens[i + 1][0] == 'name':
+                    name, i = tokens[i + 1][1], i + 2
+                    if self._text(i) == ':':
+                        # Type annotation
+                        i = self._skip_expression(i + 1, stops=('=', ',', ';'))
+                    if self._text(i) == '=':
+                        self.consts[name], i = self.value(i + 1)
+                    continue
+                if text == 'module' and [t for _, t in tokens[i + 1:i + 4]] == ['.', 'exports', '=']:
+                    exported, i = self._exported(i + 4)
+                    continue
+                if text == 'export' and self._text(i + 1) == 'default':
+                    exported, i = self._exported(i + 2)
+                    continue
+            i += 1
+        return exported
+
+    def _exported(self, i: int) -> Tuple[Any, int]:
+        # defineConfig({...}) / withPlugin({...}): use the first object argument
+        if i < len(self.tokens) and self.tokens[i][0] == 'name' and self._text(i + 1) == '(' \
+                and self._text(i + 2) == '{':
+            value, end = self.value(i + 2)
+            return value, self._skip_expression(end)
+        return self.value(i)
+
+
+def _kebab(name: str) -> str:
+    return re.sub(r'(?<=[a-z0-9])([A-Z])', r'-\1', name).lower()
+
+
+def _entry(namespace: str, parts: List[str], value: Any, source: str, file: str) -> Dict[str, Any]:
+    # DEFAULT names the group itself; spread and computed-key placeholders have no name
+    parts = [str(part) for part in parts if part != 'DEFAULT' and not str(part).startswith(('...', '[computed'))]
+    return {
+        'key': '-'.join([namespace] + parts).lower(),
+        'path': '.'.join([namespace] + parts),
+        'value': value,
+        'source': source,
+        'file': file,
+    }
+
+
+def _theme_entries(section: Dict[str, Any], source: str, file: str,
+                   entries: Dict[str, Dict[str, Any]], unresolved: List[Dict[str, Any]]) -> None:
+    for theme_key, value in section.items():
+        if theme_key == 'extend':
+            continue
+        namespace = THEME_NAMESPACES.get(theme_key, _kebab(theme_key))
+        stack = [([], value)]
+        while stack:
+            parts, node = stack.pop()
+            if isinstance(node, Unresolved):
+                entry = _entry(namespace, parts, None, source, file)
+                unresolved.append({'key': entry['key'], 'source': source, 'file': file,
+                                   'expression': node.expression})
+            elif isinstance(node, dict):
+                stack.extend((parts + [key], child) for key, child in reversed(list(node.items())))
+            elif parts:
+                if isinstance(node, list) and any(isinstance(item, Unresolved) for item in node):
+                    # e.g. fontFamily: ['Inter', ...defaultTheme.fontFamily.sans] - keep the literal part
+                    expressions = [item.expression for item in node if isinstance(item, Unresolved)]
+                    node = [item for item in node if not isinstance(item, Unresolved)]
+                    unresolved.append({'key': _entry(namespace, parts, None, source, file)['key'],
+                                       'source': source, 'file': file, 'expression': ', '.join(expressions)})
+                entry = _entry(namespace, parts, node, source, file)
+                entries[entry['key']] = entry
+
+
+def parse_tailwind_config(source: str, file: str = '') -> Tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Extract theme entries from tailwind.config.{js,ts,cjs,mjs} source.
+
+    theme.extend entries override theme entries with the same key.
+
+    Args:
+        source: Config file contents
+        file: Path recorded on each entry
+
+    Returns:
+        (entries by CSS variable key, unresolved values)
+    """
+    parser = _ConfigParser(source)
+    config = parser.config()
+    if not isinstance(config, dict):
+        config = {}
+
+    theme = config.get('theme')
+    if theme is None:
+        # Not exported as a literal; fall back to the first theme object in the file
+        for i, (_, text) in enumerate(parser.tokens):
+            if text == 'theme' and parser._text(i + 1) == ':' and parser._text(i + 2) == '{':
+                theme, _ = parser.value(i + 2)
+                break
+
+    entries: Dict[str, Dict[str, Any]] = {}
+    unresolved: List[Dict[str, Any]] = []
+    if isinstance(theme, Unresolved):
+        unresolved.append({'key': 'theme', 'source': 'theme', 'file': file, 'expression': theme.expression})
+    elif isinstance(theme, dict):
+        _theme_entries(theme, 'theme', file, entries, unresolved)
+        extend = theme.get('extend')
+        if isinstance(extend, dict):
+            _theme_entries(extend, 'extend', file, entries, unresolved)
+        elif isinstance(extend, Unresolved):
+            unresolved.append({'key': 'extend', 'source': 'extend', 'file': file, 'expression': extend.expression})
+    return entries, unresolved
+
+
+_THEME_BLOCK = re.compile(r'@theme\b[^{;]*\{')
+_CSS_VARIABLE = re.compile(r'--([A-Za-z0-9_-]+)\s*:\s*([^;{}]+?)\s*(?:;|(?=\}))')
+
+
+def parse_theme_css(source: str, file: str = '') -> Dict[str, Dict[str, Any]]:
+    """
+    Extract custom properties from Tailwind v4 @theme blocks.
+
+    Args:
+        source: CSS file contents
+        file: Path recorded on each entry
+
+    Returns:
+        Entries by CSS variable key
+    """
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.S)
+    entries: Dict[str, Dict[str, Any]] = {}
+    for match in _THEME_BLOCK.finditer(source):
+        depth, i = 1, match.end()
+        while i < len(source) and depth:
+            depth += {'{': 1, '}': -1}.get(source[i], 0)
+            i += 1
+        for name, value in _CSS_VARIABLE.findall(source[match.end():i - 1]):
+            # Skip namespace resets (--color-*: initial) and modifiers (--text-lg--line-height)
+            if '*' in name or '--' in name or value == 'initial':
+                continue
+            namespace, _, rest = name.partition('-')
+            for known in ('font-weight', 'drop-shadow', 'inset-shadow', 'text-shadow'):
+                if name.startswith(known + '-'):
+                    namespace, rest = known, name[len(known) + 1:]
+            entry = _entry(namespace, rest.split('-') if rest else [], value, '@theme', file)
+            entries[entry['key']] = entry
+    return entries
+
+
+def find_tailwind_sources(path: str) -> List[str]:
+    """
+    Tailwind config files and @theme stylesheets for one app.
+
+    Args:
+        path: A config/CSS file, or an app directory (config files at its
+            root, stylesheets with @theme anywhere below it)
+
+    Returns:
+        Source file paths
+    """
+    if os.path.isfile(path):
+        return [path]
+
+    sources = [os.path.join(path, name) for name in CONFIG_NAMES if os.path.isfile(os.path.join(path, name))]
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if d not in PRUNE_DIRS)
+        for name in sorted(files):
+            if not name.endswith('.css'):
+                continue
+            css_path = os.path.join(root, name)
+            try:
+                with open(css_path, 'r', encoding='utf-8', errors='replace') as f:
+                    if '@theme' in f.read():
+                        sources.append(css_path)
+            except OSError:
+                continue
+    return sources
+
+
+def load_tailwind_theme(paths: Union[str, Sequence[str]]) -> Dict[str, Any]:
+    """
+    Parse every Tailwind source of an app into one index.
+
+    Later sources override earlier ones (CSS @theme after JS config).
+
+    Args:
+        paths: App directory, config/CSS file, or a list of them
+
+    Returns:
+        {'files': [...], 'entries': {key: entry}, 'unresolved': [...]}
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+
+    files = [source for path in paths for source in find_tailwind_sources(path)]
+    files.sort(key=lambda source: source.endswith('.css'))
+
+    entries: Dict[str, Dict[str, Any]] = {}
+    unresolved: List[Dict[str, Any]] = []
+    for source_path in files:
+        try:
+            with open(source_path, 'r', encoding='utf-8', errors='replace') as f:
+                source = f.read()
+        except OSError:
+            continue
+        if source_path.endswith('.css'):
+            entries.update(parse_theme_css(source, source_path))
+        else:
+            parsed, missing = parse_tailwind_config(source, source_path)
+            entries.update(parsed)
+            unresolved.extend(missing)
+
+    return {'files': files, 'entries': entries, 'unresolved': unresolved}
+
+
+def token_key(path: str) -> str:
+    """CSS variable key for a DTCG token path (color.primary.500 -> color-primary-500)."""
+    group, _, rest = path.partition('.')
+    namespace = TOKEN_NAMESPACES.get(group.lower(), group.lower())
+    return f"{namespace}-{rest.replace('.', '-')}".lower() if rest else namespace
+
+
+def token_index(tokens: Union[Dict[str, Any], TokenSet]) -> Dict[str, str]:
+    """CSS variable key -> token path, built once per token set."""
+    return {token_key(path): path for path in as_token_set(tokens)}
+
+
+def _comparable(value: Any) -> Any:
+    if isinstance(value, dict):
+        if 'fontSize' in value:
+            return _comparable(value['fontSize'])
+        return json.dumps(value, sort_keys=True)
+    if isinstance(value, list):
+        if value and isinstance(value[-1], dict):
+            # fontSize: ['1rem', { lineHeight: ... }]
+            return _comparable(value[0])
+        return ', '.join(str(_comparable(item)).strip('\'"') for item in value)
+    if isinstance(value, str):
+        return ' '.join(value.split()).lower()
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, (int, float)):
+        text = repr(float(value))
+        return text[:-2] if text.endswith('.0') else text
+    return value
+
+
+def join_theme(theme: Dict[str, Any], tokens: Union[Dict[str, Any], TokenSet],
+               index: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Compare a Tailwind theme with DTCG tokens in one hash join on CSS variable key.
+
+    A theme value of var(--<key>) counts as in sync with that token.
+
+    Args:
+        theme: load_tailwind_theme() output
+        tokens: Design tokens (DTCG format or TokenSet)
+        index: token_index(tokens), to reuse across many apps
+
+    Returns:
+        in_sync, drift_detected, missing_in_config, not_in_tokens and
+        unresolved lists
+    """
+    token_set = as_token_set(tokens)
+    if index is None:
+        index = token_index(token_set)
+
+    report: Dict[str, Any] = {
+        'in_sync': [],
+        'drift_detected': [],
+        'missing_in_config': [],
+        'not_in_tokens': [],
+        'unresolved': theme['unresolved'],
+    }
+
+    entries = theme['entries']
+    for key, entry in entries.items():
+        path = index.get(key)
+        if path is None:
+            report['not_in_tokens'].append({
+                'key': key,
+                'value': entry['value'],
+                'source': entry['source'],
+                'file': entry['file']
+            })
+            continue
+
+        token_value = token_set.value(path)
+        config_value = entry['value']
+        bound = isinstance(config_value, str) and f'var(--{key})' in config_value
+        if bound or _comparable(token_value) == _comparable(config_value):
+            report['in_sync'].append({'path': path, 'value': config_value, 'source': entry['source']})
+        else:
+            report['drift_detected'].append({
+                'path': path,
+                'token_value': token_value,
+                'config_value': config_value,
+                'source': entry['source'],
+                'file': entry['file']
+            })
+
+    for key, path in index.items():
+        if key not in entries and key.split('-', 1)[0] in THEMED_NAMESPACES:
+            report['missing_in_config'].append({
+                'path': path,
+                'value': token_set.value(path),
+                'css_variable': f'--{key}'
+            })
+
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Extract Tailwind themes statically and compare them with design tokens'
+    )
+    parser.add_argument(
+        'apps',
+        nargs='+',
+        help='App directories or Tailwind config/CSS files'
+    )
+    parser.add_argument(
+        '--tokens',
+        required=True,
+        help='Path to design-tokens.json (DTCG format)'
+    )
+    parser.add_argument(
+        '--output',
+        help='Output file path (default: stdout)'
+    )
+
+    args = parser.parse_args()
+
+    with open(args.tokens, 'r') as f:
+        tokens = TokenSet.from_tokens(json.load(f))
+    index = token_index(tokens)
+
+    results = {}
+    for app in args.apps:
+        report = join_theme(load_tailwind_theme(app), tokens, index)
+        results[app] = {
+            'summary': {name: len(items) for name, items in report.items()},
+            **report
+        }
+
+    output_json = json.dumps(results, indent=2)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output_json)
+    else:
+        print(output_json)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+FigmaMCPClient against the local fake MCP server (fake_figma_mcp.py).
+
+Run from this directory: python3 -m pytest test_figma_mcp_client.py
+Requires the MCP SDK (pip install mcp); skipped without it.
+"""
+
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+pytest.importorskip("mcp")
+
+from figma_mcp_client import FigmaMCPClient, file_key_from_url  # noqa: E402
+from response_cache import ResponseCache  # noqa: E402
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.fixture(scope="module")
+def mcp_url():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(HERE, "fake_figma_mcp.py"), "--port", str(port)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        deadline = time.time() + 20
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+                break
+            except OSError:
+                if time.time() > deadline or process.poll() is not None:
+                    pytest.fail("fake Figma MCP server did not start")
+                time.sleep(0.1)
+        yield f"http://127.0.0.1:{port}/mcp"
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def run(mcp_url, scenario, **kwargs):
+    async def main():
+        async with FigmaMCPClient(mcp_url, **kwargs) as client:
+            await client._call_tool("reset")
+            await client._call_tool("open_file", {"key": "file-a"})
+            return await scenario(client)
+    return asyncio.run(main())
+
+
+def test_fetch_many_is_concurrent_and_bounded(mcp_url):
+    async def scenario(client):
+        shots = await client.fetch_many("get_screenshot", [f"1:{i}" for i in range(8)])
+        return shots, await client._call_tool("stats")
+
+    shots, stats = run(mcp_url, scenario, max_concurrency=4, use_cache=False)
+
+    assert shots == {f"1:{i}": f"file-a:1:{i}" for i in range(8)}
+    assert stats["calls"] == 8
+    assert 1 < stats["peak"] <= 4
+
+
+def test_unversioned_calls_stay_live_by_default(mcp_url, tmp_path):
+    async def scenario(client):
+        await client.get_metadata("1:1")
+        await client.get_metadata("1:1")
+        return await client._call_tool("stats")
+
+    stats = run(mcp_url, scenario, cache=ResponseCache(str(tmp_path)), file_key="file-a")
+
+    assert stats["calls"] == 2
+
+
+def test_unversioned_caching_is_opt_in(mcp_url, tmp_path):
+    async def scenario(client):
+        await client.get_metadata("1:1")
+        await client.get_metadata("1:1")
+        return await client._call_tool("stats")
+
+    stats = run(mcp_url, scenario, cache=ResponseCache(str(tmp_path)), file_key="file-a",
+                cache_unversioned=True)
+
+    assert stats["calls"] == 1
+
+
+def test_cache_is_keyed_by_file(mcp_url, tmp_path):
+    cache = ResponseCache(str(tmp_path))
+
+    async def first(client):
+        await client.get_metadata("1:23")
+        return await client.get_metadata("1:23"), await client._call_tool("stats")
+
+    metadata, stats = run(mcp_url, first, cache=cache, file_key="file-a", file_version="7")
+    assert metadata["file"] == "file-a"
+    assert stats["calls"] == 1
+
+    async def other_file(client):
+        await client._call_tool("open_file", {"key": "file-b"})
+        return await client.get_metadata("1:23")
+
+    # Same node ID and version in another file must not hit file-a's entry
+    metadata = run(mcp_url, other_file, cache=cache, file_key="file-b", file_version="7")
+    assert metadata["file"] == "file-b"
+
+
+def test_file_key_from_url():
+    assert file_key_from_url("https://www.figma.com/design/AbC123xyz/My-App?node-id=1-2") == "AbC123xyz"
+    assert file_key_from_url("https://example.com/design/x") is None
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-disk Figma response cache.
+
+Run from this directory: python3 -m pytest test_response_cache.py
+"""
+
+import json
+import os
+import time
+
+from response_cache import MISS, ResponseCache
+
+
+def _age(cache, node_id, seconds, stored=True, used=True):
+    """Backdate an entry's store time (mtime and stored_at) and/or last use (atime)."""
+    path = cache._path("file-a", "get_metadata", node_id, "7")
+    st = os.stat(path)
+    if stored:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+        entry["stored_at"] -= seconds
+        path.write_text(json.dumps(entry), encoding="utf-8")
+    os.utime(path, (st.st_atime - seconds if used else st.st_atime,
+                    st.st_mtime - seconds if stored else st.st_mtime))
+    return path
+
+
+def test_get_removes_expired_entry(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl=60)
+    cache.put("get_metadata", "1:2", "7", {"id": "1:2"}, file_key="file-a")
+    path = _age(cache, "1:2", 120)
+
+    assert cache.get("get_metadata", "1:2", "7", file_key="file-a") is MISS
+    assert not path.exists()
+
+
+def test_max_age_miss_keeps_entry(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl=3600)
+    cache.put("get_metadata", "1:2", "7", {"id": "1:2"}, file_key="file-a")
+    path = _age(cache, "1:2", 120)
+
+    assert cache.get("get_metadata", "1:2", "7", max_age=60, file_key="file-a") is MISS
+    assert cache.get("get_metadata", "1:2", "7", file_key="file-a") == {"id": "1:2"}
+    assert path.exists()
+
+
+def test_evict_expires_by_store_time_not_last_use(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl=60)
+    cache.put("get_metadata", "1:2", "7", {"id": "1:2"}, file_key="file-a")
+    _age(cache, "1:2", 50)
+    assert cache.get("get_metadata", "1:2", "7", file_key="file-a") == {"id": "1:2"}
+    path = _age(cache, "1:2", 20, used=False)  # Stored 70s ago, last used just now
+
+    assert cache.evict() == 1
+    assert not path.exists()
+
+
+def test_evict_keeps_most_recently_used(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl=3600, max_entries=2)
+    for i in range(3):
+        cache.put("get_metadata", f"1:{i}", "7", i, file_key="file-a")
+        _age(cache, f"1:{i}", 30 - i, stored=False)
+    time.sleep(0.01)
+    assert cache.get("get_metadata", "1:0", "7", file_key="file-a") == 0
+
+    assert cache.evict() == 1
+    assert cache.get("get_metadata", "1:1", "7", file_key="file-a") is MISS
+    assert cache.get("get_metadata", "1:0", "7", file_key="file-a") == 0
+    assert cache.get("get_metadata", "1:2", "7", file_key="file-a") == 2
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for screenshot change detection.
+
+Run from this directory: python3 -m pytest test_screenshot_store.py
+The rendered-frame tests need Pillow; they're skipped without it.
+"""
+
+import io
+
+import pytest
+
+from screenshot_store import ScreenshotStore
+
+FRAME_SIZE = (1440, 900)
+BLUE = (37, 99, 235)
+RED = (220, 38, 38)
+
+
+def _frame(button=BLUE, label='Save', extra_button=False, compress_level=6):
+    """PNG of a 1440x900 settings frame with a labelled primary button."""
+    Image = pytest.importorskip('PIL.Image')
+    ImageDraw = pytest.importorskip('PIL.ImageDraw')
+
+    image = Image.new('RGB', FRAME_SIZE, (248, 250, 252))
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((0, 0, 1440, 64), fill=(255, 255, 255))
+    draw.text((32, 24), 'Account settings', fill=(15, 23, 42))
+    draw.rectangle((1240, 800, 1400, 844), fill=button)
+    draw.text((1300, 816), label, fill=(255, 255, 255))
+    if extra_button:
+        draw.rectangle((1064, 800, 1224, 844), outline=(203, 213, 225), fill=(255, 255, 255))
+        draw.text((1120, 816), 'Cancel', fill=(15, 23, 42))
+
+    out = io.BytesIO()
+    image.save(out, format='PNG', compress_level=compress_level)
+    return out.getvalue()
+
+
+def _status(tmp_path, baseline, current, **kwargs):
+    store = ScreenshotStore(str(tmp_path / 'screenshots'), **kwargs)
+    store.diff({'1:2': baseline})
+    result = store.diff({'1:2': current})
+    return next(status for status in ('new', 'changed', 'unchanged') if result[status])
+
+
+def test_identical_bytes_are_unchanged(tmp_path):
+    assert _status(tmp_path, b'frame-v1', b'frame-v1') == 'unchanged'
+
+
+def test_any_byte_difference_is_changed_by_default(tmp_path):
+    assert _status(tmp_path, b'frame-v1', b'frame-v2') == 'changed'
+
+
+def test_new_node(tmp_path):
+    store = ScreenshotStore(str(tmp_path / 'screenshots'))
+    assert store.diff({'1:2': b'frame-v1'})['new'] == ['1:2']
+
+
+def test_images_are_only_kept_in_perceptual_mode(tmp_path):
+    directory = tmp_path / 'screenshots'
+    ScreenshotStore(str(directory), perceptual=True).diff({'1:2': b'frame-v1'})
+    assert (directory / '1_2.png').exists()
+
+    ScreenshotStore(str(directory)).diff({'1:2': b'frame-v2'})
+    assert sorted(p.name for p in directory.iterdir()) == ['index.json']
+
+
+@pytest.mark.parametrize('perceptual', [False, True])
+@pytest.mark.parametrize('edit', [
+    {'button': RED},
+    {'label': 'Send'},
+    {'extra_button': True},
+], ids=['recolor', 'label', 'added-button'])
+def test_small_edits_are_changed(tmp_path, perceptual, edit):
+    assert _status(tmp_path, _frame(), _frame(**edit), perceptual=perceptual) == 'changed'
+
+
+def test_perceptual_mode_accepts_reencoded_frame(tmp_path):
+    baseline, reencoded = _frame(compress_level=6), _frame(compress_level=1)
+    assert baseline != reencoded
+
+    assert _status(tmp_path, baseline, reencoded) == 'changed'
+    assert _status(tmp_path / 'perceptual', baseline, reencoded, perceptual=True) == 'unchanged'
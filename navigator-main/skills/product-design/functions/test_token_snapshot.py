@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for token snapshots and their JSON patches.
+
+Run from this directory: python3 -m pytest test_token_snapshot.py
+"""
+
+import copy
+
+from token_snapshot import TokenSnapshot, incremental_diff, json_patch
+
+
+def _apply(document, patch):
+    """Apply RFC 6902 add/replace/remove operations (object members only)."""
+    document = copy.deepcopy(document)
+    for op in patch:
+        parts = [p.replace('~1', '/').replace('~0', '~') for p in op['path'].split('/')[1:]]
+        parent = document
+        for part in parts[:-1]:
+            parent = parent[part]
+        if op['op'] == 'remove':
+            del parent[parts[-1]]
+        elif op['op'] == 'replace':
+            assert parts[-1] in parent
+            parent[parts[-1]] = copy.deepcopy(op['value'])
+        else:
+            parent[parts[-1]] = copy.deepcopy(op['value'])
+    return document
+
+
+def _token(value, token_type='color'):
+    return {'$value': value, '$type': token_type}
+
+
+def _roundtrip(old, new):
+    patch = json_patch(TokenSnapshot.from_tokens(new), TokenSnapshot.from_tokens(old))
+    return _apply(old, patch)
+
+
+def test_patch_applies_token_to_group_change():
+    old = {'color': {'primary': _token('#00f')}}
+    new = {'color': {'primary': {'light': _token('#88f')}}}
+
+    assert _roundtrip(old, new) == new
+
+
+def test_patch_applies_group_to_token_change():
+    old = {'color': {'primary': {'light': _token('#88f')}}}
+    new = {'color': {'primary': _token('#00f')}}
+
+    assert _roundtrip(old, new) == new
+
+
+def test_patch_adds_modifies_and_removes():
+    old = {
+        'color': {'primary': _token('#00f'), 'error': _token('#f00')},
+        'spacing': {'md': _token('16px', 'dimension')},
+    }
+    new = {
+        'color': {'primary': _token('#00e')},
+        'spacing': {'md': _token('16px', 'dimension'), 'lg': _token('24px', 'dimension')},
+        'radius': {'sm': {'x': _token('2px', 'dimension')}},
+    }
+
+    assert _roundtrip(old, new) == new
+
+
+def test_incremental_diff_counts_unchanged():
+    old = {'color': {'primary': _token('#00f'), 'error': _token('#f00')}}
+    new = {'color': {'primary': _token('#00f'), 'error': _token('#e00')}}
+
+    diff = incremental_diff(TokenSnapshot.from_tokens(new), TokenSnapshot.from_tokens(old))
+
+    assert [m['path'] for m in diff['modified']] == ['color.error']
+    assert diff['unchanged_count'] == 1
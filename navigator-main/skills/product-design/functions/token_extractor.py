@@ -7,60 +7,10 @@ Compares with existing tokens and generates diff summary.
 import json
 import sys
 import argparse
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Union
 
-
-def normalize_token_name(figma_name: str) -> str:
-    """
-    Normalize Figma variable name to DTCG semantic naming.
-
-    Examples:
-        "Primary 500" → "color.primary.500"
-        "Spacing MD" → "spacing.md"
-        "Font Heading Large" → "typography.heading.large"
-
-    Args:
-        figma_name: Original Figma variable name
-
-    Returns:
-        Normalized DTCG token path
-    """
-    name = figma_name.strip()
-
-    # Convert to lowercase and split
-    parts = name.lower().replace('-', ' ').replace('_', ' ').split()
-
-    # Detect token type from name
-    if any(keyword in parts for keyword in ['color', 'colour']):
-        token_type = 'color'
-        parts = [p for p in parts if p not in ['color', 'colour']]
-    elif any(keyword in parts for keyword in ['spacing', 'space', 'gap', 'padding', 'margin']):
-        token_type = 'spacing'
-        parts = [p for p in parts if p not in ['spacing', 'space', 'gap', 'padding', 'margin']]
-    elif any(keyword in parts for keyword in ['font', 'typography', 'text']):
-        token_type = 'typography'
-        parts = [p for p in parts if p not in ['font', 'typography', 'text']]
-    elif any(keyword in parts for keyword in ['radius', 'border']):
-        token_type = 'radius'
-        parts = [p for p in parts if p not in ['radius', 'border']]
-    elif any(keyword in parts for keyword in ['shadow', 'elevation']):
-        token_type = 'shadow'
-        parts = [p for p in parts if p not in ['shadow', 'elevation']]
-    else:
-        # Infer from first part
-        first_part = parts[0] if parts else ''
-        if first_part in ['primary', 'secondary', 'success', 'error', 'warning', 'info']:
-            token_type = 'color'
-        elif first_part in ['xs', 'sm', 'md', 'lg', 'xl', '2xl', '3xl']:
-            token_type = 'spacing'
-        else:
-            token_type = 'other'
-
-    # Build token path
-    if parts:
-        return f"{token_type}.{'.'.join(parts)}"
-    else:
-        return token_type
+from token_set import TokenSet, as_token_set, normalize_token_name
+from token_snapshot import SNAPSHOT_DIR, TokenSnapshot, incremental_diff, iter_changes, json_patch, snapshot_file
 
 
 def detect_token_type(name: str, value: Any) -> str:
@@ -166,14 +116,14 @@ def convert_to_dtcg(figma_variables: Dict[str, Any]) -> Dict[str, Any]:
     return dtcg_tokens
 
 
-def generate_diff(new_tokens: Dict[str, Any],
-                 existing_tokens: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+def generate_diff(new_tokens: Union[Dict[str, Any], TokenSet],
+                 existing_tokens: Union[Dict[str, Any], TokenSet]) -> Dict[str, List[Dict[str, Any]]]:
     """
     Generate diff between new and existing tokens.
 
     Args:
-        new_tokens: New tokens from Figma (DTCG format)
-        existing_tokens: Existing tokens from design-tokens.json
+        new_tokens: New tokens from Figma (DTCG format or TokenSet)
+        existing_tokens: Existing tokens from design-tokens.json (DTCG format or TokenSet)
 
     Returns:
         Diff summary with added, modified, removed, unchanged
@@ -185,9 +135,9 @@ def generate_diff(new_tokens: Dict[str, Any],
         'unchanged': []
     }
 
-    # Flatten tokens for comparison
-    new_flat = flatten_tokens(new_tokens)
-    existing_flat = flatten_tokens(existing_tokens)
+    # Flatten tokens for comparison (TokenSets are reused as is)
+    new_flat = as_token_set(new_tokens)
+    existing_flat = as_token_set(existing_tokens)
 
     # Find added and modified
     for token_path, token_data in new_flat.items():
@@ -226,30 +176,17 @@ def generate_diff(new_tokens: Dict[str, Any],
     return diff
 
 
-def flatten_tokens(tokens: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+def flatten_tokens(tokens: Union[Dict[str, Any], TokenSet]) -> Dict[str, Any]:
     """
     Flatten nested DTCG tokens to dot notation paths.
 
     Args:
-        tokens: Nested DTCG token structure
-        prefix: Current path prefix
+        tokens: Nested DTCG token structure (or an already flattened TokenSet)
 
     Returns:
         Flattened dictionary with dot notation keys
     """
-    flat = {}
-
-    for key, value in tokens.items():
-        current_path = f"{prefix}.{key}" if prefix else key
-
-        if isinstance(value, dict) and '$value' in value:
-            # This is a token definition
-            flat[current_path] = value
-        elif isinstance(value, dict):
-            # This is a nested group
-            flat.update(flatten_tokens(value, current_path))
-
-    return flat
+    return as_token_set(tokens).tokens
 
 
 def generate_summary(diff: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
@@ -257,13 +194,15 @@ def generate_summary(diff: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
     Generate summary statistics from diff.
 
     Args:
-        diff: Token diff
+        diff: Token diff (incremental diffs carry unchanged_count instead of
+            an unchanged list)
 
     Returns:
         Summary statistics
     """
-    total_new = len(diff['added']) + len(diff['unchanged'])
-    total_existing = len(diff['modified']) + len(diff['removed']) + len(diff['unchanged'])
+    unchanged = diff['unchanged_count'] if 'unchanged_count' in diff else len(diff['unchanged'])
+    total_new = len(diff['added']) + unchanged
+    total_existing = len(diff['modified']) + len(diff['removed']) + unchanged
 
     return {
         'total_new_tokens': total_new,
@@ -271,34 +210,45 @@ def generate_summary(diff: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
         'added_count': len(diff['added']),
         'modified_count': len(diff['modified']),
         'removed_count': len(diff['removed']),
-        'unchanged_count': len(diff['unchanged']),
+        'unchanged_count': unchanged,
         'sync_status': 'in_sync' if len(diff['added']) == 0 and len(diff['modified']) == 0 and len(diff['removed']) == 0 else 'drift_detected',
         'drift_percentage': f"{((len(diff['modified']) + len(diff['removed'])) / max(total_existing, 1)) * 100:.1f}%"
     }
 
 
 def extract_tokens(figma_variables: Dict[str, Any],
-                  existing_tokens: Dict[str, Any] = None) -> Dict[str, Any]:
+                  existing_tokens: Union[Dict[str, Any], TokenSet] = None,
+                  incremental: bool = False,
+                  existing_snapshot: Optional[TokenSnapshot] = None) -> Dict[str, Any]:
     """
     Main extraction function: convert Figma variables to DTCG and generate diff.
 
     Args:
         figma_variables: Figma get_variable_defs response
-        existing_tokens: Current design-tokens.json (optional)
+        existing_tokens: Current design-tokens.json (optional; a TokenSet
+            flattened earlier in the run is reused)
+        incremental: Diff by per-token hashes, report only changes (unchanged
+            tokens are counted, not listed) and add a JSON patch
+        existing_snapshot: Pre-flattened existing tokens (e.g. from
+            token_snapshot.snapshot_file); implies incremental
 
     Returns:
-        Extraction results with DTCG tokens, diff, and summary
+        Extraction results with DTCG tokens, diff, and summary (plus patch
+        when incremental)
     """
-    # Convert to DTCG format
+    # Convert to DTCG format, flattened once for every comparison below
     dtcg_tokens = convert_to_dtcg(figma_variables)
+    flat = TokenSet.from_tokens(dtcg_tokens)
+
+    if incremental or existing_snapshot is not None:
+        return _extract_incremental(dtcg_tokens, flat, existing_tokens, existing_snapshot)
 
     # Generate diff if existing tokens provided
     if existing_tokens:
-        diff = generate_diff(dtcg_tokens, existing_tokens)
+        diff = generate_diff(flat, existing_tokens)
         summary = generate_summary(diff)
     else:
         # No existing tokens - all are new
-        flat = flatten_tokens(dtcg_tokens)
         diff = {
             'added': [
                 {
@@ -312,16 +262,7 @@ def extract_tokens(figma_variables: Dict[str, Any],
             'removed': [],
             'unchanged': []
         }
-        summary = {
-            'total_new_tokens': len(flat),
-            'total_existing_tokens': 0,
-            'added_count': len(flat),
-            'modified_count': 0,
-            'removed_count': 0,
-            'unchanged_count': 0,
-            'sync_status': 'initial_extraction',
-            'drift_percentage': '0.0%'
-        }
+        summary = initial_summary(len(flat))
 
     return {
         'dtcg_tokens': dtcg_tokens,
@@ -330,6 +271,43 @@ def extract_tokens(figma_variables: Dict[str, Any],
     }
 
 
+def initial_summary(token_count: int) -> Dict[str, Any]:
+    """Summary for a first extraction with no existing tokens."""
+    return {
+        'total_new_tokens': token_count,
+        'total_existing_tokens': 0,
+        'added_count': token_count,
+        'modified_count': 0,
+        'removed_count': 0,
+        'unchanged_count': 0,
+        'sync_status': 'initial_extraction',
+        'drift_percentage': '0.0%'
+    }
+
+
+def _extract_incremental(dtcg_tokens: Dict[str, Any],
+                         flat: TokenSet,
+                         existing_tokens: Union[Dict[str, Any], TokenSet, None],
+                         existing_snapshot: Optional[TokenSnapshot]) -> Dict[str, Any]:
+    new_snapshot = TokenSnapshot.from_tokens(flat)
+    if existing_snapshot is None:
+        existing_snapshot = TokenSnapshot.from_tokens(existing_tokens or {})
+
+    changes = list(iter_changes(new_snapshot, existing_snapshot))
+    diff = incremental_diff(new_snapshot, existing_snapshot, changes)
+    if len(existing_snapshot):
+        summary = generate_summary(diff)
+    else:
+        summary = initial_summary(len(new_snapshot))
+
+    return {
+        'dtcg_tokens': dtcg_tokens,
+        'diff': diff,
+        'summary': summary,
+        'patch': json_patch(new_snapshot, existing_snapshot, changes)
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Extract design tokens from Figma and convert to DTCG format'
@@ -349,12 +327,23 @@ def main():
     )
     parser.add_argument(
         '--format',
-        choices=['full', 'tokens-only', 'diff-only'],
+        choices=['full', 'tokens-only', 'diff-only', 'patch'],
         default='full',
-        help='Output format (default: full)'
+        help='Output format (default: full; patch is an RFC 6902 JSON patch for --existing-tokens)'
+    )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Report only changed tokens, reusing a persisted snapshot of --existing-tokens'
+    )
+    parser.add_argument(
+        '--snapshot-dir',
+        default=SNAPSHOT_DIR,
+        help=f'Where token snapshots are persisted (default: {SNAPSHOT_DIR}, when .agent/ exists)'
     )
 
     args = parser.parse_args()
+    incremental = args.incremental or args.format == 'patch'
 
     # Load Figma variables
     with open(args.figma_variables, 'r') as f:
@@ -362,15 +351,20 @@ def main():
 
     # Load existing tokens if provided
     existing_tokens = None
-    if args.existing_tokens:
+    existing_snapshot = None
+    if args.existing_tokens and incremental:
+        existing_snapshot, _ = snapshot_file(args.existing_tokens, args.snapshot_dir)
+    elif args.existing_tokens:
         with open(args.existing_tokens, 'r') as f:
             existing_tokens = json.load(f)
 
     # Run extraction
-    results = extract_tokens(figma_variables, existing_tokens)
+    results = extract_tokens(figma_variables, existing_tokens, incremental, existing_snapshot)
 
     # Format output based on --format flag
-    if args.format == 'tokens-only':
+    if args.format == 'patch':
+        output = results['patch']
+    elif args.format == 'tokens-only':
         output = results['dtcg_tokens']
     elif args.format == 'diff-only':
         output = {
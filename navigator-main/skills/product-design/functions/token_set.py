@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Flattened design-token model shared by the product-design functions.
+
+TokenSet flattens nested DTCG tokens once, with an explicit stack instead
+of recursion, into interned dot-notation paths with O(1) lookup. Stages that
+take token dicts also accept a TokenSet, so a run can flatten each token
+source once and hand the same instance to every stage.
+
+normalize_token_name() maps Figma variable names to DTCG paths through a
+precompiled keyword -> type table, one dict lookup per name part.
+"""
+
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+# Name keywords per token type, in precedence order: when a name contains
+# keywords of several types, the earliest type wins
+TYPE_KEYWORDS = (
+    ('color', ('color', 'colour')),
+    ('spacing', ('spacing', 'space', 'gap', 'padding', 'margin')),
+    ('typography', ('font', 'typography', 'text')),
+    ('radius', ('radius', 'border')),
+    ('shadow', ('shadow', 'elevation')),
+)
+
+# keyword -> (precedence, token type)
+KEYWORD_TYPES: Dict[str, Tuple[int, str]] = {
+    keyword: (precedence, token_type)
+    for precedence, (token_type, keywords) in enumerate(TYPE_KEYWORDS)
+    for keyword in keywords
+}
+
+# Type inferred from the first name part when no keyword matches
+FIRST_PART_TYPES = {
+    **dict.fromkeys(('primary', 'secondary', 'success', 'error', 'warning', 'info'), 'color'),
+    **dict.fromkeys(('xs', 'sm', 'md', 'lg', 'xl', '2xl', '3xl'), 'spacing'),
+}
+
+_SEPARATORS = str.maketrans('-_', '  ')
+
+
+def normalize_token_name(figma_name: str) -> str:
+    """
+    Normalize Figma variable name to DTCG semantic naming.
+
+    Examples:
+        "Primary 500" → "color.primary.500"
+        "Spacing MD" → "spacing.md"
+        "Font Heading Large" → "typography.heading.large"
+
+    Args:
+        figma_name: Original Figma variable name
+
+    Returns:
+        Normalized DTCG token path (interned)
+    """
+    parts = figma_name.lower().translate(_SEPARATORS).split()
+
+    best = None
+    for part in parts:
+        match = KEYWORD_TYPES.get(part)
+        if match is not None and (best is None or match[0] < best[0]):
+            best = match
+
+    if best is not None:
+        token_type = best[1]
+        # Drop only the winning type's keywords
+        parts = [p for p in parts if KEYWORD_TYPES.get(p, (None, None))[1] != token_type]
+    else:
+        token_type = FIRST_PART_TYPES.get(parts[0], 'other') if parts else 'other'
+
+    return sys.intern(f"{token_type}.{'.'.join(parts)}" if parts else token_type)
+
+
+class TokenSet:
+    """Flattened DTCG tokens: interned dot paths -> token definitions, in document order."""
+
+    __slots__ = ('tokens', '_groups')
+
+    def __init__(self, tokens: Dict[str, Dict[str, Any]]):
+        """
+        Args:
+            tokens: Flat path -> token definition mapping (use from_tokens for nested DTCG)
+        """
+        self.tokens = tokens
+        self._groups: Optional[Dict[str, List[str]]] = None
+
+    @classmethod
+    def from_tokens(cls, tokens: Dict[str, Any]) -> 'TokenSet':
+        """
+        Flatten nested DTCG tokens without recursion.
+
+        Args:
+            tokens: Nested DTCG token structure
+
+        Returns:
+            TokenSet in the same order as a recursive depth-first flatten
+        """
+        flat: Dict[str, Dict[str, Any]] = {}
+        intern = sys.intern
+        stack = [('', iter(tokens.items()))]
+        while stack:
+            prefix, items = stack[-1]
+            for key, value in items:
+                if not isinstance(value, dict):
+                    continue
+                path = intern(f"{prefix}.{key}" if prefix else key)
+                if '$value' in value:
+                    flat[path] = value
+                else:
+                    # Descend now; this group's iterator resumes once the child is done
+                    stack.append((path, iter(value.items())))
+                    break
+            else:
+                stack.pop()
+        return cls(flat)
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self.tokens
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.tokens)
+
+    def __getitem__(self, path: str) -> Dict[str, Any]:
+        return self.tokens[path]
+
+    def get(self, path: str, default: Any = None) -> Any:
+        return self.tokens.get(path, default)
+
+    def keys(self):
+        return self.tokens.keys()
+
+    def items(self):
+        return self.tokens.items()
+
+    def value(self, path: str) -> Any:
+        """$value of a token, or None if absent."""
+        token = self.tokens.get(path)
+        return token.get('$value') if token is not None else None
+
+    def group(self, name: str) -> List[str]:
+        """Paths under a top-level group (e.g. 'color' for color.*), in document order."""
+        if self._groups is None:
+            groups: Dict[str, List[str]] = {}
+            for path in self.tokens:
+                head, dot, _ = path.partition('.')
+                if dot:
+                    groups.setdefault(head, []).append(path)
+            self._groups = groups
+        return self._groups.get(name, [])
+
+
+def as_token_set(tokens: Union[Dict[str, Any], TokenSet, None]) -> TokenSet:
+    """Reuse a TokenSet as is, or flatten nested DTCG tokens into one."""
+    if isinstance(tokens, TokenSet):
+        return tokens
+    return TokenSet.from_tokens(tokens or {})
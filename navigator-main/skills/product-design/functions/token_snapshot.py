@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Flattened design-token snapshots with per-token content hashes.
+
+A snapshot maps each dot-notation token path to (hash of its $value, token).
+Snapshots of token files are persisted under .agent/cache/tokens/ keyed by
+the file's path, mtime and size, so an unchanged design-tokens.json is never
+reflattened. Diffing compares hashes and only materializes changed tokens;
+unchanged ones are just counted. Changes can be emitted as an RFC 6902 JSON
+patch against the existing token file.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from token_set import TokenSet, as_token_set
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_DIR = os.path.join('.agent', 'cache', 'tokens')
+
+
+def value_hash(value: Any) -> str:
+    """Stable short hash of a token $value."""
+    if isinstance(value, str):
+        # Scalars (most tokens) skip JSON encoding; the tag keeps "1" != 1
+        canonical = f"s:{value}"
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        # 1 and 1.0 compare equal in generate_diff, so they hash equal too
+        canonical = f"n:{float(value)!r}"
+    else:
+        canonical = json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=8).hexdigest()
+
+
+class TokenSnapshot:
+    """Flattened tokens: path -> (value hash, token definition)."""
+
+    def __init__(self, entries: Dict[str, Tuple[str, Dict[str, Any]]]):
+        self.entries = entries
+        self._digest: Optional[str] = None
+
+    @classmethod
+    def from_tokens(cls, tokens: Union[Dict[str, Any], TokenSet]) -> 'TokenSnapshot':
+        """Hash each $value of nested DTCG tokens or an already flattened TokenSet."""
+        return cls({path: (value_hash(token['$value']), token)
+                    for path, token in as_token_set(tokens).items()})
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def digest(self) -> str:
+        """Hash over every (path, value hash); equal digests mean no changes."""
+        if self._digest is None:
+            h = hashlib.blake2b(digest_size=16)
+            for path in sorted(self.entries):
+                h.update(f"{path}\0{self.entries[path][0]}\n".encode('utf-8'))
+            self._digest = h.hexdigest()
+        return self._digest
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            'version': SNAPSHOT_VERSION,
+            'digest': self.digest,
+            'tokens': {path: [h, token] for path, (h, token) in self.entries.items()},
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> Optional['TokenSnapshot']:
+        if data.get('version') != SNAPSHOT_VERSION:
+            return None
+        snapshot = cls({path: (h, token) for path, (h, token) in data.get('tokens', {}).items()})
+        snapshot._digest = data.get('digest')
+        return snapshot
+
+
+def _snapshot_path(tokens_path: str, snapshot_dir: str) -> str:
+    key = hashlib.sha256(os.path.abspath(tokens_path).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(snapshot_dir, f"{key}.json")
+
+
+def snapshot_file(tokens_path: str, snapshot_dir: Optional[str] = SNAPSHOT_DIR) -> Tuple[TokenSnapshot, bool]:
+    """
+    Snapshot of a DTCG token file, reused while the file is unchanged.
+
+    Args:
+        tokens_path: Path to design-tokens.json (or any DTCG file)
+        snapshot_dir: Where snapshots are persisted (None disables persistence;
+            the default is only used when .agent/ exists in the working directory)
+
+    Returns:
+        (snapshot, reused) - reused is True if it came from the persisted cache
+    """
+    st = os.stat(tokens_path)
+    signature = [st.st_mtime_ns, st.st_size]
+
+    persist = snapshot_dir is not None and (snapshot_dir != SNAPSHOT_DIR or os.path.isdir('.agent'))
+    cache_path = _snapshot_path(tokens_path, snapshot_dir) if persist else None
+
+    if cache_path:
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('source') == signature:
+                snapshot = TokenSnapshot.from_json(data)
+                if snapshot is not None:
+                    return snapshot, True
+        except (OSError, ValueError):
+            pass
+
+    with open(tokens_path, 'r', encoding='utf-8') as f:
+        snapshot = TokenSnapshot.from_tokens(json.load(f))
+
+    if cache_path:
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(dict(snapshot.to_json(), source=signature), f, separators=(',', ':'))
+            os.replace(temp_path, cache_path)
+        except OSError:
+            pass
+
+    return snapshot, False
+
+
+def iter_changes(new: TokenSnapshot, old: TokenSnapshot) -> Iterator[Tuple[str, str, Optional[Dict], Optional[Dict]]]:
+    """
+    Changed tokens only, compared by value hash.
+
+    Yields:
+        (kind, path, new_token, old_token) with kind 'added', 'modified' or 'removed'
+    """
+    if new._digest is not None and new._digest == old._digest:
+        # Both digests known (e.g. loaded snapshots): identical token sets
+        return
+
+    old_entries = old.entries
+    for path, (h, token) in new.entries.items():
+        previous = old_entries.get(path)
+        if previous is None:
+            yield 'added', path, token, None
+        elif previous[0] != h:
+            yield 'modified', path, token, previous[1]
+
+    new_entries = new.entries
+    for path, (_, token) in old_entries.items():
+        if path not in new_entries:
+            yield 'removed', path, None, token
+
+
+Change = Tuple[str, str, Optional[Dict], Optional[Dict]]
+
+
+def incremental_diff(new: TokenSnapshot, old: TokenSnapshot,
+                     changes: Optional[List[Change]] = None) -> Dict[str, Any]:
+    """
+    Diff in generate_diff's shape, minus the unchanged list.
+
+    Args:
+        new: Snapshot of the new tokens
+        old: Snapshot of the existing tokens
+        changes: Precomputed iter_changes(new, old) output, to share one pass
+            with json_patch
+
+    Returns:
+        {'added', 'modified', 'removed', 'unchanged_count'}
+    """
+    diff: Dict[str, Any] = {'added': [], 'modified': [], 'removed': []}
+    for kind, path, token, previous in (iter_changes(new, old) if changes is None else changes):
+        if kind == 'added':
+            diff['added'].append({'path': path, 'value': token.get('$value'), 'type': token.get('$type')})
+        elif kind == 'modified':
+            diff['modified'].append({
+                'path': path,
+                'old_value': previous.get('$value'),
+                'new_value': token.get('$value'),
+                'type': token.get('$type')
+            })
+        else:
+            diff['removed'].append({'path': path, 'value': previous.get('$value'), 'type': previous.get('$type')})
+
+    diff['unchanged_count'] = len(new) - len(diff['added']) - len(diff['modified'])
+    return diff
+
+
+def _pointer(parts: List[str]) -> str:
+    return ''.join('/' + part.replace('~', '~0').replace('/', '~1') for part in parts)
+
+
+def json_patch(new: TokenSnapshot, old: TokenSnapshot,
+               changes: Optional[List[Change]] = None) -> List[Dict[str, Any]]:
+    """
+    RFC 6902 patch turning the old token file into the new token set.
+
+    Added tokens under groups that don't exist yet are added as one nested
+    group, so every "add" targets an existing parent. Removes come first, so
+    a token that became a group (or the reverse) is removed before its
+    replacement is added at the same pointer.
+
+    Args:
+        new: Snapshot of the new tokens
+        old: Snapshot of the existing tokens
+        changes: Precomputed iter_changes(new, old) output
+
+    Returns:
+        List of patch operations
+    """
+    existing_groups = {''}
+    for path in old.entries:
+        group = path.rpartition('.')[0]
+        while group not in existing_groups:
+            existing_groups.add(group)
+            group = group.rpartition('.')[0]
+
+    removes: List[Dict[str, Any]] = []
+    patch: List[Dict[str, Any]] = []
+    new_groups: Dict[str, Dict[str, Any]] = {}
+
+    for kind, path, token, _ in (iter_changes(new, old) if changes is None else changes):
+        parts = path.split('.')
+        if kind == 'modified':
+            patch.append({'op': 'replace', 'path': _pointer(parts), 'value': token})
+        elif kind == 'removed':
+            removes.append({'op': 'remove', 'path': _pointer(parts)})
+        else:
+            # Shallowest missing ancestor becomes a single nested "add"
+            depth = 1
+            while depth < len(parts) and '.'.join(parts[:depth]) in existing_groups:
+                depth += 1
+            if depth == len(parts):
+                patch.append({'op': 'add', 'path': _pointer(parts), 'value': token})
+                continue
+            group_path = '.'.join(parts[:depth])
+            group = new_groups.get(group_path)
+            if group is None:
+                group = new_groups[group_path] = {}
+                patch.append({'op': 'add', 'path': _pointer(parts[:depth]), 'value': group})
+            for part in parts[depth:-1]:
+                group = group.setdefault(part, {})
+            group[parts[-1]] = token
+
+    return removes + patch
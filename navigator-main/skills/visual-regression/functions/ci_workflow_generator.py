@@ -14,6 +14,8 @@ import sys
 from pathlib import Path
 from typing import Dict
 
+from vr_setup_validator import load_package_json
+
 
 def detect_node_version(project_root: str) -> str:
     """
@@ -32,20 +34,15 @@ def detect_node_version(project_root: str) -> str:
             return f.read().strip()
 
     # Check package.json engines.node
-    package_json = Path(project_root) / 'package.json'
-    if package_json.exists():
-        with open(package_json, 'r') as f:
-            try:
-                data = json.load(f)
-                node_version = data.get('engines', {}).get('node')
-                if node_version:
-                    # Extract version number (handle ">=18.0.0" format)
-                    import re
-                    match = re.search(r'\d+', node_version)
-                    if match:
-                        return match.group(0)
-            except json.JSONDecodeError:
-                pass
+    data = load_package_json(project_root)
+    if data:
+        node_version = data.get('engines', {}).get('node')
+        if node_version:
+            # Extract version number (handle ">=18.0.0" format)
+            import re
+            match = re.search(r'\d+', node_version)
+            if match:
+                return match.group(0)
 
     return '20'  # Default
 
@@ -7,6 +7,7 @@ with variants, accessibility tests, and interaction tests.
 
 Usage:
     python story_generator.py <component_path> <framework> [template_path]
+    python story_generator.py --missing <project_root> <framework>
 """
 
 import json
@@ -16,6 +17,15 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# Component inventory is shared with the product-design skill (only --missing needs it)
+PRODUCT_DESIGN_FUNCTIONS = Path(__file__).resolve().parents[2] / "product-design" / "functions"
+
+FRAMEWORK_EXTENSIONS = {
+    'react': ['tsx', 'jsx'],
+    'vue': ['vue'],
+    'svelte': ['svelte'],
+}
+
 
 def extract_component_name(file_path: str) -> str:
     """Extract component name from file path."""
@@ -427,23 +437,46 @@ def write_story_file(component_path: str, story_content: str) -> str:
     return str(story_file)
 
 
-def main():
-    """CLI entry point."""
-    if len(sys.argv) < 3:
-        print("Usage: python story_generator.py <component_path> <framework>", file=sys.stderr)
-        sys.exit(1)
+def find_components_without_stories(project_root: str, framework: str) -> List[str]:
+    """
+    Component files that have no sibling *.stories.* file.
 
-    component_path = sys.argv[1]
-    framework = sys.argv[2].lower()
+    Args:
+        project_root: Project root directory
+        framework: react, vue, or svelte
 
-    if framework not in ['react', 'vue', 'svelte']:
-        print(f"Unsupported framework: {framework}. Use: react, vue, or svelte", file=sys.stderr)
-        sys.exit(1)
+    Returns:
+        Component file paths (from the cached component inventory)
 
-    if not os.path.exists(component_path):
-        print(f"Component file not found: {component_path}", file=sys.stderr)
-        sys.exit(1)
+    Raises:
+        ImportError: If the product-design skill is not installed alongside
+    """
+    if str(PRODUCT_DESIGN_FUNCTIONS) not in sys.path:
+        sys.path.insert(0, str(PRODUCT_DESIGN_FUNCTIONS))
+    try:
+        from component_inventory import find_components
+    except ImportError as e:
+        raise ImportError(
+            f"--missing needs the product-design skill's component_inventory ({PRODUCT_DESIGN_FUNCTIONS})"
+        ) from e
+
+    return [
+        comp['full_path'] for comp in find_components(project_root, FRAMEWORK_EXTENSIONS[framework])
+        if not comp['has_story']
+    ]
+
+
+def generate_story(component_path: str, framework: str) -> Dict:
+    """
+    Analyze a component and write its story file.
 
+    Args:
+        component_path: Path to component file
+        framework: react, vue, or svelte
+
+    Returns:
+        Component info and created story file path
+    """
     # Analyze component
     if framework == 'react':
         component_info = analyze_react_component(component_path)
@@ -462,13 +495,54 @@ def main():
     # Write story file
     story_file_path = write_story_file(component_path, story_content)
 
-    # Output result
-    result = {
+    return {
         'component': component_info,
         'story_file': story_file_path,
-        'success': True
     }
 
+
+def main():
+    """CLI entry point."""
+    missing = len(sys.argv) > 1 and sys.argv[1] == '--missing'
+    args = sys.argv[2:] if missing else sys.argv[1:]
+
+    if len(args) < 2:
+        print("Usage: python story_generator.py [--missing] <component_path|project_root> <framework>",
+              file=sys.stderr)
+        sys.exit(1)
+
+    component_path = args[0]
+    framework = args[1].lower()
+
+    if framework not in ['react', 'vue', 'svelte']:
+        print(f"Unsupported framework: {framework}. Use: react, vue, or svelte", file=sys.stderr)
+        sys.exit(1)
+
+    if missing and not os.path.isdir(component_path):
+        print(f"Project root not found: {component_path}", file=sys.stderr)
+        sys.exit(1)
+
+    if not missing and not os.path.exists(component_path):
+        print(f"Component file not found: {component_path}", file=sys.stderr)
+        sys.exit(1)
+
+    if missing:
+        # Stories for every component in the project that doesn't have one yet
+        try:
+            paths = find_components_without_stories(component_path, framework)
+        except ImportError as e:
+            print(str(e), file=sys.stderr)
+            sys.exit(1)
+        stories = [generate_story(path, framework) for path in paths]
+        result = {
+            'stories': stories,
+            'count': len(stories),
+            'success': True
+        }
+    else:
+        result = generate_story(component_path, framework)
+        result['success'] = True
+
     print(json.dumps(result, indent=2))
 
 
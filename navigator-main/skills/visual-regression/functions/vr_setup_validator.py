@@ -12,10 +12,38 @@ Usage:
 import json
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 
 
+@lru_cache(maxsize=8)
+def _read_package_json(path: str, mtime_ns: int) -> Optional[Dict]:
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (json.JSONDecodeError, FileNotFoundError):
+        return None
+
+
+def load_package_json(project_root: str) -> Optional[Dict]:
+    """
+    Load package.json once per process (re-read only if it changes).
+
+    Args:
+        project_root: Path to project root directory
+
+    Returns:
+        Parsed package.json (treat as read-only) or None if missing/invalid
+    """
+    package_json_path = Path(project_root).resolve() / 'package.json'
+    try:
+        mtime_ns = package_json_path.stat().st_mtime_ns
+    except OSError:
+        return None
+    return _read_package_json(str(package_json_path), mtime_ns)
+
+
 def detect_framework(project_root: str) -> Optional[str]:
     """
     Detect frontend framework from package.json dependencies.
@@ -26,30 +54,24 @@ def detect_framework(project_root: str) -> Optional[str]:
     Returns:
         Framework name ('react', 'vue', 'svelte') or None
     """
-    package_json_path = Path(project_root) / 'package.json'
+    package_data = load_package_json(project_root)
 
-    if not package_json_path.exists():
+    if package_data is None:
         return None
 
-    try:
-        with open(package_json_path, 'r') as f:
-            package_data = json.load(f)
-
-        dependencies = {
-            **package_data.get('dependencies', {}),
-            **package_data.get('devDependencies', {})
-        }
+    dependencies = {
+        **package_data.get('dependencies', {}),
+        **package_data.get('devDependencies', {})
+    }
 
-        if 'react' in dependencies:
-            return 'react'
-        elif 'vue' in dependencies:
-            return 'vue'
-        elif 'svelte' in dependencies:
-            return 'svelte'
+    if 'react' in dependencies:
+        return 'react'
+    elif 'vue' in dependencies:
+        return 'vue'
+    elif 'svelte' in dependencies:
+        return 'svelte'
 
-        return None
-    except (json.JSONDecodeError, FileNotFoundError):
-        return None
+    return None
 
 
 def detect_storybook_config(project_root: str) -> Dict:
@@ -63,7 +85,6 @@ def detect_storybook_config(project_root: str) -> Dict:
         Dict with version, addons, framework, and config path
     """
     storybook_dir = Path(project_root) / '.storybook'
-    package_json_path = Path(project_root) / 'package.json'
 
     result = {
         'installed': False,
@@ -91,29 +112,24 @@ def detect_storybook_config(project_root: str) -> Dict:
         result['main_js_path'] = str(main_ts)
 
     # Extract version from package.json
-    if package_json_path.exists():
-        try:
-            with open(package_json_path, 'r') as f:
-                package_data = json.load(f)
-
-            dependencies = {
-                **package_data.get('dependencies', {}),
-                **package_data.get('devDependencies', {})
-            }
-
-            # Find Storybook version
-            for dep in dependencies:
-                if dep.startswith('@storybook/'):
-                    result['version'] = dependencies[dep].replace('^', '').replace('~', '')
-                    break
-
-            # Extract addons from dependencies
-            result['addons'] = [
-                dep for dep in dependencies.keys()
-                if dep.startswith('@storybook/addon-') or dep == '@chromatic-com/storybook'
-            ]
-        except (json.JSONDecodeError, FileNotFoundError):
-            pass
+    package_data = load_package_json(project_root)
+    if package_data is not None:
+        dependencies = {
+            **package_data.get('dependencies', {}),
+            **package_data.get('devDependencies', {})
+        }
+
+        # Find Storybook version
+        for dep in dependencies:
+            if dep.startswith('@storybook/'):
+                result['version'] = dependencies[dep].replace('^', '').replace('~', '')
+                break
+
+        # Extract addons from dependencies
+        result['addons'] = [
+            dep for dep in dependencies.keys()
+            if dep.startswith('@storybook/addon-') or dep == '@chromatic-com/storybook'
+        ]
 
     # Try to parse main.js for framework
     if result['main_js_path']:
@@ -142,30 +158,24 @@ def detect_vr_tool(project_root: str) -> Optional[str]:
     Returns:
         Tool name ('chromatic', 'percy', 'backstopjs') or None
     """
-    package_json_path = Path(project_root) / 'package.json'
+    package_data = load_package_json(project_root)
 
-    if not package_json_path.exists():
+    if package_data is None:
         return None
 
-    try:
-        with open(package_json_path, 'r') as f:
-            package_data = json.load(f)
-
-        dependencies = {
-            **package_data.get('dependencies', {}),
-            **package_data.get('devDependencies', {})
-        }
+    dependencies = {
+        **package_data.get('dependencies', {}),
+        **package_data.get('devDependencies', {})
+    }
 
-        if 'chromatic' in dependencies or '@chromatic-com/storybook' in dependencies:
-            return 'chromatic'
-        elif '@percy/cli' in dependencies or '@percy/storybook' in dependencies:
-            return 'percy'
-        elif 'backstopjs' in dependencies:
-            return 'backstopjs'
+    if 'chromatic' in dependencies or '@chromatic-com/storybook' in dependencies:
+        return 'chromatic'
+    elif '@percy/cli' in dependencies or '@percy/storybook' in dependencies:
+        return 'percy'
+    elif 'backstopjs' in dependencies:
+        return 'backstopjs'
 
-        return None
-    except (json.JSONDecodeError, FileNotFoundError):
-        return None
+    return None
 
 
 def detect_ci_platform(project_root: str) -> Optional[str]:
@@ -272,38 +282,36 @@ def check_dependencies(project_root: str, vr_tool: Optional[str] = 'chromatic')
         result['missing'] = ['package.json not found']
         return result
 
-    try:
-        with open(package_json_path, 'r') as f:
-            package_data = json.load(f)
-
-        dependencies = {
-            **package_data.get('dependencies', {}),
-            **package_data.get('devDependencies', {})
-        }
-
-        # Core Storybook dependencies
-        required_deps = [
-            '@storybook/addon-essentials',
-            '@storybook/addon-interactions',
-        ]
+    package_data = load_package_json(project_root)
+    if package_data is None:
+        result['missing'] = ['Error reading package.json']
+        return result
 
-        # Add VR tool specific dependencies
-        if vr_tool == 'chromatic':
-            required_deps.extend(['chromatic', '@chromatic-com/storybook'])
-        elif vr_tool == 'percy':
-            required_deps.extend(['@percy/cli', '@percy/storybook'])
-        elif vr_tool == 'backstopjs':
-            required_deps.append('backstopjs')
-
-        # Check each dependency
-        for dep in required_deps:
-            if dep in dependencies:
-                result['installed'].append(dep)
-            else:
-                result['missing'].append(dep)
+    dependencies = {
+        **package_data.get('dependencies', {}),
+        **package_data.get('devDependencies', {})
+    }
 
-    except (json.JSONDecodeError, FileNotFoundError):
-        result['missing'] = ['Error reading package.json']
+    # Core Storybook dependencies
+    required_deps = [
+        '@storybook/addon-essentials',
+        '@storybook/addon-interactions',
+    ]
+
+    # Add VR tool specific dependencies
+    if vr_tool == 'chromatic':
+        required_deps.extend(['chromatic', '@chromatic-com/storybook'])
+    elif vr_tool == 'percy':
+        required_deps.extend(['@percy/cli', '@percy/storybook'])
+    elif vr_tool == 'backstopjs':
+        required_deps.append('backstopjs')
+
+    # Check each dependency
+    for dep in required_deps:
+        if dep in dependencies:
+            result['installed'].append(dep)
+        else:
+            result['missing'].append(dep)
 
     return result
 
@@ -11,6 +11,9 @@ import re
 from pathlib import Path
 from typing import Dict, Optional
 
+from dependency_index import build_dependency_index
+from project_fingerprint import ProjectFingerprint, fingerprint_project
+
 
 def detect_project_info(cwd: str = ".") -> Dict[str, str]:
     """
@@ -26,6 +29,7 @@ def detect_project_info(cwd: str = ".") -> Dict[str, str]:
         - detected_from: Source file used for detection
     """
     cwd_path = Path(cwd).resolve()
+    fingerprint = fingerprint_project(str(cwd_path))
 
     # Try detection methods in order
     detectors = [
@@ -38,7 +42,7 @@ def detect_project_info(cwd: str = ".") -> Dict[str, str]:
     ]
 
     for detector in detectors:
-        result = detector(cwd_path)
+        result = detector(fingerprint, cwd_path)
         if result:
             return result
 
@@ -50,237 +54,223 @@ def detect_project_info(cwd: str = ".") -> Dict[str, str]:
     }
 
 
-def _detect_from_package_json(cwd: Path) -> Optional[Dict[str, str]]:
+def _detect_from_package_json(fp: ProjectFingerprint, cwd: Path) -> Optional[Dict[str, str]]:
     """Detect from package.json (Node.js/JavaScript)."""
-    package_json = cwd / "package.json"
-    if not package_json.exists():
+    manifest = fp.get("package.json")
+    if manifest is None or manifest.data is None:
         return None
 
-    try:
-        with open(package_json) as f:
-            data = json.load(f)
-
-        name = data.get("name", cwd.name)
-        deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
-
-        # Detect framework/stack
-        stack_parts = []
-
-        if "next" in deps:
-            stack_parts.append("Next.js")
-        elif "react" in deps:
-            stack_parts.append("React")
-        elif "vue" in deps:
-            stack_parts.append("Vue")
-        elif "angular" in deps:
-            stack_parts.append("Angular")
-        elif "svelte" in deps:
-            stack_parts.append("Svelte")
-        elif "express" in deps:
-            stack_parts.append("Express")
-        elif "fastify" in deps:
-            stack_parts.append("Fastify")
-
-        if "typescript" in deps:
-            stack_parts.append("TypeScript")
-
-        if "prisma" in deps:
-            stack_parts.append("Prisma")
-        elif "mongoose" in deps:
-            stack_parts.append("MongoDB")
-        elif "pg" in deps or "postgres" in deps:
-            stack_parts.append("PostgreSQL")
-
-        tech_stack = ", ".join(stack_parts) if stack_parts else "Node.js"
-
-        return {
-            "name": name,
-            "tech_stack": tech_stack,
-            "detected_from": "package.json",
-        }
-    except (json.JSONDecodeError, IOError):
-        return None
+    data = manifest.data
+    name = data.get("name", cwd.name)
+    deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
+
+    # Detect framework/stack
+    stack_parts = []
+
+    if "next" in deps:
+        stack_parts.append("Next.js")
+    elif "react" in deps:
+        stack_parts.append("React")
+    elif "vue" in deps:
+        stack_parts.append("Vue")
+    elif "angular" in deps:
+        stack_parts.append("Angular")
+    elif "svelte" in deps:
+        stack_parts.append("Svelte")
+    elif "express" in deps:
+        stack_parts.append("Express")
+    elif "fastify" in deps:
+        stack_parts.append("Fastify")
+
+    if "typescript" in deps:
+        stack_parts.append("TypeScript")
+
+    if "prisma" in deps:
+        stack_parts.append("Prisma")
+    elif "mongoose" in deps:
+        stack_parts.append("MongoDB")
+    elif "pg" in deps or "postgres" in deps:
+        stack_parts.append("PostgreSQL")
+
+    tech_stack = ", ".join(stack_parts) if stack_parts else "Node.js"
+
+    return {
+        "name": name,
+        "tech_stack": tech_stack,
+        "detected_from": "package.json",
+    }
 
 
-def _detect_from_pyproject_toml(cwd: Path) -> Optional[Dict[str, str]]:
+def _detect_from_pyproject_toml(fp: ProjectFingerprint, cwd: Path) -> Optional[Dict[str, str]]:
     """Detect from pyproject.toml (Python)."""
-    pyproject = cwd / "pyproject.toml"
-    if not pyproject.exists():
+    manifest = fp.get("pyproject.toml")
+    if manifest is None:
         return None
 
-    try:
-        content = pyproject.read_text()
+    content = manifest.text
+    deps = build_dependency_index(fp, include_lockfiles=False).names("pypi")
 
-        # Extract name
+    # Extract name
+    data = manifest.data or {}
+    name = data.get("project", {}).get("name") or data.get("tool", {}).get("poetry", {}).get("name")
+    if not name:
         name_match = re.search(r'name\s*=\s*["\']([^"\']+)["\']', content)
         name = name_match.group(1) if name_match else cwd.name
 
-        # Detect framework/stack
-        stack_parts = []
-
-        if "fastapi" in content.lower():
-            stack_parts.append("FastAPI")
-        elif "django" in content.lower():
-            stack_parts.append("Django")
-        elif "flask" in content.lower():
-            stack_parts.append("Flask")
-
-        if "sqlalchemy" in content.lower():
-            stack_parts.append("SQLAlchemy")
-        if "pydantic" in content.lower():
-            stack_parts.append("Pydantic")
-        if "pytest" in content.lower():
-            stack_parts.append("Pytest")
-
-        tech_stack = ", ".join(stack_parts) if stack_parts else "Python"
-
-        return {
-            "name": name,
-            "tech_stack": tech_stack,
-            "detected_from": "pyproject.toml",
-        }
-    except IOError:
-        return None
+    # Detect framework/stack
+    stack_parts = []
+
+    if "fastapi" in deps:
+        stack_parts.append("FastAPI")
+    elif "django" in deps:
+        stack_parts.append("Django")
+    elif "flask" in deps:
+        stack_parts.append("Flask")
+
+    if "sqlalchemy" in deps:
+        stack_parts.append("SQLAlchemy")
+    if "pydantic" in deps:
+        stack_parts.append("Pydantic")
+    if "pytest" in deps:
+        stack_parts.append("Pytest")
 
+    tech_stack = ", ".join(stack_parts) if stack_parts else "Python"
 
-def _detect_from_go_mod(cwd: Path) -> Optional[Dict[str, str]]:
+    return {
+        "name": name,
+        "tech_stack": tech_stack,
+        "detected_from": "pyproject.toml",
+    }
+
+
+def _detect_from_go_mod(fp: ProjectFingerprint, cwd: Path) -> Optional[Dict[str, str]]:
     """Detect from go.mod (Go)."""
-    go_mod = cwd / "go.mod"
-    if not go_mod.exists():
+    manifest = fp.get("go.mod")
+    if manifest is None:
         return None
 
-    try:
-        content = go_mod.read_text()
+    deps = build_dependency_index(fp, include_lockfiles=False).names("go")
 
-        # Extract module name
-        module_match = re.search(r'module\s+([^\s]+)', content)
-        name = module_match.group(1).split("/")[-1] if module_match else cwd.name
+    # Extract module name
+    module = (manifest.data or {}).get("module")
+    name = module.split("/")[-1] if module else cwd.name
 
-        # Detect framework/stack
-        stack_parts = ["Go"]
+    # Detect framework/stack
+    stack_parts = ["Go"]
 
-        if "gin-gonic/gin" in content:
-            stack_parts.append("Gin")
-        elif "gorilla/mux" in content:
-            stack_parts.append("Gorilla Mux")
-        elif "fiber" in content:
-            stack_parts.append("Fiber")
+    if "github.com/gin-gonic/gin" in deps:
+        stack_parts.append("Gin")
+    elif "github.com/gorilla/mux" in deps:
+        stack_parts.append("Gorilla Mux")
+    elif "github.com/gofiber/fiber" in deps:
+        stack_parts.append("Fiber")
 
-        if "gorm" in content:
-            stack_parts.append("GORM")
+    if "gorm.io/gorm" in deps:
+        stack_parts.append("GORM")
 
-        tech_stack = ", ".join(stack_parts)
+    tech_stack = ", ".join(stack_parts)
 
-        return {
-            "name": name,
-            "tech_stack": tech_stack,
-            "detected_from": "go.mod",
-        }
-    except IOError:
-        return None
+    return {
+        "name": name,
+        "tech_stack": tech_stack,
+        "detected_from": "go.mod",
+    }
 
 
-def _detect_from_cargo_toml(cwd: Path) -> Optional[Dict[str, str]]:
+def _detect_from_cargo_toml(fp: ProjectFingerprint, cwd: Path) -> Optional[Dict[str, str]]:
     """Detect from Cargo.toml (Rust)."""
-    cargo_toml = cwd / "Cargo.toml"
-    if not cargo_toml.exists():
+    manifest = fp.get("Cargo.toml")
+    if manifest is None:
         return None
 
-    try:
-        content = cargo_toml.read_text()
+    content = manifest.text
+    deps = build_dependency_index(fp, include_lockfiles=False).names("cargo")
 
-        # Extract name
+    # Extract name
+    name = (manifest.data or {}).get("package", {}).get("name")
+    if not name:
         name_match = re.search(r'name\s*=\s*["\']([^"\']+)["\']', content)
         name = name_match.group(1) if name_match else cwd.name
 
-        # Detect framework/stack
-        stack_parts = ["Rust"]
-
-        if "actix-web" in content:
-            stack_parts.append("Actix Web")
-        elif "rocket" in content:
-            stack_parts.append("Rocket")
-        elif "axum" in content:
-            stack_parts.append("Axum")
-
-        if "diesel" in content:
-            stack_parts.append("Diesel")
-        elif "sqlx" in content:
-            stack_parts.append("SQLx")
-
-        tech_stack = ", ".join(stack_parts)
-
-        return {
-            "name": name,
-            "tech_stack": tech_stack,
-            "detected_from": "Cargo.toml",
-        }
-    except IOError:
-        return None
+    # Detect framework/stack
+    stack_parts = ["Rust"]
+
+    if "actix-web" in deps:
+        stack_parts.append("Actix Web")
+    elif "rocket" in deps:
+        stack_parts.append("Rocket")
+    elif "axum" in deps:
+        stack_parts.append("Axum")
+
+    if "diesel" in deps:
+        stack_parts.append("Diesel")
+    elif "sqlx" in deps:
+        stack_parts.append("SQLx")
+
+    tech_stack = ", ".join(stack_parts)
+
+    return {
+        "name": name,
+        "tech_stack": tech_stack,
+        "detected_from": "Cargo.toml",
+    }
 
 
-def _detect_from_composer_json(cwd: Path) -> Optional[Dict[str, str]]:
+def _detect_from_composer_json(fp: ProjectFingerprint, cwd: Path) -> Optional[Dict[str, str]]:
     """Detect from composer.json (PHP)."""
-    composer_json = cwd / "composer.json"
-    if not composer_json.exists():
+    manifest = fp.get("composer.json")
+    if manifest is None or manifest.data is None:
         return None
 
-    try:
-        with open(composer_json) as f:
-            data = json.load(f)
+    data = manifest.data
+    name = data.get("name", cwd.name).split("/")[-1]
+    deps = {**data.get("require", {}), **data.get("require-dev", {})}
 
-        name = data.get("name", cwd.name).split("/")[-1]
-        deps = {**data.get("require", {}), **data.get("require-dev", {})}
+    # Detect framework/stack
+    stack_parts = []
 
-        # Detect framework/stack
-        stack_parts = []
+    vendors = {dep.split("/", 1)[0].lower() for dep in deps}
+    if "laravel" in vendors:
+        stack_parts.append("Laravel")
+    elif "symfony" in vendors:
+        stack_parts.append("Symfony")
 
-        if any("laravel" in dep for dep in deps):
-            stack_parts.append("Laravel")
-        elif any("symfony" in dep for dep in deps):
-            stack_parts.append("Symfony")
+    tech_stack = ", ".join(stack_parts) if stack_parts else "PHP"
 
-        tech_stack = ", ".join(stack_parts) if stack_parts else "PHP"
-
-        return {
-            "name": name,
-            "tech_stack": tech_stack,
-            "detected_from": "composer.json",
-        }
-    except (json.JSONDecodeError, IOError):
-        return None
+    return {
+        "name": name,
+        "tech_stack": tech_stack,
+        "detected_from": "composer.json",
+    }
 
 
-def _detect_from_gemfile(cwd: Path) -> Optional[Dict[str, str]]:
+def _detect_from_gemfile(fp: ProjectFingerprint, cwd: Path) -> Optional[Dict[str, str]]:
     """Detect from Gemfile (Ruby)."""
-    gemfile = cwd / "Gemfile"
-    if not gemfile.exists():
+    manifest = fp.get("Gemfile")
+    if manifest is None:
         return None
 
-    try:
-        content = gemfile.read_text()
+    gems = build_dependency_index(fp, include_lockfiles=False).names("gem")
 
-        name = cwd.name
+    name = cwd.name
 
-        # Detect framework/stack
-        stack_parts = []
+    # Detect framework/stack
+    stack_parts = []
 
-        if "rails" in content.lower():
-            stack_parts.append("Ruby on Rails")
-        elif "sinatra" in content.lower():
-            stack_parts.append("Sinatra")
-        else:
-            stack_parts.append("Ruby")
+    if "rails" in gems:
+        stack_parts.append("Ruby on Rails")
+    elif "sinatra" in gems:
+        stack_parts.append("Sinatra")
+    else:
+        stack_parts.append("Ruby")
 
-        tech_stack = ", ".join(stack_parts)
+    tech_stack = ", ".join(stack_parts)
 
-        return {
-            "name": name,
-            "tech_stack": tech_stack,
-            "detected_from": "Gemfile",
-        }
-    except IOError:
-        return None
+    return {
+        "name": name,
+        "tech_stack": tech_stack,
+        "detected_from": "Gemfile",
+    }
 
 
 if __name__ == "__main__":
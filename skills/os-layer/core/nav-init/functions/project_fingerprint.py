@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Project fingerprinting used by nav-init and nav-onboard.
+
+Stats the project root once, reads each manifest at most once and parses it
+with a real parser (json, tomllib). Results are cached per process and keyed
+by manifest mtime/size, so every detector in a run shares one read.
+
+nav-init and nav-onboard each ship a copy of this module (the skills ship
+separately, so neither imports the other). Keep the two copies identical.
+"""
+
+import json
+import os
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+
+# Manifest files that identify a project's language and dependencies
+MANIFESTS = (
+    "package.json",
+    "pyproject.toml",
+    "go.mod",
+    "Cargo.toml",
+    "composer.json",
+    "Gemfile",
+)
+
+# Files and directories whose presence (not content) matters to detectors
+MARKERS = (
+    ".agent",
+    ".storybook",
+    ".nvmrc",
+    "package-lock.json",
+    "pnpm-lock.yaml",
+    "yarn.lock",
+    "poetry.lock",
+    "uv.lock",
+    "Cargo.lock",
+    "go.sum",
+    "go.work",
+    "pnpm-workspace.yaml",
+    "composer.lock",
+    "Gemfile.lock",
+)
+
+
+@dataclass(frozen=True)
+class Manifest:
+    """A manifest file read once and parsed."""
+
+    name: str
+    path: str
+    mtime: float
+    size: int
+    text: str
+    data: Optional[Dict[str, Any]]
+
+
+@dataclass
+class ProjectFingerprint:
+    """Everything detectors need to know about a project root."""
+
+    root: str
+    manifests: Dict[str, Manifest] = field(default_factory=dict)
+    markers: Dict[str, bool] = field(default_factory=dict)
+
+    def has(self, name: str) -> bool:
+        """True if the manifest or marker exists in the project root."""
+        return name in self.manifests or self.markers.get(name, False)
+
+    def get(self, name: str) -> Optional[Manifest]:
+        return self.manifests.get(name)
+
+    def data(self, name: str) -> Dict[str, Any]:
+        """Parsed manifest data ({} if missing or unparseable)."""
+        manifest = self.manifests.get(name)
+        return (manifest.data or {}) if manifest else {}
+
+    def text(self, name: str) -> str:
+        """Raw manifest text ("" if missing)."""
+        manifest = self.manifests.get(name)
+        return manifest.text if manifest else ""
+
+    @property
+    def detected_from(self) -> List[str]:
+        """Manifest names present, in MANIFESTS order."""
+        return [name for name in MANIFESTS if name in self.manifests]
+
+
+def _parse_go_mod(text: str) -> Dict[str, Any]:
+    """Parse module path and required modules (direct and indirect) from go.mod."""
+    module = None
+    requires: Dict[str, str] = {}
+    indirect: Dict[str, str] = {}
+    in_block = False
+
+    for raw in text.splitlines():
+        line, _, comment = raw.partition("//")
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("module "):
+            module = line.split(None, 1)[1].strip('"')
+        elif line.startswith("require ("):
+            in_block = True
+        elif in_block and line == ")":
+            in_block = False
+        elif in_block or line.startswith("require "):
+            parts = line.replace("require ", "", 1).split()
+            if len(parts) >= 2:
+                target = indirect if comment.strip() == "indirect" else requires
+                target[parts[0]] = parts[1]
+
+    return {"module": module, "require": requires, "indirect": indirect}
+
+
+_GEM_PATTERN = re.compile(r"""^\s*gem\s+["']([^"']+)["']""", re.MULTILINE)
+
+
+def _parse_gemfile(text: str) -> Dict[str, Any]:
+    """Collect declared gem names from a Gemfile."""
+    return {"gems": _GEM_PATTERN.findall(text)}
+
+
+def _parse(name: str, text: str) -> Optional[Dict[str, Any]]:
+    try:
+        if name.endswith(".json"):
+            return json.loads(text)
+        if name.endswith(".toml"):
+            return tomllib.loads(text) if tomllib else None
+        if name == "go.mod":
+            return _parse_go_mod(text)
+        if name == "Gemfile":
+            return _parse_gemfile(text)
+    except ValueError:
+        # JSONDecodeError and TOMLDecodeError are both ValueErrors
+        return None
+    return None
+
+
+# root -> (stat signature, fingerprint)
+_CACHE: Dict[str, Tuple[Tuple, ProjectFingerprint]] = {}
+
+
+def fingerprint_project(cwd: str = ".") -> ProjectFingerprint:
+    """
+    Fingerprint a project root with a single directory scan.
+
+    Repeated calls in the same process return the cached fingerprint unless
+    a manifest was added, removed or modified.
+
+    Args:
+        cwd: Project root (default: ".")
+
+    Returns:
+        ProjectFingerprint
+    """
+    root = str(Path(cwd).resolve())
+    wanted_manifests = set(MANIFESTS)
+    wanted_markers = set(MARKERS)
+
+    stats: Dict[str, os.stat_result] = {}
+    markers: Dict[str, bool] = {}
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.name in wanted_manifests and entry.is_file():
+                    stats[entry.name] = entry.stat()
+                elif entry.name in wanted_markers:
+                    markers[entry.name] = True
+    except OSError:
+        pass
+
+    signature = tuple(sorted((n, s.st_mtime_ns, s.st_size) for n, s in stats.items())) + tuple(sorted(markers))
+    cached = _CACHE.get(root)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    previous = cached[1].manifests if cached else {}
+    manifests: Dict[str, Manifest] = {}
+    for name, st in stats.items():
+        old = previous.get(name)
+        if old and old.mtime == st.st_mtime and old.size == st.st_size:
+            manifests[name] = old
+            continue
+
+        path = os.path.join(root, name)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except (OSError, UnicodeDecodeError):
+            continue
+        manifests[name] = Manifest(name, path, st.st_mtime, st.st_size, text, _parse(name, text))
+
+    fingerprint = ProjectFingerprint(root=root, manifests=manifests, markers=markers)
+    _CACHE[root] = (signature, fingerprint)
+    return fingerprint
+
+
+def clear_cache() -> None:
+    """Drop cached fingerprints (e.g. after writing manifests)."""
+    _CACHE.clear()
+
+
+if __name__ == "__main__":
+    fp = fingerprint_project(sys.argv[1] if len(sys.argv) > 1 else ".")
+    print(json.dumps({
+        "root": fp.root,
+        "manifests": {n: {"size": m.size, "parsed": m.data is not None} for n, m in fp.manifests.items()},
+        "markers": sorted(fp.markers),
+    }, indent=2))
@@ -2,13 +2,46 @@
 """
 Template customization for Navigator initialization.
 
-Replaces placeholders in templates with project-specific values.
+Replaces placeholders in templates with project-specific values using the
+compiled templates from template_engine.py.
 """
 
 import re
 from datetime import datetime
 from typing import Dict
 
+from template_engine import compile_template, load_template
+
+
+def template_values(project_info: Dict[str, str]) -> Dict[str, str]:
+    """
+    Placeholder values for a project.
+
+    Args:
+        project_info: Dictionary from project_detector.py
+
+    Returns:
+        Placeholder name -> value
+    """
+    now = datetime.now()
+
+    # Prepare replacement values
+    project_name = project_info.get("name", "My Project")
+    tech_stack = project_info.get("tech_stack", "Unknown")
+    detected_from = project_info.get("detected_from", "manual")
+
+    # Create title-cased version for display
+    project_name_title = _title_case(project_name)
+
+    return {
+        "PROJECT_NAME": project_name_title,
+        "project_name": project_name.lower(),
+        "TECH_STACK": tech_stack,
+        "DATE": now.strftime("%Y-%m-%d"),
+        "YEAR": str(now.year),
+        "DETECTED_FROM": detected_from,
+    }
+
 
 def customize_template(template_content: str, project_info: Dict[str, str]) -> str:
     """
@@ -29,31 +62,21 @@ def customize_template(template_content: str, project_info: Dict[str, str]) -> s
         ${YEAR} - Current year
         ${DETECTED_FROM} - Source of detection
     """
-    now = datetime.now()
-
-    # Prepare replacement values
-    project_name = project_info.get("name", "My Project")
-    tech_stack = project_info.get("tech_stack", "Unknown")
-    detected_from = project_info.get("detected_from", "manual")
+    return compile_template(template_content).render(template_values(project_info))
 
-    # Create title-cased version for display
-    project_name_title = _title_case(project_name)
 
-    replacements = {
-        "${PROJECT_NAME}": project_name_title,
-        "${project_name}": project_name.lower(),
-        "${TECH_STACK}": tech_stack,
-        "${DATE}": now.strftime("%Y-%m-%d"),
-        "${YEAR}": str(now.year),
-        "${DETECTED_FROM}": detected_from,
-    }
+def customize_template_file(template_path: str, project_info: Dict[str, str]) -> str:
+    """
+    Customize a template file, reusing its compiled form while the file is unchanged.
 
-    # Apply replacements
-    result = template_content
-    for placeholder, value in replacements.items():
-        result = result.replace(placeholder, value)
+    Args:
+        template_path: Path to template file
+        project_info: Dictionary from project_detector.py
 
-    return result
+    Returns:
+        Customized template content
+    """
+    return load_template(template_path).render(template_values(project_info))
 
 
 def _title_case(text: str) -> str:
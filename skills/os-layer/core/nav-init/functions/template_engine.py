@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Compiled ${PLACEHOLDER} templates used by nav-init and nav-onboard.
+
+A template is parsed once into literal segments and placeholder slots. The
+compiled form is memoized in-process and cached on disk (keyed by a hash of
+the source, or by path/mtime/size for template files), and rendering is a
+single join over the precomputed segments. Placeholders without a value are
+left untouched, so validate-after-render checks still see them.
+
+nav-init and nav-onboard each ship a copy of this module (the skills ship
+separately, so neither imports the other). Keep the two copies identical.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+
+PLACEHOLDER_PATTERN = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+CACHE_VERSION = 1
+
+
+def cache_dir() -> Path:
+    """Where compiled templates are stored (NAVIGATOR_TEMPLATE_CACHE overrides)."""
+    override = os.environ.get("NAVIGATOR_TEMPLATE_CACHE")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "navigator" / "templates"
+
+
+class CompiledTemplate:
+    """Literal segments interleaved with placeholder slots."""
+
+    __slots__ = ("segments", "keys")
+
+    def __init__(self, segments: List[Tuple[str, Optional[str]]]):
+        # (text, key): key is None for literals; text is the raw placeholder otherwise
+        self.segments = segments
+        self.keys = frozenset(key for _, key in segments if key)
+
+    def render(self, values: Mapping[str, str]) -> str:
+        """Fill placeholders in a single pass; unknown ones are kept verbatim."""
+        get = values.get
+        return "".join([get(key, text) if key else text for text, key in self.segments])
+
+
+def parse(source: str) -> List[Tuple[str, Optional[str]]]:
+    """Split template source into (text, key) segments."""
+    segments: List[Tuple[str, Optional[str]]] = []
+    position = 0
+    for match in PLACEHOLDER_PATTERN.finditer(source):
+        if match.start() > position:
+            segments.append((source[position:match.start()], None))
+        segments.append((match.group(0), match.group(1)))
+        position = match.end()
+    if position < len(source):
+        segments.append((source[position:], None))
+    return segments
+
+
+def _read_cache(name: str) -> Optional[CompiledTemplate]:
+    try:
+        with open(cache_dir() / f"{name}.json") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != CACHE_VERSION:
+        return None
+    return CompiledTemplate([(text, key) for text, key in data["segments"]])
+
+
+def _write_cache(name: str, template: CompiledTemplate) -> None:
+    directory = cache_dir()
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        temp_path = directory / f"{name}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"version": CACHE_VERSION, "segments": template.segments}, f, separators=(",", ":"))
+        os.replace(temp_path, directory / f"{name}.json")
+    except OSError:
+        # Caching is an optimization; read-only homes still render fine
+        pass
+
+
+_COMPILED: Dict[str, CompiledTemplate] = {}
+
+
+def compile_template(source: str) -> CompiledTemplate:
+    """
+    Compile template source (memoized in-process and on disk by content hash).
+
+    Args:
+        source: Template text with ${PLACEHOLDER} slots
+
+    Returns:
+        CompiledTemplate
+    """
+    digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    template = _COMPILED.get(digest)
+    if template is None:
+        template = _read_cache(digest)
+        if template is None:
+            template = CompiledTemplate(parse(source))
+            _write_cache(digest, template)
+        _COMPILED[digest] = template
+    return template
+
+
+def load_template(path: str) -> CompiledTemplate:
+    """
+    Compile a template file, reusing the cached form while the file is unchanged.
+
+    Args:
+        path: Template file path
+
+    Returns:
+        CompiledTemplate
+    """
+    resolved = os.path.abspath(path)
+    st = os.stat(resolved)
+    key = hashlib.sha256(f"{resolved}\0{st.st_mtime_ns}\0{st.st_size}".encode("utf-8")).hexdigest()
+
+    template = _COMPILED.get(key)
+    if template is None:
+        template = _read_cache(key)
+        if template is None:
+            with open(resolved, "r", encoding="utf-8") as f:
+                template = compile_template(f.read())
+            _write_cache(key, template)
+        _COMPILED[key] = template
+    return template
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: template_engine.py <template_file> [KEY=VALUE ...]")
+        sys.exit(1)
+
+    values = dict(arg.split("=", 1) for arg in sys.argv[2:] if "=" in arg)
+    sys.stdout.write(load_template(sys.argv[1]).render(values))
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Tests for merged Claude settings queries.
+
+Run from this directory: python3 -m pytest test_claude_settings.py
+"""
+
+import json
+
+import pytest
+
+from claude_settings import resolve_settings
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    root = tmp_path / "project"
+    root.mkdir()
+    return root
+
+
+def _write_mcp(root, servers):
+    (root / ".mcp.json").write_text(json.dumps({"mcpServers": servers}), encoding="utf-8")
+
+
+def test_exact_server_name(project):
+    _write_mcp(project, {"figma": {"command": "npx", "args": ["some-server"]}})
+    assert resolve_settings(str(project)).has_mcp_server("Figma")
+
+
+def test_camel_case_server_name(project):
+    _write_mcp(project, {"FigmaDesktop": {"url": "http://127.0.0.1:3845/sse"}})
+    assert resolve_settings(str(project)).has_mcp_server("figma")
+
+
+def test_name_inside_command_args(project):
+    _write_mcp(project, {"design": {"command": "npx", "args": ["-y", "figmadevmode-mcp"]}})
+    settings = resolve_settings(str(project))
+
+    assert settings.has_mcp_server("figma")
+    assert not settings.has_mcp_server("github")
+
+
+def test_disabled_server_is_ignored(project):
+    _write_mcp(project, {"FigmaDesktop": {"url": "http://127.0.0.1:3845/sse"}})
+    settings_dir = project / ".claude"
+    settings_dir.mkdir()
+    (settings_dir / "settings.json").write_text(
+        json.dumps({"disabledMcpjsonServers": ["FigmaDesktop"]}), encoding="utf-8"
+    )
+    assert not resolve_settings(str(project)).has_mcp_server("figma")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Persistent project-analysis cache for Navigator onboarding.
+
+Stores analyze_project and recommend_skills results in
+.agent/cache/project-analysis.json, keyed by the mtime and size of every
+manifest and lockfile plus the MCP servers configured in Claude settings.
+Unchanged projects are answered without re-running any detector.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Optional
+
+from claude_settings import resolve_settings
+from dependency_index import LOCKFILES
+from project_analyzer import analyze_project, format_tech_stack
+from project_fingerprint import fingerprint_project
+from skill_recommender import recommend_skills
+
+CACHE_FILE = "project-analysis.json"
+# Bump when analyzer/recommender output changes shape or rules
+CACHE_VERSION = 4
+
+
+def cache_key(cwd: str = ".") -> str:
+    """
+    Hash of everything the analysis depends on.
+
+    Args:
+        cwd: Project directory
+
+    Returns:
+        Hex digest that changes whenever an input file changes
+    """
+    project_dir = Path(cwd).resolve()
+    fp = fingerprint_project(str(project_dir))
+
+    parts = [("version", CACHE_VERSION), ("root", str(project_dir))]
+    parts.extend(sorted((m.name, m.mtime, m.size) for m in fp.manifests.values()))
+    parts.extend(("marker", name) for name in sorted(fp.markers))
+    for lockfile in sorted(LOCKFILES):
+        if fp.has(lockfile):
+            st = os.stat(project_dir / lockfile)
+            parts.append((lockfile, st.st_mtime_ns, st.st_size))
+    # Only the configured MCP servers feed the analysis; keying on them (not on
+    # settings file stats) keeps ~/.claude.json churn from invalidating the cache
+    parts.append(("mcp", sorted(resolve_settings(str(project_dir)).mcp_servers)))
+
+    return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()
+
+
+def _cache_path(project_dir: Path) -> Optional[Path]:
+    """Cache file location, or None if Navigator isn't initialized here."""
+    agent_dir = project_dir / ".agent"
+    if not agent_dir.is_dir():
+        return None
+    return agent_dir / "cache" / CACHE_FILE
+
+
+def _load(cache_path: Optional[Path]) -> Dict:
+    if cache_path is None:
+        return {}
+    try:
+        with open(cache_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _store(cache_path: Optional[Path], entry: Dict) -> None:
+    if cache_path is None:
+        return
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    with open(temp_path, "w") as f:
+        json.dump(entry, f, indent=2)
+    os.replace(temp_path, cache_path)
+
+
+def cached_analysis(cwd: str = ".", refresh: bool = False) -> Dict:
+    """
+    Project analysis and skill recommendations, served from cache when valid.
+
+    Args:
+        cwd: Project directory
+        refresh: Ignore any cached entry and recompute
+
+    Returns:
+        Dictionary with "analysis", "recommendations" and "cached" flag
+    """
+    project_dir = Path(cwd).resolve()
+    cache_path = _cache_path(project_dir)
+    key = cache_key(str(project_dir))
+
+    entry = _load(cache_path)
+    if not refresh and entry.get("key") == key:
+        return {"analysis": entry["analysis"], "recommendations": entry["recommendations"], "cached": True}
+
+    analysis = analyze_project(str(project_dir))
+    analysis["tech_stack"] = format_tech_stack(analysis)
+    recommendations = recommend_skills(analysis)
+
+    _store(cache_path, {"key": key, "analysis": analysis, "recommendations": recommendations})
+    return {"analysis": analysis, "recommendations": recommendations, "cached": False}
+
+
+def cached_analyze_project(cwd: str = ".", refresh: bool = False) -> Dict:
+    """Drop-in for analyze_project that uses the persistent cache."""
+    return cached_analysis(cwd, refresh)["analysis"]
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    result = cached_analysis(args[0] if args else ".", refresh="--refresh" in sys.argv)
+    print(json.dumps(result, indent=2))
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Batch onboarding across many repositories.
+
+Runs analysis -> recommendation -> workflow (-> progress) for each repo in a
+process pool. Stages hand results to each other in memory; each repo gets
+its usual .agent/onboarding/ artifacts and the run ends with a fleet summary.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from analysis_cache import cached_analysis
+from progress_tracker import init_progress
+from workflow_generator import generate_workflow
+
+
+def onboard_repo(repo: str, flow_type: str = "quick_start", with_progress: bool = True,
+                 force: bool = False, refresh: bool = False) -> Dict:
+    """
+    Onboard a single repository.
+
+    Args:
+        repo: Repository path
+        flow_type: "quick_start" or "full_education" (for PROGRESS.md)
+        with_progress: Initialize PROGRESS.md
+        force: Re-initialize PROGRESS.md even if onboarding already started
+        refresh: Ignore the cached project analysis
+
+    Returns:
+        Per-repo result (never raises; failures are reported in "error")
+    """
+    started = time.perf_counter()
+    result = {"repo": str(Path(repo).resolve()), "status": "ok", "artifacts": []}
+
+    try:
+        if not Path(repo).is_dir():
+            raise FileNotFoundError(f"Not a directory: {repo}")
+
+        cached = cached_analysis(repo, refresh=refresh)
+        analysis = cached["analysis"]
+        recommendations = cached["recommendations"]
+
+        result["artifacts"].append(generate_workflow(repo, analysis, recommendations))
+
+        progress_file = Path(repo) / ".agent" / "onboarding" / "PROGRESS.md"
+        if with_progress and (force or not progress_file.exists()):
+            result["artifacts"].append(init_progress(
+                repo, flow_type, analysis["project_type"], analysis["project_name"], recommendations
+            ))
+
+        result.update({
+            "project_name": analysis["project_name"],
+            "project_type": analysis["project_type"],
+            "tech_stack": analysis.get("tech_stack", ""),
+            "recommended_skills": recommendations["recommended_skills"],
+            "optional_skills": recommendations["optional_skills"],
+            "cached": cached["cached"],
+        })
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return result
+
+
+def summarize_fleet(results: List[Dict], elapsed: float) -> Dict:
+    """Aggregate per-repo results into a fleet summary."""
+    ok = [r for r in results if r["status"] == "ok"]
+    skills = Counter(s for r in ok for s in r["recommended_skills"] + r["optional_skills"])
+
+    return {
+        "repos": len(results),
+        "onboarded": len(ok),
+        "failed": len(results) - len(ok),
+        "cached": sum(1 for r in ok if r["cached"]),
+        "project_types": dict(Counter(r["project_type"] for r in ok).most_common()),
+        "tech_stacks": dict(Counter(r["tech_stack"] for r in ok).most_common()),
+        "skills": dict(skills.most_common()),
+        "errors": {r["repo"]: r["error"] for r in results if r["status"] == "error"},
+        "elapsed_s": round(elapsed, 2),
+    }
+
+
+def batch_onboard(repos: List[str], flow_type: str = "quick_start", with_progress: bool = True,
+                  force: bool = False, refresh: bool = False, max_workers: Optional[int] = None) -> Dict:
+    """
+    Onboard many repositories concurrently.
+
+    Args:
+        repos: Repository paths
+        flow_type: "quick_start" or "full_education"
+        with_progress: Initialize PROGRESS.md in each repo
+        force: Re-initialize existing PROGRESS.md files
+        refresh: Ignore cached project analyses
+        max_workers: Process pool size (default: CPU count)
+
+    Returns:
+        Dictionary with per-repo "results" and a fleet "summary"
+    """
+    started = time.perf_counter()
+    repos = list(dict.fromkeys(repos))
+    results: List[Dict] = []
+
+    if repos:
+        workers = min(max_workers or os.cpu_count() or 1, len(repos))
+        args = [(repo, flow_type, with_progress, force, refresh) for repo in repos]
+        if workers == 1:
+            results = [onboard_repo(*a) for a in args]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(onboard_repo, *zip(*args), chunksize=max(1, len(repos) // (workers * 4))))
+
+    return {"results": results, "summary": summarize_fleet(results, time.perf_counter() - started)}
+
+
+def _read_repo_list(path: str) -> List[str]:
+    stream = sys.stdin if path == "-" else open(path)
+    with stream:
+        return [line.strip() for line in stream if line.strip() and not line.lstrip().startswith("#")]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Onboard many repositories with Navigator")
+    parser.add_argument("repos", nargs="*", help="Repository paths")
+    parser.add_argument("--from", dest="repo_list", help="File with one repo path per line ('-' for stdin)")
+    parser.add_argument("--flow", choices=["quick_start", "full_education"], default="quick_start")
+    parser.add_argument("--no-progress", action="store_true", help="Skip PROGRESS.md initialization")
+    parser.add_argument("--force", action="store_true", help="Re-initialize existing PROGRESS.md")
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached project analyses")
+    parser.add_argument("--workers", type=int, help="Process pool size (default: CPU count)")
+    parser.add_argument("--summary", help="Also write the full report to this JSON file")
+
+    args = parser.parse_args()
+
+    repos = list(args.repos)
+    if args.repo_list:
+        repos.extend(_read_repo_list(args.repo_list))
+    if not repos:
+        parser.error("no repositories given")
+
+    report = batch_onboard(repos, args.flow, not args.no_progress, args.force, args.refresh, args.workers)
+
+    if args.summary:
+        Path(args.summary).write_text(json.dumps(report, indent=2))
+
+    print(json.dumps(report, indent=2))
+    sys.exit(1 if report["summary"]["failed"] else 0)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Merged view of Claude Code settings for a project.
+
+Layers user, project and local settings (plus .mcp.json and the per-project
+entries in ~/.claude.json) into one dictionary, caches it per process keyed
+by every source file's mtime/size, and precomputes the lookup data for
+queries like "is a Figma MCP server configured?".
+
+nav-init and nav-onboard each ship a copy of this module (the skills ship
+separately, so neither imports the other). Keep the two copies identical.
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+TRUTHY = {"1", "true", "yes", "on"}
+
+
+def settings_paths(project_dir: str = ".") -> List[Path]:
+    """
+    Settings sources, lowest precedence first.
+
+    Args:
+        project_dir: Project root
+
+    Returns:
+        Paths (may not exist)
+    """
+    root = Path(project_dir).resolve()
+    home = Path.home()
+    return [
+        home / ".config" / "claude" / "settings.json",
+        home / ".claude" / "settings.json",
+        home / ".claude.json",
+        root / ".mcp.json",
+        root / ".claude" / "settings.json",
+        root / ".claude" / "settings.local.json",
+    ]
+
+
+def _merge(base: Dict, overlay: Dict) -> Dict:
+    """Deep-merge dicts; lists are concatenated without duplicates; scalars override."""
+    for key, value in overlay.items():
+        current = base.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            _merge(current, value)
+        elif isinstance(current, list) and isinstance(value, list):
+            current.extend(v for v in value if v not in current)
+        else:
+            base[key] = value
+    return base
+
+
+def _load_json(path: Path) -> Optional[Dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+class ClaudeSettings:
+    """Resolved settings with precomputed query indexes."""
+
+    def __init__(self, root: str, merged: Dict[str, Any], sources: List[str]):
+        self.root = root
+        self.merged = merged
+        self.sources = sources
+
+        disabled = set(merged.get("disabledMcpjsonServers", []))
+        self.mcp_servers: Dict[str, Dict] = {
+            name: server for name, server in merged.get("mcpServers", {}).items() if name not in disabled
+        }
+
+        # Lowercased server names, and names, commands, args and URLs as one string for
+        # substring matches ("figma" must still find "FigmaDesktop" or "figma-dev-mode")
+        self._server_names: Set[str] = {name.lower() for name in self.mcp_servers}
+        self._server_text = "\n".join(
+            " ".join([name, str(server.get("command", "")), str(server.get("url", ""))]
+                     + [str(a) for a in server.get("args", [])])
+            for name, server in self.mcp_servers.items()
+        ).lower()
+
+        self.hooks: Dict[str, List] = merged.get("hooks", {}) if isinstance(merged.get("hooks"), dict) else {}
+        self.env: Dict[str, str] = {k: str(v) for k, v in merged.get("env", {}).items()}
+
+    def has_mcp_server(self, name: str) -> bool:
+        """True if a configured MCP server's name, command, args or URL mention `name`."""
+        name = name.lower()
+        return name in self._server_names or name in self._server_text
+
+    def has_hooks(self, event: Optional[str] = None) -> bool:
+        """True if any hook (or any hook for `event`, e.g. "PreToolUse") is configured."""
+        if event is None:
+            return any(self.hooks.values())
+        return bool(self.hooks.get(event))
+
+    def env_flag(self, name: str) -> bool:
+        """True if env var `name` is set to a truthy value in settings."""
+        return self.env.get(name, "").strip().lower() in TRUTHY
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.merged.get(key, default)
+
+
+# project root -> (source signature, settings)
+_CACHE: Dict[str, Tuple[Tuple, ClaudeSettings]] = {}
+
+
+def _signature(paths: List[Path]) -> Tuple:
+    parts = []
+    for path in paths:
+        try:
+            st = path.stat()
+            parts.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            parts.append(None)
+    return tuple(parts)
+
+
+def resolve_settings(project_dir: str = ".") -> ClaudeSettings:
+    """
+    Merge all Claude settings layers for a project (cached until a source changes).
+
+    Args:
+        project_dir: Project root
+
+    Returns:
+        ClaudeSettings
+    """
+    root = str(Path(project_dir).resolve())
+    paths = settings_paths(root)
+    signature = _signature(paths)
+
+    cached = _CACHE.get(root)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    merged: Dict[str, Any] = {}
+    sources = []
+    for path, stat in zip(paths, signature):
+        if stat is None:
+            continue
+        data = _load_json(path)
+        if data is None:
+            continue
+        sources.append(str(path))
+
+        if path.name == ".claude.json":
+            # User-scope servers at the top level, local-scope ones under projects[root]
+            _merge(merged, {"mcpServers": data.get("mcpServers", {})})
+            local = data.get("projects", {}).get(root, {})
+            _merge(merged, {"mcpServers": local.get("mcpServers", {})})
+        else:
+            _merge(merged, data)
+
+    settings = ClaudeSettings(root, merged, sources)
+    _CACHE[root] = (signature, settings)
+    return settings
+
+
+if __name__ == "__main__":
+    settings = resolve_settings(sys.argv[1] if len(sys.argv) > 1 else ".")
+    print(json.dumps({
+        "sources": settings.sources,
+        "mcp_servers": sorted(settings.mcp_servers),
+        "hooks": sorted(event for event, hooks in settings.hooks.items() if hooks),
+        "env": sorted(settings.env),
+    }, indent=2))
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Declared and locked dependency sets for a project root.
+
+Builds normalized dependency names per ecosystem from parsed manifests
+(via project_fingerprint) and from lockfiles. Detectors look names up in a
+set instead of substring-matching raw manifest text, so comments,
+descriptions and look-alike package names no longer cause false positives.
+
+nav-init and nav-onboard each ship a copy of this module (the skills ship
+separately, so neither imports the other). Keep the two copies identical.
+"""
+
+import json
+import os
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from project_fingerprint import ProjectFingerprint, fingerprint_project
+
+# Lockfile -> ecosystem it resolves
+LOCKFILES = {
+    "package-lock.json": "npm",
+    "pnpm-lock.yaml": "npm",
+    "yarn.lock": "npm",
+    "poetry.lock": "pypi",
+    "uv.lock": "pypi",
+    "Cargo.lock": "cargo",
+    "go.sum": "go",
+    "composer.lock": "composer",
+    "Gemfile.lock": "gem",
+}
+
+_PEP508_NAME = re.compile(r"^\s*([A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)")
+_PEP503_SEPARATORS = re.compile(r"[-_.]+")
+_GO_MAJOR_SUFFIX = re.compile(r"/v\d+$")
+
+# [[package]] name lines in poetry.lock / uv.lock / Cargo.lock
+_TOML_PACKAGE_NAME = re.compile(r'^name = "([^"]+)"', re.MULTILINE)
+# pnpm-lock.yaml package keys: v5 "/name/1.0.0:", v6 "/name@1.0.0:", v9 "name@1.0.0:"
+_PNPM_KEY = re.compile(r"""^  ['"]?/?((?:@[^/@\s'"]+/)?[^/@\s'":]+)[@/]\d""", re.MULTILINE)
+# yarn.lock entry headers: name@range[, name@range]:
+_YARN_KEY = re.compile(r'^"?((?:@[^/@\s"]+/)?[^/@\s",]+)@', re.MULTILINE)
+# Gemfile.lock specs: four-space indent "name (version)"
+_GEMFILE_LOCK_SPEC = re.compile(r"^    ([A-Za-z0-9_.-]+) \(", re.MULTILINE)
+
+
+def normalize(ecosystem: str, name: str) -> str:
+    """Canonical dependency name for lookups within an ecosystem."""
+    name = name.strip()
+    if ecosystem == "pypi":
+        return _PEP503_SEPARATORS.sub("-", name).lower()
+    if ecosystem == "go":
+        return _GO_MAJOR_SUFFIX.sub("", name)
+    if ecosystem == "cargo":
+        return name.lower().replace("_", "-")
+    return name.lower()
+
+
+@dataclass
+class DependencyIndex:
+    """Dependency names per ecosystem: declared directly vs. resolved in lockfiles."""
+
+    declared: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    locked: Dict[str, Set[str]] = field(default_factory=dict)
+    lockfiles: List[str] = field(default_factory=list)
+
+    def declare(self, ecosystem: str, names: Iterable[str], manifest: str) -> None:
+        bucket = self.declared.setdefault(ecosystem, {})
+        for name in names:
+            if name:
+                bucket.setdefault(normalize(ecosystem, name), manifest)
+
+    def names(self, ecosystem: str) -> Set[str]:
+        """Directly declared dependency names."""
+        return set(self.declared.get(ecosystem, ()))
+
+    def source(self, ecosystem: str, name: str) -> Optional[str]:
+        """
+        Where a dependency comes from.
+
+        Returns:
+            "manifest+lockfile", "manifest", "lockfile" or None
+        """
+        in_manifest = name in self.declared.get(ecosystem, ())
+        in_lockfile = name in self.locked.get(ecosystem, ())
+        if in_manifest and in_lockfile:
+            return "manifest+lockfile"
+        if in_manifest:
+            return "manifest"
+        if in_lockfile:
+            return "lockfile"
+        return None
+
+    def items(self) -> Iterable[Tuple[str, str]]:
+        """Every (ecosystem, name) pair, declared or locked, once."""
+        for ecosystem in sorted(set(self.declared) | set(self.locked)):
+            yield from ((ecosystem, name) for name in sorted(
+                set(self.declared.get(ecosystem, ())) | self.locked.get(ecosystem, set())))
+
+
+def _pyproject_requirements(data: Dict) -> List[str]:
+    """Requirement names from PEP 621, dependency groups, Poetry and uv tables."""
+    requirements: List[str] = []
+    project = data.get("project", {})
+    requirements.extend(project.get("dependencies", []))
+    for extra in project.get("optional-dependencies", {}).values():
+        requirements.extend(extra)
+    for group in data.get("dependency-groups", {}).values():
+        requirements.extend(r for r in group if isinstance(r, str))
+    requirements.extend(data.get("tool", {}).get("uv", {}).get("dev-dependencies", []))
+
+    names = []
+    for requirement in requirements:
+        match = _PEP508_NAME.match(requirement) if isinstance(requirement, str) else None
+        if match:
+            names.append(match.group(1))
+
+    poetry = data.get("tool", {}).get("poetry", {})
+    tables = [poetry.get("dependencies", {}), poetry.get("dev-dependencies", {})]
+    tables.extend(g.get("dependencies", {}) for g in poetry.get("group", {}).values())
+    for table in tables:
+        names.extend(name for name in table if name.lower() != "python")
+
+    return names
+
+
+def _cargo_dependencies(data: Dict) -> List[str]:
+    """Crate names from every dependency table, honoring `package = ...` renames."""
+    tables = []
+    for scope in (data, data.get("workspace", {})):
+        tables.extend(scope.get(key, {}) for key in ("dependencies", "dev-dependencies", "build-dependencies"))
+    for target in data.get("target", {}).values():
+        tables.extend(target.get(key, {}) for key in ("dependencies", "dev-dependencies", "build-dependencies"))
+
+    names = []
+    for table in tables:
+        for name, spec in table.items():
+            names.append(spec.get("package", name) if isinstance(spec, dict) else name)
+    return names
+
+
+def _read_lockfile(name: str, text: str) -> Set[str]:
+    if name == "package-lock.json":
+        data = json.loads(text)
+        names = {key.rpartition("node_modules/")[2] for key in data.get("packages", {}) if key}
+        stack = [data.get("dependencies", {})]
+        while stack:
+            deps = stack.pop()
+            names.update(deps)
+            stack.extend(d.get("dependencies", {}) for d in deps.values() if isinstance(d, dict))
+        return names
+    if name == "pnpm-lock.yaml":
+        return set(_PNPM_KEY.findall(text))
+    if name == "yarn.lock":
+        return set(_YARN_KEY.findall(text))
+    if name in ("poetry.lock", "uv.lock", "Cargo.lock"):
+        return set(_TOML_PACKAGE_NAME.findall(text))
+    if name == "go.sum":
+        return {line.split(None, 1)[0] for line in text.splitlines() if line.strip()}
+    if name == "composer.lock":
+        data = json.loads(text)
+        return {p["name"] for key in ("packages", "packages-dev") for p in data.get(key, []) if "name" in p}
+    if name == "Gemfile.lock":
+        return set(_GEMFILE_LOCK_SPEC.findall(text))
+    return set()
+
+
+# lockfile path -> ((mtime_ns, size), names)
+_LOCK_CACHE: Dict[str, Tuple[Tuple[int, int], Set[str]]] = {}
+
+
+def locked_names(path: str) -> Set[str]:
+    """
+    Package names resolved in a lockfile (cached per process by mtime/size).
+
+    Args:
+        path: Lockfile path; its basename selects the parser
+
+    Returns:
+        Raw (unnormalized) package names, empty if unreadable
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return set()
+
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _LOCK_CACHE.get(path)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            names = _read_lockfile(os.path.basename(path), f.read())
+    except (OSError, UnicodeDecodeError, ValueError):
+        names = set()
+
+    _LOCK_CACHE[path] = (signature, names)
+    return names
+
+
+def build_dependency_index(fp: ProjectFingerprint, include_lockfiles: bool = True) -> DependencyIndex:
+    """
+    Collect declared (and optionally locked) dependencies for a fingerprinted root.
+
+    Args:
+        fp: Project fingerprint
+        include_lockfiles: Also parse lockfiles present in the root
+
+    Returns:
+        DependencyIndex
+    """
+    index = DependencyIndex()
+
+    package_json = fp.data("package.json")
+    for key in ("dependencies", "devDependencies", "peerDependencies", "optionalDependencies"):
+        index.declare("npm", package_json.get(key, {}), "package.json")
+
+    index.declare("pypi", _pyproject_requirements(fp.data("pyproject.toml")), "pyproject.toml")
+
+    index.declare("go", fp.data("go.mod").get("require", {}), "go.mod")
+
+    index.declare("cargo", _cargo_dependencies(fp.data("Cargo.toml")), "Cargo.toml")
+
+    composer = fp.data("composer.json")
+    for key in ("require", "require-dev"):
+        index.declare("composer", (n for n in composer.get(key, {}) if n != "php" and not n.startswith("ext-")),
+                      "composer.json")
+
+    index.declare("gem", fp.data("Gemfile").get("gems", []), "Gemfile")
+
+    if include_lockfiles:
+        for lockfile, ecosystem in LOCKFILES.items():
+            if fp.has(lockfile):
+                index.lockfiles.append(lockfile)
+                names = locked_names(os.path.join(fp.root, lockfile))
+                index.locked.setdefault(ecosystem, set()).update(normalize(ecosystem, n) for n in names)
+
+    return index
+
+
+if __name__ == "__main__":
+    index = build_dependency_index(fingerprint_project(sys.argv[1] if len(sys.argv) > 1 else "."))
+    print(json.dumps({
+        "declared": {eco: sorted(names) for eco, names in index.declared.items() if names},
+        "locked": {eco: len(names) for eco, names in index.locked.items()},
+        "lockfiles": index.lockfiles,
+    }, indent=2))
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Pruned, lazily-built file index for onboarding task validation.
+
+Walks the project tree once with os.scandir, skipping dependency/build
+directories and anything matched by .gitignore files along the way. Entries
+(relative path, name, mtime) are memoized as the walk proceeds, so every
+validator in a run shares the same walk and a lookup that finds its match
+early stops the walk there.
+"""
+
+import fnmatch
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+# Directories never worth descending into
+PRUNE_DIRS = {
+    ".git", "node_modules", "dist", "build", "out", ".next", ".nuxt", ".svelte-kit",
+    "coverage", "target", "vendor", ".venv", "venv", "__pycache__", ".tox", ".cache",
+}
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    """One file or directory seen by the walk."""
+
+    path: str  # relative to the project root, "/"-separated
+    name: str
+    mtime: float
+    is_dir: bool
+
+    def parent(self) -> str:
+        return self.path.rpartition("/")[0]
+
+
+# Copied as GitignoreRules in navigator-main/skills/product-design/functions/
+# component_inventory.py (the skills ship separately, so neither can import
+# the other). Keep the pattern parsing and matching in sync.
+class GitignoreRules:
+    """Minimal .gitignore matcher: basename/anchored globs, dir-only and negation."""
+
+    def __init__(self, base: str = "", patterns: Sequence[Tuple[str, bool, bool, bool]] = ()):
+        self.base = base
+        # (glob, negated, dir_only, anchored)
+        self.patterns = list(patterns)
+
+    @classmethod
+    def load(cls, directory: str, rel_dir: str) -> Optional["GitignoreRules"]:
+        try:
+            with open(os.path.join(directory, ".gitignore"), "r", encoding="utf-8", errors="replace") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return None
+
+        patterns = []
+        for line in lines:
+            line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negated = line.startswith("!")
+            line = line.lstrip("!")
+            dir_only = line.endswith("/")
+            line = line.strip("/") if dir_only else line
+            if line.startswith("**/"):
+                line = line[3:]
+            anchored = "/" in line
+            line = line.lstrip("/")
+            if line:
+                # fnmatch's "*" already crosses "/", so "**" collapses to "*"
+                patterns.append((line.replace("**", "*"), negated, dir_only, anchored))
+
+        return cls(rel_dir, patterns) if patterns else None
+
+    def ignores(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """True/False if a rule decides, None if no rule applies."""
+        local = rel_path[len(self.base) + 1:] if self.base else rel_path
+        name = local.rpartition("/")[2]
+        decision = None
+        for glob, negated, dir_only, anchored in self.patterns:
+            if dir_only and not is_dir:
+                continue
+            if fnmatch.fnmatchcase(local if anchored else name, glob):
+                decision = not negated
+        return decision
+
+
+class FileIndex:
+    """Memoized pruned walk over a project tree."""
+
+    def __init__(self, root: str, prune_dirs: Optional[set] = None):
+        self.root = os.path.abspath(root)
+        self.prune_dirs = PRUNE_DIRS if prune_dirs is None else prune_dirs
+        self.entries: List[FileEntry] = []
+        self._walker: Optional[Iterator[FileEntry]] = self._walk()
+
+    def _walk(self) -> Iterator[FileEntry]:
+        root_rules = GitignoreRules.load(self.root, "")
+        stack: List[Tuple[str, str, Tuple[GitignoreRules, ...]]] = [
+            (self.root, "", (root_rules,) if root_rules else ())
+        ]
+
+        while stack:
+            directory, rel_dir, rules = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    children = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+
+            subdirs = []
+            for entry in children:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if is_dir and entry.name in self.prune_dirs:
+                        continue
+                    rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    if _ignored(rules, rel_path, is_dir):
+                        continue
+                    mtime = entry.stat(follow_symlinks=False).st_mtime
+                except OSError:
+                    continue
+
+                yield FileEntry(rel_path, entry.name, mtime, is_dir)
+                if is_dir:
+                    subdirs.append((entry.path, rel_path))
+
+            for path, rel_path in reversed(subdirs):
+                nested = GitignoreRules.load(path, rel_path)
+                stack.append((path, rel_path, rules + (nested,) if nested else rules))
+
+    def __iter__(self) -> Iterator[FileEntry]:
+        # Replay memoized entries, then resume the walk where the last lookup stopped
+        index = 0
+        while True:
+            if index < len(self.entries):
+                yield self.entries[index]
+                index += 1
+                continue
+            if self._walker is None:
+                return
+            entry = next(self._walker, None)
+            if entry is None:
+                self._walker = None
+                return
+            self.entries.append(entry)
+            index += 1
+            yield entry
+
+    def find(self, predicate: Callable[[FileEntry], bool], under: Sequence[str] = (),
+             recent_hours: Optional[float] = None) -> Optional[FileEntry]:
+        """
+        First entry matching a predicate.
+
+        Args:
+            predicate: Test applied to each entry
+            under: Only consider entries below one of these relative directories
+            recent_hours: Only consider entries modified within this many hours
+
+        Returns:
+            Matching FileEntry or None
+        """
+        prefixes = tuple(p.strip("/") + "/" for p in under)
+        cutoff = time.time() - recent_hours * 3600 if recent_hours is not None else None
+
+        for entry in self:
+            if prefixes and not entry.path.startswith(prefixes):
+                continue
+            if cutoff is not None and entry.mtime < cutoff:
+                continue
+            if predicate(entry):
+                return entry
+        return None
+
+
+def _ignored(rules: Tuple[GitignoreRules, ...], rel_path: str, is_dir: bool) -> bool:
+    # Deeper .gitignore files override shallower ones
+    for rule_set in reversed(rules):
+        decision = rule_set.ignores(rel_path, is_dir)
+        if decision is not None:
+            return decision
+    return False
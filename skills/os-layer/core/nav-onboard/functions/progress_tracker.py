@@ -3,6 +3,12 @@
 Progress tracking for Navigator onboarding.
 
 Manages .agent/onboarding/PROGRESS.md to track learning completion.
+
+State lives in a ProgressStore: a JSON snapshot (.progress-data.json) plus
+an append-only write-ahead journal (.progress-journal.jsonl). An update
+appends one journal line, adjusts counters in place and rewrites only the
+changed PROGRESS.md row and footer. The snapshot is compacted every
+JOURNAL_LIMIT updates.
 """
 
 import json
@@ -10,7 +16,341 @@ import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+DATA_FILE = ".progress-data.json"
+JOURNAL_FILE = ".progress-journal.jsonl"
+JOURNAL_LIMIT = 50
+STATUSES = ("pending", "in_progress", "completed")
+
+ROW_HEADER = "| # | Skill | Status | Completed | Notes |"
+NO_DEV_ROW = "| - | (none for this flow) | - | - | - |"
+
+
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M")
+
+
+def _percentage(completed: int, total: int) -> int:
+    return round(completed / total * 100) if total > 0 else 0
+
+
+class ProgressStore:
+    """Onboarding progress with a write-ahead journal and incremental rendering."""
+
+    def __init__(self, project_dir: str):
+        self.onboarding_dir = Path(project_dir).resolve() / ".agent" / "onboarding"
+        self.data_file = self.onboarding_dir / DATA_FILE
+        self.journal_file = self.onboarding_dir / JOURNAL_FILE
+        self.progress_file = self.onboarding_dir / "PROGRESS.md"
+
+        self.data: Optional[Dict] = None
+        self._order: List[str] = []
+        self._position: Dict[str, int] = {}
+        self._next = 0
+        self._journal_entries = 0
+        # PROGRESS.md lines and where each skill row / footer line sits
+        self._lines: Optional[List[str]] = None
+        self._line_index: Dict[str, int] = {}
+        self._signature: Optional[Tuple] = None
+
+        self._load()
+
+    @property
+    def key(self) -> str:
+        return str(self.onboarding_dir)
+
+    @property
+    def initialized(self) -> bool:
+        return self.data is not None
+
+    def _stat_signature(self) -> Tuple:
+        parts = []
+        for path in (self.data_file, self.journal_file):
+            try:
+                st = path.stat()
+                parts.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                parts.append(None)
+        return tuple(parts)
+
+    def is_stale(self) -> bool:
+        """True if another process changed the state since we last touched it."""
+        return self._stat_signature() != self._signature
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.data_file.read_text())
+        except (OSError, ValueError):
+            self._signature = self._stat_signature()
+            return
+
+        data.setdefault("seq", 0)
+        self._index(data)
+
+        # Replay journal entries newer than the snapshot; stop at a torn write
+        try:
+            with open(self.journal_file) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break
+                    if entry["seq"] > data["seq"]:
+                        self._apply(entry)
+                    self._journal_entries += 1
+        except OSError:
+            pass
+
+        self._signature = self._stat_signature()
+
+    def _index(self, data: Dict) -> None:
+        self.data = data
+        self._order = data["essential_skills"] + data["development_skills"]
+        self._position = {skill: i for i, skill in enumerate(self._order)}
+        data["completed"] = sum(1 for p in data["progress"].values() if p["status"] == "completed")
+        self._next = 0
+        self._advance_next()
+
+    def _advance_next(self) -> None:
+        progress = self.data["progress"]
+        while self._next < len(self._order) and progress[self._order[self._next]]["status"] == "completed":
+            self._next += 1
+
+    def _apply(self, entry: Dict) -> None:
+        """Apply one journal entry to in-memory state in O(1) (amortized)."""
+        data = self.data
+        skill = entry["skill"]
+        p = data["progress"][skill]
+        was_completed = p["status"] == "completed"
+
+        p["status"] = entry["status"]
+        if entry["status"] == "completed":
+            p["completed"] = entry["completed"]
+        if entry.get("notes"):
+            p["notes"] = entry["notes"]
+
+        is_completed = entry["status"] == "completed"
+        data["completed"] += int(is_completed) - int(was_completed)
+        data["seq"] = entry["seq"]
+
+        position = self._position[skill]
+        if not is_completed and position < self._next:
+            self._next = position
+        elif position == self._next:
+            self._advance_next()
+
+    def next_task(self) -> Optional[str]:
+        """Next skill to complete, or None when everything is done."""
+        if not self.initialized or self._next >= len(self._order):
+            return None
+        return self._order[self._next]
+
+    def update(self, skill_name: str, status: str, notes: str = "") -> Dict:
+        """
+        Record a status change: one journal append and one PROGRESS.md write.
+
+        Args:
+            skill_name: Skill to update
+            status: "pending", "in_progress", or "completed"
+            notes: Optional notes
+
+        Returns:
+            Updated progress summary (includes next_task)
+        """
+        if not self.initialized:
+            return {"error": "Progress not initialized. Run init first."}
+        if skill_name not in self.data["progress"]:
+            return {"error": f"Unknown skill: {skill_name}"}
+        if status not in STATUSES:
+            return {"error": f"Unknown status: {status} (use {', '.join(STATUSES)})"}
+
+        entry = {
+            "seq": self.data["seq"] + 1,
+            "skill": skill_name,
+            "status": status,
+            "completed": _now() if status == "completed" else None,
+            "notes": notes,
+        }
+
+        # Write-ahead: the journal line is durable before state changes
+        with open(self.journal_file, "a") as f:
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_entries += 1
+
+        self._apply(entry)
+        self._render_rows([skill_name])
+
+        if self._journal_entries >= JOURNAL_LIMIT:
+            self.checkpoint()
+        self._signature = self._stat_signature()
+
+        return {
+            "skill": skill_name,
+            "status": status,
+            "completed": self.data["completed"],
+            "total": self.data["total"],
+            "percentage": _percentage(self.data["completed"], self.data["total"]),
+            "next_task": self.next_task(),
+        }
+
+    def advance(self, status: str = "completed", notes: str = "") -> Dict:
+        """Update the current next task and return the new next task in one call."""
+        skill_name = self.next_task()
+        if skill_name is None:
+            if not self.initialized:
+                return {"error": "Progress not initialized. Run init first."}
+            return {"skill": None, "completed": self.data["completed"], "total": self.data["total"],
+                    "percentage": 100, "next_task": None}
+        return self.update(skill_name, status, notes)
+
+    def summary(self) -> Dict:
+        if not self.initialized:
+            return {"initialized": False}
+        data = self.data
+        return {
+            "initialized": True,
+            "flow_type": data["flow_type"],
+            "project_type": data["project_type"],
+            "completed": data["completed"],
+            "total": data["total"],
+            "percentage": _percentage(data["completed"], data["total"]),
+            "skills": data["progress"],
+            "next_task": self.next_task(),
+        }
+
+    def checkpoint(self) -> None:
+        """Fold the journal into the snapshot and truncate it."""
+        if not self.initialized:
+            return
+        temp_path = self.data_file.with_name(f"{DATA_FILE}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(self.data, indent=2))
+        os.replace(temp_path, self.data_file)
+        try:
+            self.journal_file.unlink()
+        except OSError:
+            pass
+        self._journal_entries = 0
+        self._signature = self._stat_signature()
+
+    def reset(self, data: Dict) -> None:
+        """Start fresh from new data (used by init)."""
+        self.onboarding_dir.mkdir(parents=True, exist_ok=True)
+        data["seq"] = 0
+        self._index(data)
+        self.checkpoint()
+        self.render()
+
+    def _row(self, skill: str) -> str:
+        p = self.data["progress"][skill]
+        return f"| {self._position[skill] + 1} | {skill} | {p['status']} | {p['completed'] or '-'} | {p['notes'] or '-'} |"
+
+    def _footer(self) -> Dict[str, str]:
+        data = self.data
+        return {
+            "**Progress**": f"**Progress**: {data['completed']}/{data['total']} "
+                            f"({_percentage(data['completed'], data['total'])}%)",
+            "**Next Task**": f"**Next Task**: {self.next_task() or 'complete'}",
+            "*Last Updated": f"*Last Updated: {_now()}*",
+        }
+
+    def render(self) -> None:
+        """Render PROGRESS.md from scratch."""
+        data = self.data
+        essential_rows = [self._row(skill) for skill in data["essential_skills"]]
+        dev_rows = [self._row(skill) for skill in data["development_skills"]]
+        footer = self._footer()
+        flow_name = "Quick Start" if data["flow_type"] == "quick_start" else "Full Education"
+
+        content = f"""# Navigator Onboarding Progress
+
+**Started**: {data["started"][:16].replace("T", " ")}
+**Flow**: {flow_name}
+**Project**: {data["project_name"]} ({data["project_type"]})
+
+---
+
+## Essential Skills
+
+{ROW_HEADER}
+|---|-------|--------|-----------|-------|
+{chr(10).join(essential_rows)}
+
+## Development Skills
+
+{ROW_HEADER}
+|---|-------|--------|-----------|-------|
+{chr(10).join(dev_rows) if dev_rows else NO_DEV_ROW}
+
+---
+
+{footer["**Progress**"]}
+{footer["**Next Task**"]}
+
+{footer["*Last Updated"]}
+"""
+        self.progress_file.write_text(content)
+        self._index_lines(content.split("\n"))
+
+    def _index_lines(self, lines: List[str]) -> bool:
+        """Locate skill rows and footer lines; False if the file doesn't match the data."""
+        self._lines = lines
+        self._line_index = {}
+        for i, line in enumerate(lines):
+            if line.startswith("| "):
+                cells = line[2:].split(" | ", 2)
+                skill = cells[1] if len(cells) > 2 else None
+                if skill in self._position and cells[0] == str(self._position[skill] + 1):
+                    self._line_index[skill] = i
+            else:
+                for key in ("**Progress**", "**Next Task**", "*Last Updated"):
+                    if line.startswith(key):
+                        self._line_index[key] = i
+        return len(self._line_index) == len(self._order) + 3
+
+    def _render_rows(self, skills: List[str]) -> None:
+        """Rewrite only the given rows and the footer in PROGRESS.md."""
+        if self._lines is None:
+            try:
+                lines = self.progress_file.read_text().split("\n")
+            except OSError:
+                lines = []
+            if not self._index_lines(lines):
+                self.render()
+                return
+        elif len(self._line_index) != len(self._order) + 3:
+            self.render()
+            return
+
+        for skill in skills:
+            self._lines[self._line_index[skill]] = self._row(skill)
+        for key, line in self._footer().items():
+            self._lines[self._line_index[key]] = line
+        self.progress_file.write_text("\n".join(self._lines))
+
+
+# Stores reused within a process, keyed by onboarding directory
+_STORES: Dict[str, ProgressStore] = {}
+
+
+def open_store(project_dir: str) -> ProgressStore:
+    """
+    Get the in-process ProgressStore for a project, reloading if changed on disk.
+
+    Args:
+        project_dir: Project directory path
+
+    Returns:
+        ProgressStore
+    """
+    key = str(Path(project_dir).resolve() / ".agent" / "onboarding")
+    store = _STORES.get(key)
+    if store is None or store.is_stale():
+        store = ProgressStore(project_dir)
+        _STORES[key] = store
+    return store
 
 
 def init_progress(
@@ -33,10 +373,7 @@ def init_progress(
     Returns:
         Path to created progress file
     """
-    onboarding_dir = Path(project_dir) / ".agent" / "onboarding"
-    onboarding_dir.mkdir(parents=True, exist_ok=True)
-
-    progress_file = onboarding_dir / "PROGRESS.md"
+    progress_file = Path(project_dir) / ".agent" / "onboarding" / "PROGRESS.md"
 
     # Determine curriculum based on flow
     if flow_type == "quick_start":
@@ -46,52 +383,9 @@ def init_progress(
         essential = skills.get("essential_skills", [])
         development = skills.get("recommended_skills", [])
 
-    # Build progress table
-    essential_rows = []
-    for i, skill in enumerate(essential, 1):
-        essential_rows.append(f"| {i} | {skill} | pending | - | - |")
-
-    dev_rows = []
-    for i, skill in enumerate(development, len(essential) + 1):
-        dev_rows.append(f"| {i} | {skill} | pending | - | - |")
-
     total_skills = len(essential) + len(development)
 
-    # Format flow name
-    flow_name = "Quick Start" if flow_type == "quick_start" else "Full Education"
-
-    content = f"""# Navigator Onboarding Progress
-
-**Started**: {datetime.now().strftime("%Y-%m-%d %H:%M")}
-**Flow**: {flow_name}
-**Project**: {project_name} ({project_type})
-
----
-
-## Essential Skills
-
-| # | Skill | Status | Completed | Notes |
-|---|-------|--------|-----------|-------|
-{chr(10).join(essential_rows)}
-
-## Development Skills
-
-| # | Skill | Status | Completed | Notes |
-|---|-------|--------|-----------|-------|
-{chr(10).join(dev_rows) if dev_rows else "| - | (none for this flow) | - | - | - |"}
-
----
-
-**Progress**: 0/{total_skills} (0%)
-**Next Task**: {essential[0] if essential else "complete"}
-
-*Last Updated: {datetime.now().strftime("%Y-%m-%d %H:%M")}*
-"""
-
-    progress_file.write_text(content)
-
-    # Also save structured data for programmatic access
-    data_file = onboarding_dir / ".progress-data.json"
+    # Structured data for programmatic access; PROGRESS.md is rendered from it
     data = {
         "started": datetime.now().isoformat(),
         "flow_type": flow_type,
@@ -103,7 +397,10 @@ def init_progress(
         "total": total_skills,
         "completed": 0,
     }
-    data_file.write_text(json.dumps(data, indent=2))
+
+    store = ProgressStore(project_dir)
+    store.reset(data)
+    _STORES[store.key] = store
 
     return str(progress_file)
 
@@ -126,39 +423,22 @@ def update_progress(
     Returns:
         Updated progress summary
     """
-    onboarding_dir = Path(project_dir) / ".agent" / "onboarding"
-    data_file = onboarding_dir / ".progress-data.json"
-
-    if not data_file.exists():
-        return {"error": "Progress not initialized. Run init first."}
-
-    data = json.loads(data_file.read_text())
-
-    if skill_name not in data["progress"]:
-        return {"error": f"Unknown skill: {skill_name}"}
-
-    # Update skill status
-    data["progress"][skill_name]["status"] = status
-    if status == "completed":
-        data["progress"][skill_name]["completed"] = datetime.now().strftime("%Y-%m-%d %H:%M")
-        data["completed"] = sum(1 for s in data["progress"].values() if s["status"] == "completed")
-    if notes:
-        data["progress"][skill_name]["notes"] = notes
-
-    # Save updated data
-    data_file.write_text(json.dumps(data, indent=2))
-
-    # Regenerate markdown
-    _regenerate_markdown(onboarding_dir, data)
-
-    return {
-        "skill": skill_name,
-        "status": status,
-        "completed": data["completed"],
-        "total": data["total"],
-        "percentage": round(data["completed"] / data["total"] * 100) if data["total"] > 0 else 0,
-        "next_task": get_next_task(project_dir),
-    }
+    return open_store(project_dir).update(skill_name, status, notes)
+
+
+def advance_progress(project_dir: str, status: str = "completed", notes: str = "") -> Dict:
+    """
+    Mark the current next task and return the following one (next + update in one step).
+
+    Args:
+        project_dir: Project directory path
+        status: Status for the current task (default: "completed")
+        notes: Optional notes
+
+    Returns:
+        Updated progress summary with the new next_task
+    """
+    return open_store(project_dir).advance(status, notes)
 
 
 def get_progress(project_dir: str) -> Dict:
@@ -171,24 +451,7 @@ def get_progress(project_dir: str) -> Dict:
     Returns:
         Progress summary dictionary
     """
-    onboarding_dir = Path(project_dir) / ".agent" / "onboarding"
-    data_file = onboarding_dir / ".progress-data.json"
-
-    if not data_file.exists():
-        return {"initialized": False}
-
-    data = json.loads(data_file.read_text())
-
-    return {
-        "initialized": True,
-        "flow_type": data["flow_type"],
-        "project_type": data["project_type"],
-        "completed": data["completed"],
-        "total": data["total"],
-        "percentage": round(data["completed"] / data["total"] * 100) if data["total"] > 0 else 0,
-        "skills": data["progress"],
-        "next_task": get_next_task(project_dir),
-    }
+    return open_store(project_dir).summary()
 
 
 def get_next_task(project_dir: str) -> Optional[str]:
@@ -201,78 +464,7 @@ def get_next_task(project_dir: str) -> Optional[str]:
     Returns:
         Next skill name or None if complete
     """
-    onboarding_dir = Path(project_dir) / ".agent" / "onboarding"
-    data_file = onboarding_dir / ".progress-data.json"
-
-    if not data_file.exists():
-        return None
-
-    data = json.loads(data_file.read_text())
-
-    # Find first non-completed skill in order
-    all_skills = data["essential_skills"] + data["development_skills"]
-    for skill in all_skills:
-        if data["progress"][skill]["status"] != "completed":
-            return skill
-
-    return None
-
-
-def _regenerate_markdown(onboarding_dir: Path, data: Dict) -> None:
-    """Regenerate PROGRESS.md from data."""
-    progress_file = onboarding_dir / "PROGRESS.md"
-
-    # Build tables
-    essential_rows = []
-    for i, skill in enumerate(data["essential_skills"], 1):
-        p = data["progress"][skill]
-        status_icon = {"pending": "pending", "in_progress": "in_progress", "completed": "completed"}[p["status"]]
-        completed = p["completed"] or "-"
-        notes = p["notes"] or "-"
-        essential_rows.append(f"| {i} | {skill} | {status_icon} | {completed} | {notes} |")
-
-    dev_rows = []
-    for i, skill in enumerate(data["development_skills"], len(data["essential_skills"]) + 1):
-        p = data["progress"][skill]
-        status_icon = {"pending": "pending", "in_progress": "in_progress", "completed": "completed"}[p["status"]]
-        completed = p["completed"] or "-"
-        notes = p["notes"] or "-"
-        dev_rows.append(f"| {i} | {skill} | {status_icon} | {completed} | {notes} |")
-
-    percentage = round(data["completed"] / data["total"] * 100) if data["total"] > 0 else 0
-    next_task = get_next_task(str(onboarding_dir.parent.parent)) or "complete"
-
-    flow_name = "Quick Start" if data["flow_type"] == "quick_start" else "Full Education"
-
-    content = f"""# Navigator Onboarding Progress
-
-**Started**: {data["started"][:16].replace("T", " ")}
-**Flow**: {flow_name}
-**Project**: {data["project_name"]} ({data["project_type"]})
-
----
-
-## Essential Skills
-
-| # | Skill | Status | Completed | Notes |
-|---|-------|--------|-----------|-------|
-{chr(10).join(essential_rows)}
-
-## Development Skills
-
-| # | Skill | Status | Completed | Notes |
-|---|-------|--------|-----------|-------|
-{chr(10).join(dev_rows) if dev_rows else "| - | (none for this flow) | - | - | - |"}
-
----
-
-**Progress**: {data["completed"]}/{data["total"]} ({percentage}%)
-**Next Task**: {next_task}
-
-*Last Updated: {datetime.now().strftime("%Y-%m-%d %H:%M")}*
-"""
-
-    progress_file.write_text(content)
+    return open_store(project_dir).next_task()
 
 
 def format_progress_bar(completed: int, total: int, width: int = 30) -> str:
@@ -288,7 +480,7 @@ def format_progress_bar(completed: int, total: int, width: int = 30) -> str:
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: progress_tracker.py <command> [args]")
-        print("Commands: init, update, get, next")
+        print("Commands: init, update, advance, get, next")
         sys.exit(1)
 
     command = sys.argv[1]
@@ -332,6 +524,15 @@ if __name__ == "__main__":
         result = get_next_task(sys.argv[2])
         print(result or "complete")
 
+    elif command == "advance":
+        # advance <project_dir> [notes]  - complete the current task, print the next
+        if len(sys.argv) < 3:
+            print("Usage: progress_tracker.py advance <project_dir> [notes]")
+            sys.exit(1)
+        notes = sys.argv[3] if len(sys.argv) > 3 else ""
+        result = advance_progress(sys.argv[2], "completed", notes)
+        print(json.dumps(result, indent=2))
+
     else:
         print(f"Unknown command: {command}")
         sys.exit(1)
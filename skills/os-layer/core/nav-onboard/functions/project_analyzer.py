@@ -9,8 +9,13 @@ to recommend appropriate skills and workflow.
 import json
 import os
 import re
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from claude_settings import resolve_settings
+from dependency_index import DependencyIndex, build_dependency_index
+from project_fingerprint import ProjectFingerprint, fingerprint_project
 
 
 def analyze_project(cwd: str = ".") -> Dict:
@@ -24,6 +29,7 @@ def analyze_project(cwd: str = ".") -> Dict:
         Dictionary with project analysis results
     """
     cwd_path = Path(cwd).resolve()
+    fingerprint = fingerprint_project(str(cwd_path))
 
     result = {
         "project_name": cwd_path.name,
@@ -37,25 +43,26 @@ def analyze_project(cwd: str = ".") -> Dict:
         "has_storybook": False,
         "has_figma_mcp": False,
         "detected_from": [],
+        "detections": [],
         "confidence": 0.0,
     }
 
     # Check Navigator status
-    result["has_navigator"] = (cwd_path / ".agent").exists()
+    result["has_navigator"] = fingerprint.has(".agent")
 
     # Analyze different config files
-    _analyze_package_json(cwd_path, result)
-    _analyze_pyproject_toml(cwd_path, result)
-    _analyze_go_mod(cwd_path, result)
-    _analyze_cargo_toml(cwd_path, result)
-    _analyze_composer_json(cwd_path, result)
-    _analyze_gemfile(cwd_path, result)
+    _analyze_manifests(fingerprint, result)
 
     # Detect Storybook
-    result["has_storybook"] = (cwd_path / ".storybook").exists()
+    result["has_storybook"] = fingerprint.has(".storybook")
+
+    # Match declared/locked dependencies against the rule table
+    deps = build_dependency_index(fingerprint)
+    result["detections"] = detect_frameworks(deps)
+    _apply_detections(result, result["detections"], deps)
 
     # Detect Figma MCP (check Claude settings)
-    result["has_figma_mcp"] = _check_figma_mcp()
+    result["has_figma_mcp"] = _check_figma_mcp(str(cwd_path))
 
     # Determine project type
     result["project_type"] = _classify_project_type(result)
@@ -66,288 +73,214 @@ def analyze_project(cwd: str = ".") -> Dict:
     return result
 
 
-def _analyze_package_json(cwd: Path, result: Dict) -> None:
-    """Analyze package.json for Node.js/JavaScript projects."""
-    package_json = cwd / "package.json"
-    if not package_json.exists():
-        return
+# Detection rules per result field, highest precedence first:
+# (ecosystem, dependency name, value). "vendor/*" matches any package of a
+# composer vendor or npm scope. Across ecosystems the order is Gemfile,
+# composer.json, Cargo.toml, go.mod, pyproject.toml, package.json: the
+# manifest-by-manifest analysis this replaced let later manifests overwrite
+# earlier ones, so e.g. FastAPI in pyproject.toml beats Express in
+# package.json.
+FRAMEWORK_RULES = {
+    "frontend_framework": [
+        ("npm", "next", "Next.js"),
+        ("npm", "react", "React"),
+        ("npm", "vue", "Vue"),
+        ("npm", "@angular/core", "Angular"),
+        ("npm", "svelte", "Svelte"),
+    ],
+    "backend_framework": [
+        ("gem", "rails", "Ruby on Rails"),
+        ("gem", "sinatra", "Sinatra"),
+        ("composer", "laravel/*", "Laravel"),
+        ("composer", "symfony/*", "Symfony"),
+        ("cargo", "actix-web", "Actix Web"),
+        ("cargo", "rocket", "Rocket"),
+        ("cargo", "axum", "Axum"),
+        ("cargo", "warp", "Warp"),
+        ("go", "github.com/gin-gonic/gin", "Gin"),
+        ("go", "github.com/gofiber/fiber", "Fiber"),
+        ("go", "github.com/labstack/echo", "Echo"),
+        ("go", "github.com/go-chi/chi", "Chi"),
+        ("pypi", "fastapi", "FastAPI"),
+        ("pypi", "django", "Django"),
+        ("pypi", "flask", "Flask"),
+        ("pypi", "starlette", "Starlette"),
+        ("npm", "express", "Express"),
+        ("npm", "fastify", "Fastify"),
+        ("npm", "@nestjs/core", "NestJS"),
+        ("npm", "koa", "Koa"),
+        ("npm", "hono", "Hono"),
+    ],
+    "database": [
+        ("go", "github.com/go-sql-driver/mysql", "MySQL"),
+        ("go", "github.com/lib/pq", "PostgreSQL"),
+        ("go", "github.com/jackc/pgx", "PostgreSQL"),
+        ("pypi", "pymongo", "MongoDB"),
+        ("pypi", "motor", "MongoDB"),
+        ("pypi", "pymysql", "MySQL"),
+        ("pypi", "psycopg", "PostgreSQL"),
+        ("pypi", "psycopg2", "PostgreSQL"),
+        ("pypi", "psycopg2-binary", "PostgreSQL"),
+        ("pypi", "asyncpg", "PostgreSQL"),
+        ("npm", "mysql2", "MySQL"),
+        ("npm", "mysql", "MySQL"),
+        ("npm", "pg", "PostgreSQL"),
+        ("npm", "postgres", "PostgreSQL"),
+        ("npm", "mongoose", "MongoDB"),
+        ("npm", "mongodb", "MongoDB"),
+    ],
+    "orm": [
+        ("gem", "activerecord", "ActiveRecord"),
+        ("gem", "rails", "ActiveRecord"),
+        ("composer", "illuminate/database", "Eloquent"),
+        ("composer", "doctrine/*", "Doctrine"),
+        ("cargo", "diesel", "Diesel"),
+        ("cargo", "sqlx", "SQLx"),
+        ("cargo", "sea-orm", "SeaORM"),
+        ("go", "gorm.io/gorm", "GORM"),
+        ("pypi", "tortoise-orm", "Tortoise ORM"),
+        ("pypi", "sqlmodel", "SQLModel"),
+        ("pypi", "sqlalchemy", "SQLAlchemy"),
+        ("npm", "sequelize", "Sequelize"),
+        ("npm", "typeorm", "TypeORM"),
+        ("npm", "drizzle-orm", "Drizzle"),
+        ("npm", "mongoose", "Mongoose"),
+        ("npm", "prisma", "Prisma"),
+        ("npm", "@prisma/client", "Prisma"),
+    ],
+    "testing_framework": [
+        ("gem", "rspec", "RSpec"),
+        ("gem", "rspec-rails", "RSpec"),
+        ("gem", "minitest", "Minitest"),
+        ("composer", "phpunit/phpunit", "PHPUnit"),
+        ("pypi", "pytest", "Pytest"),
+        ("npm", "jest", "Jest"),
+        ("npm", "vitest", "Vitest"),
+        ("npm", "mocha", "Mocha"),
+        ("npm", "@playwright/test", "Playwright"),
+        ("npm", "playwright", "Playwright"),
+        ("npm", "cypress", "Cypress"),
+    ],
+    "has_storybook": [
+        ("npm", "@storybook/*", True),
+        ("npm", "storybook", True),
+    ],
+}
+
+# Confidence by where the dependency was found. Lockfile-only hits are
+# usually transitive, so they are reported but never fill a result field.
+SOURCE_CONFIDENCE = {"manifest+lockfile": 1.0, "manifest": 0.9, "lockfile": 0.3}
+MIN_CONFIDENCE = 0.5
+
+
+def _index_rules(rules: Dict[str, List]) -> Dict[Tuple[str, str], List[Tuple[str, object, int]]]:
+    """(ecosystem, dependency) -> [(field, value, precedence)]"""
+    index: Dict[Tuple[str, str], List[Tuple[str, object, int]]] = {}
+    for field_name, entries in rules.items():
+        for precedence, (ecosystem, dependency, value) in enumerate(entries):
+            index.setdefault((ecosystem, dependency), []).append((field_name, value, precedence))
+    return index
+
+
+_RULE_INDEX = _index_rules(FRAMEWORK_RULES)
+
+
+def detect_frameworks(deps: DependencyIndex) -> List[Dict]:
+    """
+    Match every known dependency against the rule table.
 
-    try:
-        with open(package_json) as f:
-            data = json.load(f)
+    Each dependency costs one dict lookup (two for scoped/vendored names).
 
-        result["project_name"] = data.get("name", result["project_name"])
-        result["detected_from"].append("package.json")
+    Args:
+        deps: Declared and locked dependencies
 
-        deps = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
-
-        # Frontend frameworks
-        if "next" in deps:
-            result["frontend_framework"] = "Next.js"
-        elif "react" in deps:
-            result["frontend_framework"] = "React"
-        elif "vue" in deps:
-            result["frontend_framework"] = "Vue"
-        elif "@angular/core" in deps:
-            result["frontend_framework"] = "Angular"
-        elif "svelte" in deps:
-            result["frontend_framework"] = "Svelte"
-
-        # Backend frameworks (Node.js)
-        if "express" in deps:
-            result["backend_framework"] = "Express"
-        elif "fastify" in deps:
-            result["backend_framework"] = "Fastify"
-        elif "@nestjs/core" in deps:
-            result["backend_framework"] = "NestJS"
-        elif "koa" in deps:
-            result["backend_framework"] = "Koa"
-        elif "hono" in deps:
-            result["backend_framework"] = "Hono"
-
-        # Database/ORM
-        if "prisma" in deps or "@prisma/client" in deps:
-            result["orm"] = "Prisma"
-        if "mongoose" in deps:
-            result["database"] = "MongoDB"
-            result["orm"] = "Mongoose"
-        if "pg" in deps:
-            result["database"] = "PostgreSQL"
-        if "mysql2" in deps or "mysql" in deps:
-            result["database"] = "MySQL"
-        if "drizzle-orm" in deps:
-            result["orm"] = "Drizzle"
-        if "typeorm" in deps:
-            result["orm"] = "TypeORM"
-        if "sequelize" in deps:
-            result["orm"] = "Sequelize"
-
-        # Testing
-        if "jest" in deps:
-            result["testing_framework"] = "Jest"
-            if "@testing-library/react" in deps:
-                result["testing_framework"] = "Jest + React Testing Library"
-        elif "vitest" in deps:
-            result["testing_framework"] = "Vitest"
-        elif "mocha" in deps:
-            result["testing_framework"] = "Mocha"
-        elif "playwright" in deps:
-            result["testing_framework"] = "Playwright"
-        elif "cypress" in deps:
-            result["testing_framework"] = "Cypress"
-
-        # Storybook
-        if "@storybook/react" in deps or "@storybook/vue" in deps:
+    Returns:
+        Detections sorted by field then precedence, each with
+        field, value, dependency, ecosystem, source and confidence
+    """
+    detections = []
+    for ecosystem, name in deps.items():
+        rules = _RULE_INDEX.get((ecosystem, name), [])
+        if "/" in name and ecosystem in ("npm", "composer"):
+            rules = rules + _RULE_INDEX.get((ecosystem, name.split("/", 1)[0] + "/*"), [])
+        if not rules:
+            continue
+
+        source = deps.source(ecosystem, name)
+        for field_name, value, precedence in rules:
+            detections.append({
+                "field": field_name,
+                "value": value,
+                "dependency": name,
+                "ecosystem": ecosystem,
+                "source": source,
+                "confidence": SOURCE_CONFIDENCE[source],
+                "_precedence": precedence,
+            })
+
+    detections.sort(key=lambda d: (d["field"], d["_precedence"], -d["confidence"]))
+    for detection in detections:
+        del detection["_precedence"]
+    return detections
+
+
+def _apply_detections(result: Dict, detections: List[Dict], deps: DependencyIndex) -> None:
+    """Fill each result field from its highest-precedence confident detection."""
+    for detection in detections:
+        field_name = detection["field"]
+        if detection["confidence"] < MIN_CONFIDENCE:
+            continue
+        if field_name == "has_storybook":
             result["has_storybook"] = True
+        elif result[field_name] is None:
+            result[field_name] = detection["value"]
 
-    except (json.JSONDecodeError, IOError):
-        pass
+    if result["testing_framework"] == "Jest" and "@testing-library/react" in deps.declared.get("npm", {}):
+        result["testing_framework"] = "Jest + React Testing Library"
 
 
-def _analyze_pyproject_toml(cwd: Path, result: Dict) -> None:
-    """Analyze pyproject.toml for Python projects."""
-    pyproject = cwd / "pyproject.toml"
-    if not pyproject.exists():
-        return
+def _analyze_manifests(fp: ProjectFingerprint, result: Dict) -> None:
+    """Record which manifests were found and take the project name from them."""
+    package_json = fp.get("package.json")
+    if package_json is not None and package_json.data is not None:
+        result["project_name"] = package_json.data.get("name", result["project_name"])
+        result["detected_from"].append("package.json")
 
-    try:
-        content = pyproject.read_text().lower()
+    if fp.has("pyproject.toml"):
         result["detected_from"].append("pyproject.toml")
+        name = fp.data("pyproject.toml").get("project", {}).get("name")
+        if name and not result["project_name"]:
+            result["project_name"] = name
 
-        # Extract name
-        name_match = re.search(r'name\s*=\s*["\']([^"\']+)["\']', content)
-        if name_match and not result["project_name"]:
-            result["project_name"] = name_match.group(1)
-
-        # Backend frameworks
-        if "fastapi" in content:
-            result["backend_framework"] = "FastAPI"
-        elif "django" in content:
-            result["backend_framework"] = "Django"
-        elif "flask" in content:
-            result["backend_framework"] = "Flask"
-        elif "starlette" in content:
-            result["backend_framework"] = "Starlette"
-
-        # ORM/Database
-        if "sqlalchemy" in content:
-            result["orm"] = "SQLAlchemy"
-        if "sqlmodel" in content:
-            result["orm"] = "SQLModel"
-        if "tortoise-orm" in content:
-            result["orm"] = "Tortoise ORM"
-        if "psycopg" in content or "asyncpg" in content:
-            result["database"] = "PostgreSQL"
-        if "pymysql" in content:
-            result["database"] = "MySQL"
-        if "pymongo" in content:
-            result["database"] = "MongoDB"
-
-        # Testing
-        if "pytest" in content:
-            result["testing_framework"] = "Pytest"
-
-    except IOError:
-        pass
-
-
-def _analyze_go_mod(cwd: Path, result: Dict) -> None:
-    """Analyze go.mod for Go projects."""
-    go_mod = cwd / "go.mod"
-    if not go_mod.exists():
-        return
-
-    try:
-        content = go_mod.read_text()
+    if fp.has("go.mod"):
         result["detected_from"].append("go.mod")
+        module = fp.data("go.mod").get("module")
+        if module:
+            result["project_name"] = module.split("/")[-1]
 
-        # Extract module name
-        module_match = re.search(r'module\s+([^\s]+)', content)
-        if module_match:
-            result["project_name"] = module_match.group(1).split("/")[-1]
-
-        # Backend frameworks
-        if "gin-gonic/gin" in content:
-            result["backend_framework"] = "Gin"
-        elif "gofiber/fiber" in content:
-            result["backend_framework"] = "Fiber"
-        elif "labstack/echo" in content:
-            result["backend_framework"] = "Echo"
-        elif "go-chi/chi" in content:
-            result["backend_framework"] = "Chi"
-
-        # ORM/Database
-        if "gorm.io/gorm" in content:
-            result["orm"] = "GORM"
-        if "sqlc" in content:
-            result["orm"] = "sqlc"
-        if "lib/pq" in content or "jackc/pgx" in content:
-            result["database"] = "PostgreSQL"
-        if "go-sql-driver/mysql" in content:
-            result["database"] = "MySQL"
-
-    except IOError:
-        pass
-
-
-def _analyze_cargo_toml(cwd: Path, result: Dict) -> None:
-    """Analyze Cargo.toml for Rust projects."""
-    cargo_toml = cwd / "Cargo.toml"
-    if not cargo_toml.exists():
-        return
-
-    try:
-        content = cargo_toml.read_text()
+    if fp.has("Cargo.toml"):
         result["detected_from"].append("Cargo.toml")
+        name = fp.data("Cargo.toml").get("package", {}).get("name")
+        if not name:
+            name_match = re.search(r'name\s*=\s*["\']([^"\']+)["\']', fp.text("Cargo.toml"))
+            name = name_match.group(1) if name_match else None
+        if name:
+            result["project_name"] = name
 
-        # Extract name
-        name_match = re.search(r'name\s*=\s*["\']([^"\']+)["\']', content)
-        if name_match:
-            result["project_name"] = name_match.group(1)
-
-        # Backend frameworks
-        if "actix-web" in content:
-            result["backend_framework"] = "Actix Web"
-        elif "rocket" in content:
-            result["backend_framework"] = "Rocket"
-        elif "axum" in content:
-            result["backend_framework"] = "Axum"
-        elif "warp" in content:
-            result["backend_framework"] = "Warp"
-
-        # ORM/Database
-        if "diesel" in content:
-            result["orm"] = "Diesel"
-        elif "sqlx" in content:
-            result["orm"] = "SQLx"
-        elif "sea-orm" in content:
-            result["orm"] = "SeaORM"
-
-    except IOError:
-        pass
-
-
-def _analyze_composer_json(cwd: Path, result: Dict) -> None:
-    """Analyze composer.json for PHP projects."""
-    composer_json = cwd / "composer.json"
-    if not composer_json.exists():
-        return
-
-    try:
-        with open(composer_json) as f:
-            data = json.load(f)
-
+    composer = fp.get("composer.json")
+    if composer is not None and composer.data is not None:
         result["detected_from"].append("composer.json")
-        name = data.get("name", "")
+        name = composer.data.get("name", "")
         if name:
             result["project_name"] = name.split("/")[-1]
 
-        deps = {**data.get("require", {}), **data.get("require-dev", {})}
-        deps_str = " ".join(deps.keys()).lower()
-
-        if "laravel" in deps_str:
-            result["backend_framework"] = "Laravel"
-        elif "symfony" in deps_str:
-            result["backend_framework"] = "Symfony"
-
-        if "doctrine" in deps_str:
-            result["orm"] = "Doctrine"
-        if "eloquent" in deps_str:
-            result["orm"] = "Eloquent"
-
-        if "phpunit" in deps_str:
-            result["testing_framework"] = "PHPUnit"
-
-    except (json.JSONDecodeError, IOError):
-        pass
-
-
-def _analyze_gemfile(cwd: Path, result: Dict) -> None:
-    """Analyze Gemfile for Ruby projects."""
-    gemfile = cwd / "Gemfile"
-    if not gemfile.exists():
-        return
-
-    try:
-        content = gemfile.read_text().lower()
+    if fp.has("Gemfile"):
         result["detected_from"].append("Gemfile")
 
-        if "rails" in content:
-            result["backend_framework"] = "Ruby on Rails"
-        elif "sinatra" in content:
-            result["backend_framework"] = "Sinatra"
-
-        if "activerecord" in content or "rails" in content:
-            result["orm"] = "ActiveRecord"
-
-        if "rspec" in content:
-            result["testing_framework"] = "RSpec"
-        elif "minitest" in content:
-            result["testing_framework"] = "Minitest"
 
-    except IOError:
-        pass
-
-
-def _check_figma_mcp() -> bool:
-    """Check if Figma MCP is configured in Claude settings."""
-    # Check common Claude config locations
-    config_paths = [
-        Path.home() / ".claude" / "settings.json",
-        Path.home() / ".config" / "claude" / "settings.json",
-    ]
-
-    for config_path in config_paths:
-        if config_path.exists():
-            try:
-                with open(config_path) as f:
-                    config = json.load(f)
-                    mcp_servers = config.get("mcpServers", {})
-                    return "figma" in str(mcp_servers).lower()
-            except (json.JSONDecodeError, IOError):
-                pass
-
-    return False
+def _check_figma_mcp(cwd: str = ".") -> bool:
+    """Check if a Figma MCP server is configured in any Claude settings layer."""
+    return resolve_settings(cwd).has_mcp_server("figma")
 
 
 def _classify_project_type(result: Dict) -> str:
@@ -412,9 +345,12 @@ def format_tech_stack(result: Dict) -> str:
 
 
 if __name__ == "__main__":
-    import sys
-
-    cwd = sys.argv[1] if len(sys.argv) > 1 else "."
-    result = analyze_project(cwd)
-    result["tech_stack"] = format_tech_stack(result)
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    cwd = args[0] if args else "."
+    if "--no-cache" in sys.argv:
+        result = analyze_project(cwd)
+        result["tech_stack"] = format_tech_stack(result)
+    else:
+        from analysis_cache import cached_analyze_project
+        result = cached_analyze_project(cwd, refresh="--refresh" in sys.argv)
     print(json.dumps(result, indent=2))
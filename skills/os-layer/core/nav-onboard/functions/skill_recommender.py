@@ -2,12 +2,14 @@
 """
 Skill recommendation engine for Navigator onboarding.
 
-Maps project analysis to recommended skills and workflow order.
+Maps project analysis to recommended skills and workflow order. The SKILLS
+catalogue is compiled once into bitsets per project type, requirement and
+category; a recommendation is a few mask operations plus a cached curriculum.
 """
 
 import json
 import sys
-from typing import Dict, List
+from typing import Dict, Iterator, List, Tuple
 
 
 # Skill definitions with metadata
@@ -140,6 +142,121 @@ SKILLS = {
 }
 
 
+# Analysis predicates for skill "requires" entries (unknown requirements are treated as met)
+REQUIREMENTS = {
+    "has_storybook": lambda analysis: bool(analysis.get("has_storybook")),
+    "has_figma_mcp": lambda analysis: bool(analysis.get("has_figma_mcp")),
+    "database": lambda analysis: bool(analysis.get("database")),
+}
+
+
+def _bits(mask: int) -> Iterator[int]:
+    """Indices of set bits, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class SkillIndex:
+    """
+    SKILLS compiled into bitsets.
+
+    Bit i is the i-th skill in workflow order, so walking a mask's set bits
+    from low to high yields skills already sorted by workflow_position.
+    """
+
+    def __init__(self, skills: Dict[str, Dict]):
+        # Stable sort keeps catalogue order for equal positions
+        ordered = sorted(skills.items(), key=lambda item: item[1]["workflow_position"])
+        self.ids = [skill_id for skill_id, _ in ordered]
+        self.info = [
+            {
+                "id": skill_id,
+                "name": skill["name"],
+                "description": skill["description"],
+                "triggers": skill["triggers"],
+                "time_savings": skill["time_savings"],
+                "workflow_position": skill["workflow_position"],
+            }
+            for skill_id, skill in ordered
+        ]
+
+        self.all_types = 0
+        self.type_masks: Dict[str, int] = {}
+        self.requirement_masks: Dict[str, int] = {}
+        self.category_masks: Dict[str, int] = {}
+
+        for i, (_, skill) in enumerate(ordered):
+            bit = 1 << i
+            for project_type in skill["project_types"]:
+                if project_type == "all":
+                    self.all_types |= bit
+                else:
+                    self.type_masks[project_type] = self.type_masks.get(project_type, 0) | bit
+            for requirement in skill.get("requires", []):
+                self.requirement_masks[requirement] = self.requirement_masks.get(requirement, 0) | bit
+            self.category_masks[skill["category"]] = self.category_masks.get(skill["category"], 0) | bit
+
+        self._curricula: Dict[Tuple[int, int, int], Dict] = {}
+
+    def select(self, project_analysis: Dict) -> Tuple[int, int, int]:
+        """Essential, recommended and optional masks for a project."""
+        project_type = project_analysis.get("project_type", "unknown")
+        candidates = self.all_types | self.type_masks.get(project_type, 0)
+
+        unmet = 0
+        for requirement, mask in self.requirement_masks.items():
+            check = REQUIREMENTS.get(requirement)
+            if check is not None and not check(project_analysis):
+                unmet |= mask
+
+        category = self.category_masks.get
+        essential = candidates & category("essential", 0)
+        recommended = candidates & category("development", 0) & ~unmet
+        optional = candidates & ((category("optional", 0) & ~unmet) | category("advanced", 0))
+        return essential, recommended, optional
+
+    def skills(self, mask: int) -> List[Dict]:
+        return [dict(self.info[i]) for i in _bits(mask)]
+
+    def curriculum(self, essential: int, recommended: int, optional: int) -> Dict:
+        """Workflow order and curricula for a selection, computed once per selection."""
+        key = (essential, recommended, optional)
+        cached = self._curricula.get(key)
+        if cached is None:
+            essential_skills = [self.info[i] for i in _bits(essential)]
+            recommended_skills = [self.info[i] for i in _bits(recommended)]
+            optional_skills = [self.info[i] for i in _bits(optional)]
+            cached = {
+                "workflow_order": [self.ids[i] for i in _bits(essential | recommended)],
+                "quick_start": _generate_quick_start_curriculum(essential_skills, recommended_skills),
+                "full_education": _generate_full_curriculum(essential_skills, recommended_skills, optional_skills),
+            }
+            self._curricula[key] = cached
+        # Entries are flat dicts; hand out copies so callers can't corrupt the cache
+        return {
+            "workflow_order": list(cached["workflow_order"]),
+            "quick_start": [dict(e) for e in cached["quick_start"]],
+            "full_education": [dict(e) for e in cached["full_education"]],
+        }
+
+
+_INDEX = SkillIndex(SKILLS)
+
+
+def register_skills(skills: Dict[str, Dict]) -> None:
+    """
+    Add (or replace) catalogue entries, e.g. third-party skills, and recompile the index.
+
+    Args:
+        skills: Skill definitions keyed by id, same shape as SKILLS
+    """
+    global _INDEX
+    SKILLS.update(skills)
+    _INDEX = SkillIndex(SKILLS)
+
+
 def recommend_skills(project_analysis: Dict) -> Dict:
     """
     Generate skill recommendations based on project analysis.
@@ -150,73 +267,29 @@ def recommend_skills(project_analysis: Dict) -> Dict:
     Returns:
         Dictionary with skill recommendations and workflow order
     """
+    index = _INDEX
     project_type = project_analysis.get("project_type", "unknown")
 
-    essential = []
-    recommended = []
-    optional = []
-
-    for skill_id, skill in SKILLS.items():
-        # Check project type compatibility
-        skill_types = skill["project_types"]
-        if "all" not in skill_types and project_type not in skill_types:
-            continue
-
-        # Check requirements
-        requirements = skill.get("requires", [])
-        meets_requirements = True
-        for req in requirements:
-            if req == "has_storybook" and not project_analysis.get("has_storybook"):
-                meets_requirements = False
-            elif req == "has_figma_mcp" and not project_analysis.get("has_figma_mcp"):
-                meets_requirements = False
-            elif req == "database" and not project_analysis.get("database"):
-                meets_requirements = False
-
-        # Categorize skill
-        category = skill["category"]
-        skill_info = {
-            "id": skill_id,
-            "name": skill["name"],
-            "description": skill["description"],
-            "triggers": skill["triggers"],
-            "time_savings": skill["time_savings"],
-            "workflow_position": skill["workflow_position"],
-        }
-
-        if category == "essential":
-            essential.append(skill_info)
-        elif category == "development" and meets_requirements:
-            recommended.append(skill_info)
-        elif category == "optional" and meets_requirements:
-            optional.append(skill_info)
-        elif category == "advanced":
-            optional.append(skill_info)
-
-    # Sort by workflow position
-    essential.sort(key=lambda x: x["workflow_position"])
-    recommended.sort(key=lambda x: x["workflow_position"])
-    optional.sort(key=lambda x: x["workflow_position"])
-
-    # Generate workflow order
-    all_skills = essential + recommended
-    all_skills.sort(key=lambda x: x["workflow_position"])
-    workflow_order = [s["id"] for s in all_skills]
+    essential_mask, recommended_mask, optional_mask = index.select(project_analysis)
+    essential = index.skills(essential_mask)
+    recommended = index.skills(recommended_mask)
+    optional = index.skills(optional_mask)
+    curriculum = index.curriculum(essential_mask, recommended_mask, optional_mask)
 
     return {
         "project_type": project_type,
         "essential_skills": [s["id"] for s in essential],
         "recommended_skills": [s["id"] for s in recommended],
         "optional_skills": [s["id"] for s in optional],
-        "workflow_order": workflow_order,
+        "workflow_order": curriculum["workflow_order"],
         "skill_details": {
             "essential": essential,
             "recommended": recommended,
             "optional": optional,
         },
         "curriculum": {
-            "quick_start": _generate_quick_start_curriculum(essential, recommended),
-            "full_education": _generate_full_curriculum(essential, recommended, optional),
+            "quick_start": curriculum["quick_start"],
+            "full_education": curriculum["full_education"],
         },
     }
 
@@ -2,7 +2,8 @@
 """
 Task validation for Navigator onboarding.
 
-Validates whether learning tasks have been completed.
+Validates whether learning tasks have been completed. Validators that look
+for project files share one pruned, .gitignore-aware FileIndex per run.
 """
 
 import json
@@ -12,14 +13,22 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from file_index import FileEntry, FileIndex
 
-def validate_task(project_dir: str, skill_name: str) -> Dict:
+# Learning-task artifacts: names like Onboarding*/onboarding*/Demo*/demo*
+ARTIFACT_PREFIXES = ("Onboarding", "onboarding", "Demo", "demo")
+TEST_SUFFIXES = (".test.ts", ".test.tsx", ".test.js", ".spec.ts", "_test.py", "_test.go")
+RECENT_HOURS = 1
+
+
+def validate_task(project_dir: str, skill_name: str, index: Optional[FileIndex] = None) -> Dict:
     """
     Validate if a learning task has been completed.
 
     Args:
         project_dir: Project directory path
         skill_name: Name of skill to validate
+        index: Shared file index (built on demand if omitted)
 
     Returns:
         Validation result dictionary
@@ -46,10 +55,25 @@ def validate_task(project_dir: str, skill_name: str) -> Dict:
             "suggestion": "Mark as complete manually if you've done the task",
         }
 
-    return validator(Path(project_dir))
+    return validator(Path(project_dir), index or FileIndex(project_dir))
+
+
+def validate_tasks(project_dir: str, skill_names: List[str]) -> Dict[str, Dict]:
+    """
+    Validate several learning tasks against one shared file index.
 
+    Args:
+        project_dir: Project directory path
+        skill_names: Skills to validate
 
-def _validate_nav_start(project_dir: Path) -> Dict:
+    Returns:
+        Validation results keyed by skill name
+    """
+    index = FileIndex(project_dir)
+    return {name: validate_task(project_dir, name, index) for name in skill_names}
+
+
+def _validate_nav_start(project_dir: Path, index: FileIndex) -> Dict:
     """
     Validate nav-start task.
 
@@ -63,7 +87,7 @@ def _validate_nav_start(project_dir: Path) -> Dict:
     }
 
 
-def _validate_nav_marker(project_dir: Path) -> Dict:
+def _validate_nav_marker(project_dir: Path, index: FileIndex) -> Dict:
     """
     Validate nav-marker task.
 
@@ -121,7 +145,7 @@ def _validate_nav_marker(project_dir: Path) -> Dict:
     }
 
 
-def _validate_nav_task(project_dir: Path) -> Dict:
+def _validate_nav_task(project_dir: Path, index: FileIndex) -> Dict:
     """
     Validate nav-task task.
 
@@ -168,7 +192,7 @@ def _validate_nav_task(project_dir: Path) -> Dict:
     }
 
 
-def _validate_nav_sop(project_dir: Path) -> Dict:
+def _validate_nav_sop(project_dir: Path, index: FileIndex) -> Dict:
     """
     Validate nav-sop task.
 
@@ -230,7 +254,7 @@ def _validate_nav_sop(project_dir: Path) -> Dict:
     }
 
 
-def _validate_nav_compact(project_dir: Path) -> Dict:
+def _validate_nav_compact(project_dir: Path, index: FileIndex) -> Dict:
     """
     Validate nav-compact task.
 
@@ -267,34 +291,27 @@ def _validate_nav_compact(project_dir: Path) -> Dict:
     }
 
 
-def _validate_frontend_component(project_dir: Path) -> Dict:
+def _is_artifact(entry: FileEntry) -> bool:
+    return entry.name.startswith(ARTIFACT_PREFIXES)
+
+
+def _validate_frontend_component(project_dir: Path, index: FileIndex) -> Dict:
     """
     Validate frontend-component task.
 
     Checks for component files with 'onboarding' or 'demo' in name.
     """
     # Common component directories
-    search_dirs = [
-        project_dir / "src" / "components",
-        project_dir / "components",
-        project_dir / "app" / "components",
-        project_dir / "src",
-    ]
-
-    for search_dir in search_dirs:
-        if not search_dir.exists():
-            continue
-
-        # Look for onboarding/demo related files
-        for pattern in ["**/[Oo]nboarding*", "**/[Dd]emo*"]:
-            matches = list(search_dir.glob(pattern))
-            if matches:
-                return {
-                    "valid": True,
-                    "method": "file_check",
-                    "component_path": str(matches[0]),
-                    "message": f"Found component: {matches[0].name}",
-                }
+    search_dirs = ["src/components", "components", "app/components", "src"]
+
+    match = index.find(_is_artifact, under=search_dirs)
+    if match:
+        return {
+            "valid": True,
+            "method": "file_check",
+            "component_path": str(project_dir / match.path),
+            "message": f"Found component: {match.name}",
+        }
 
     return {
         "valid": False,
@@ -304,35 +321,23 @@ def _validate_frontend_component(project_dir: Path) -> Dict:
     }
 
 
-def _validate_backend_endpoint(project_dir: Path) -> Dict:
+def _validate_backend_endpoint(project_dir: Path, index: FileIndex) -> Dict:
     """
     Validate backend-endpoint task.
 
     Checks for route/endpoint files with 'onboarding' or 'demo' in name.
     """
     # Common route directories
-    search_dirs = [
-        project_dir / "src" / "routes",
-        project_dir / "src" / "api",
-        project_dir / "routes",
-        project_dir / "api",
-        project_dir / "app" / "api",
-    ]
-
-    for search_dir in search_dirs:
-        if not search_dir.exists():
-            continue
-
-        # Look for onboarding/demo related files
-        for pattern in ["**/[Oo]nboarding*", "**/[Dd]emo*"]:
-            matches = list(search_dir.glob(pattern))
-            if matches:
-                return {
-                    "valid": True,
-                    "method": "file_check",
-                    "endpoint_path": str(matches[0]),
-                    "message": f"Found endpoint: {matches[0].name}",
-                }
+    search_dirs = ["src/routes", "src/api", "routes", "api", "app/api"]
+
+    match = index.find(_is_artifact, under=search_dirs)
+    if match:
+        return {
+            "valid": True,
+            "method": "file_check",
+            "endpoint_path": str(project_dir / match.path),
+            "message": f"Found endpoint: {match.name}",
+        }
 
     return {
         "valid": False,
@@ -342,31 +347,27 @@ def _validate_backend_endpoint(project_dir: Path) -> Dict:
     }
 
 
-def _validate_frontend_test(project_dir: Path) -> Dict:
+def _validate_frontend_test(project_dir: Path, index: FileIndex) -> Dict:
     """Validate frontend-test task."""
-    return _validate_test_file(project_dir, "frontend")
+    return _validate_test_file(project_dir, index, "frontend")
 
 
-def _validate_backend_test(project_dir: Path) -> Dict:
+def _validate_backend_test(project_dir: Path, index: FileIndex) -> Dict:
     """Validate backend-test task."""
-    return _validate_test_file(project_dir, "backend")
+    return _validate_test_file(project_dir, index, "backend")
 
 
-def _validate_test_file(project_dir: Path, test_type: str) -> Dict:
+def _validate_test_file(project_dir: Path, index: FileIndex, test_type: str) -> Dict:
     """Generic test file validation."""
-    # Look for test files
-    patterns = ["**/*.test.ts", "**/*.test.tsx", "**/*.test.js", "**/*.spec.ts", "**/*_test.py", "**/*_test.go"]
-
-    for pattern in patterns:
-        matches = list(project_dir.glob(pattern))
-        recent = [m for m in matches if _is_recent(m)]
-        if recent:
-            return {
-                "valid": True,
-                "method": "file_check",
-                "test_file": str(recent[0]),
-                "message": f"Found recent test: {recent[0].name}",
-            }
+    # First recently modified test file wins
+    match = index.find(lambda e: not e.is_dir and e.name.endswith(TEST_SUFFIXES), recent_hours=RECENT_HOURS)
+    if match:
+        return {
+            "valid": True,
+            "method": "file_check",
+            "test_file": str(project_dir / match.path),
+            "message": f"Found recent test: {match.name}",
+        }
 
     return {
         "valid": True,
@@ -376,27 +377,19 @@ def _validate_test_file(project_dir: Path, test_type: str) -> Dict:
     }
 
 
-def _validate_database_migration(project_dir: Path) -> Dict:
+def _validate_database_migration(project_dir: Path, index: FileIndex) -> Dict:
     """Validate database-migration task."""
     # Common migration directories
-    migration_dirs = [
-        project_dir / "prisma" / "migrations",
-        project_dir / "migrations",
-        project_dir / "db" / "migrations",
-        project_dir / "alembic" / "versions",
-    ]
-
-    for migration_dir in migration_dirs:
-        if migration_dir.exists():
-            migrations = list(migration_dir.glob("*"))
-            recent = [m for m in migrations if _is_recent(m)]
-            if recent:
-                return {
-                    "valid": True,
-                    "method": "file_check",
-                    "migration_path": str(recent[0]),
-                    "message": f"Found recent migration: {recent[0].name}",
-                }
+    migration_dirs = {"prisma/migrations", "migrations", "db/migrations", "alembic/versions"}
+
+    match = index.find(lambda e: e.parent() in migration_dirs, under=migration_dirs, recent_hours=RECENT_HOURS)
+    if match:
+        return {
+            "valid": True,
+            "method": "file_check",
+            "migration_path": str(project_dir / match.path),
+            "message": f"Found recent migration: {match.name}",
+        }
 
     return {
         "valid": True,
@@ -417,8 +410,11 @@ def _is_recent(path: Path, hours: int = 1) -> bool:
 
 if __name__ == "__main__":
     if len(sys.argv) < 3:
-        print("Usage: task_validator.py <project_dir> <skill_name>")
+        print("Usage: task_validator.py <project_dir> <skill_name> [skill_name ...]")
         sys.exit(1)
 
-    result = validate_task(sys.argv[1], sys.argv[2])
+    if len(sys.argv) == 3:
+        result = validate_task(sys.argv[1], sys.argv[2])
+    else:
+        result = validate_tasks(sys.argv[1], sys.argv[2:])
     print(json.dumps(result, indent=2))
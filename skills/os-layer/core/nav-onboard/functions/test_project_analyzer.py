@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests for onboarding project analysis.
+
+Run from this directory: python3 -m pytest test_project_analyzer.py
+"""
+
+import json
+
+import pytest
+
+from project_analyzer import analyze_project
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    root = tmp_path / "project"
+    root.mkdir()
+    return root
+
+
+def _package_json(root, dependencies, dev_dependencies=None):
+    (root / "package.json").write_text(json.dumps({
+        "name": "web",
+        "dependencies": dependencies,
+        "devDependencies": dev_dependencies or {},
+    }), encoding="utf-8")
+
+
+def _pyproject(root, dependencies):
+    lines = ",\n".join(f'    "{dep}"' for dep in dependencies)
+    (root / "pyproject.toml").write_text(
+        f'[project]\nname = "api"\ndependencies = [\n{lines}\n]\n', encoding="utf-8"
+    )
+
+
+def test_pyproject_framework_beats_package_json(project):
+    _package_json(project, {"express": "^4.18.0", "react": "^18.2.0"}, {"jest": "^29.0.0"})
+    _pyproject(project, ["fastapi>=0.100", "pytest>=7"])
+
+    result = analyze_project(str(project))
+
+    assert result["backend_framework"] == "FastAPI"
+    assert result["frontend_framework"] == "React"
+    assert result["testing_framework"] == "Pytest"
+
+
+def test_first_rule_wins_within_an_ecosystem(project):
+    _package_json(project, {"next": "^14.0.0", "react": "^18.2.0", "express": "^4.18.0", "koa": "^2.0.0"})
+
+    result = analyze_project(str(project))
+
+    assert result["frontend_framework"] == "Next.js"
+    assert result["backend_framework"] == "Express"
+
+
+def test_mentions_outside_dependencies_are_ignored(project):
+    (project / "package.json").write_text(json.dumps({
+        "name": "docs",
+        "description": "Notes on migrating from express to fastify",
+        "dependencies": {"vue": "^3.0.0"},
+    }), encoding="utf-8")
+
+    result = analyze_project(str(project))
+
+    assert result["frontend_framework"] == "Vue"
+    assert result["backend_framework"] is None
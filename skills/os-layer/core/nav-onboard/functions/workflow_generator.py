@@ -12,80 +12,46 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
 
+from template_engine import compile_template
 
-def generate_workflow(
-    project_dir: str,
-    project_analysis: Dict,
-    skill_recommendations: Dict
-) -> str:
-    """
-    Generate personalized workflow guide.
-
-    Args:
-        project_dir: Project directory path
-        project_analysis: Output from project_analyzer.py
-        skill_recommendations: Output from skill_recommender.py
-
-    Returns:
-        Path to generated workflow file
-    """
-    onboarding_dir = Path(project_dir) / ".agent" / "onboarding"
-    onboarding_dir.mkdir(parents=True, exist_ok=True)
-
-    workflow_file = onboarding_dir / "MY-WORKFLOW.md"
-
-    # Extract info
-    project_name = project_analysis.get("project_name", "Unknown")
-    project_type = project_analysis.get("project_type", "unknown")
-    tech_stack = _format_tech_stack(project_analysis)
-
-    essential = skill_recommendations.get("skill_details", {}).get("essential", [])
-    recommended = skill_recommendations.get("skill_details", {}).get("recommended", [])
-    optional = skill_recommendations.get("skill_details", {}).get("optional", [])
-    workflow_order = skill_recommendations.get("workflow_order", [])
-
-    # Generate sections
-    workflow_diagram = _generate_workflow_diagram(project_type, workflow_order)
-    daily_workflow = _generate_daily_workflow(project_type, recommended)
-    skills_table = _generate_skills_table(essential, recommended, optional)
-    quick_reference = _generate_quick_reference(essential, recommended)
 
-    content = f"""# My Navigator Workflow
+# Compiled once per process (and cached on disk by template_engine)
+WORKFLOW_TEMPLATE = compile_template("""# My Navigator Workflow
 
-**Generated**: {datetime.now().strftime("%Y-%m-%d %H:%M")}
-**Project**: {project_name}
-**Type**: {project_type.title()}
-**Stack**: {tech_stack}
+**Generated**: ${GENERATED}
+**Project**: ${PROJECT_NAME}
+**Type**: ${PROJECT_TYPE_TITLE}
+**Stack**: ${TECH_STACK}
 
 ---
 
 ## Workflow Diagram
 
-{workflow_diagram}
+${WORKFLOW_DIAGRAM}
 
 ---
 
 ## Daily Workflow
 
-{daily_workflow}
+${DAILY_WORKFLOW}
 
 ---
 
 ## Skills Reference
 
-{skills_table}
+${SKILLS_TABLE}
 
 ---
 
 ## Quick Reference
 
-{quick_reference}
+${QUICK_REFERENCE}
 
 ---
 
-## Tips for {project_type.title()} Projects
+## Tips for ${PROJECT_TYPE_TITLE} Projects
 
-{_generate_tips(project_type, project_analysis)}
+${TIPS}
 
 ---
 
@@ -99,11 +65,62 @@ def generate_workflow(
 
 ---
 
-*This workflow was personalized for your {project_type} project.*
+*This workflow was personalized for your ${PROJECT_TYPE} project.*
 *Update as your needs evolve.*
 
 **Navigator Version**: 4.6.0
-"""
+""")
+
+
+def generate_workflow(
+    project_dir: str,
+    project_analysis: Dict,
+    skill_recommendations: Dict
+) -> str:
+    """
+    Generate personalized workflow guide.
+
+    Args:
+        project_dir: Project directory path
+        project_analysis: Output from project_analyzer.py
+        skill_recommendations: Output from skill_recommender.py
+
+    Returns:
+        Path to generated workflow file
+    """
+    onboarding_dir = Path(project_dir) / ".agent" / "onboarding"
+    onboarding_dir.mkdir(parents=True, exist_ok=True)
+
+    workflow_file = onboarding_dir / "MY-WORKFLOW.md"
+
+    # Extract info
+    project_name = project_analysis.get("project_name", "Unknown")
+    project_type = project_analysis.get("project_type", "unknown")
+    tech_stack = _format_tech_stack(project_analysis)
+
+    essential = skill_recommendations.get("skill_details", {}).get("essential", [])
+    recommended = skill_recommendations.get("skill_details", {}).get("recommended", [])
+    optional = skill_recommendations.get("skill_details", {}).get("optional", [])
+    workflow_order = skill_recommendations.get("workflow_order", [])
+
+    # Generate sections
+    workflow_diagram = _generate_workflow_diagram(project_type, workflow_order)
+    daily_workflow = _generate_daily_workflow(project_type, recommended)
+    skills_table = _generate_skills_table(essential, recommended, optional)
+    quick_reference = _generate_quick_reference(essential, recommended)
+
+    content = WORKFLOW_TEMPLATE.render({
+        "GENERATED": datetime.now().strftime("%Y-%m-%d %H:%M"),
+        "PROJECT_NAME": project_name,
+        "PROJECT_TYPE": project_type,
+        "PROJECT_TYPE_TITLE": project_type.title(),
+        "TECH_STACK": tech_stack,
+        "WORKFLOW_DIAGRAM": workflow_diagram,
+        "DAILY_WORKFLOW": daily_workflow,
+        "SKILLS_TABLE": skills_table,
+        "QUICK_REFERENCE": quick_reference,
+        "TIPS": _generate_tips(project_type, project_analysis),
+    })
 
     workflow_file.write_text(content)
     return str(workflow_file)
@@ -263,12 +280,7 @@ SESSION START
 ```"""
 
 
-def _generate_daily_workflow(project_type: str, recommended: List[Dict]) -> str:
-    """Generate daily workflow checklist."""
-    dev_skills = [s["name"] for s in recommended[:2]] if recommended else ["development skills"]
-    dev_skills_str = ", ".join(dev_skills)
-
-    return f"""### Morning Routine
+DAILY_WORKFLOW_TEMPLATE = compile_template("""### Morning Routine
 
 1. **Start session**: "Start my Navigator session"
 2. **Check tasks**: Review `.agent/tasks/` index for current work
@@ -276,7 +288,7 @@ def _generate_daily_workflow(project_type: str, recommended: List[Dict]) -> str:
 
 ### During Development
 
-4. **Use dev skills**: {dev_skills_str}
+4. **Use dev skills**: ${DEV_SKILLS}
 5. **Create checkpoints**: Before breaks or risky changes
 6. **Document decisions**: Update task doc with technical choices
 
@@ -289,7 +301,15 @@ def _generate_daily_workflow(project_type: str, recommended: List[Dict]) -> str:
 ### End of Session
 
 10. **Clear context**: "Clear context and preserve markers" (if switching tasks)
-11. **Or keep context**: If continuing same work tomorrow"""
+11. **Or keep context**: If continuing same work tomorrow""")
+
+
+def _generate_daily_workflow(project_type: str, recommended: List[Dict]) -> str:
+    """Generate daily workflow checklist."""
+    dev_skills = [s["name"] for s in recommended[:2]] if recommended else ["development skills"]
+    dev_skills_str = ", ".join(dev_skills)
+
+    return DAILY_WORKFLOW_TEMPLATE.render({"DEV_SKILLS": dev_skills_str})
 
 
 def _generate_skills_table(
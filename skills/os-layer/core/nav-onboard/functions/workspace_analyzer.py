@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Workspace-aware project analysis for Navigator onboarding.
+
+Discovers member packages of npm/yarn/pnpm workspaces, Cargo workspaces,
+go.work and uv workspaces, analyzes them concurrently and aggregates a
+per-package tech-stack map plus a repo-level summary.
+"""
+
+import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from project_analyzer import analyze_project, format_tech_stack
+from project_fingerprint import MANIFESTS, fingerprint_project
+
+# Directories never treated as workspace members
+SKIP_DIRS = {"node_modules", ".git", "dist", "build", "target", ".venv", "venv", "vendor"}
+
+
+def _pnpm_workspace_patterns(root: Path) -> List[str]:
+    """Read `packages:` entries from pnpm-workspace.yaml without a YAML parser."""
+    patterns = []
+    in_packages = False
+
+    try:
+        lines = (root / "pnpm-workspace.yaml").read_text().splitlines()
+    except OSError:
+        return patterns
+
+    for line in lines:
+        if re.match(r"^packages\s*:", line):
+            in_packages = True
+            continue
+        if in_packages:
+            item = re.match(r"^\s+-\s*['\"]?([^'\"#]+?)['\"]?\s*(#.*)?$", line)
+            if item:
+                patterns.append(item.group(1))
+            elif line.strip() and not line.startswith((" ", "\t")):
+                break
+
+    return patterns
+
+
+def _go_work_patterns(root: Path) -> List[str]:
+    """Read `use` directives from go.work."""
+    try:
+        text = (root / "go.work").read_text()
+    except OSError:
+        return []
+
+    patterns = []
+    in_block = False
+    for raw in text.splitlines():
+        line = raw.split("//", 1)[0].strip()
+        if line.startswith("use ("):
+            in_block = True
+        elif in_block and line == ")":
+            in_block = False
+        elif in_block and line:
+            patterns.append(line)
+        elif line.startswith("use "):
+            patterns.append(line[4:].strip())
+
+    return patterns
+
+
+def discover_workspace(cwd: str = ".") -> Dict:
+    """
+    Find workspace member packages declared by the root manifests.
+
+    Args:
+        cwd: Repository root
+
+    Returns:
+        Dictionary with workspace kinds and member paths (relative to root)
+    """
+    root = Path(cwd).resolve()
+    fp = fingerprint_project(str(root))
+
+    kinds = []
+    patterns: List[str] = []
+
+    workspaces = fp.data("package.json").get("workspaces")
+    if isinstance(workspaces, dict):
+        workspaces = workspaces.get("packages", [])
+    if workspaces:
+        kinds.append("npm")
+        patterns.extend(workspaces)
+
+    if fp.has("pnpm-workspace.yaml"):
+        kinds.append("pnpm")
+        patterns.extend(_pnpm_workspace_patterns(root))
+
+    cargo_members = fp.data("Cargo.toml").get("workspace", {}).get("members", [])
+    if cargo_members:
+        kinds.append("cargo")
+        patterns.extend(cargo_members)
+
+    if fp.has("go.work"):
+        kinds.append("go")
+        patterns.extend(_go_work_patterns(root))
+
+    uv_members = fp.data("pyproject.toml").get("tool", {}).get("uv", {}).get("workspace", {}).get("members", [])
+    if uv_members:
+        kinds.append("uv")
+        patterns.extend(uv_members)
+
+    excluded = set()
+    members = set()
+    for pattern in patterns:
+        negate = pattern.startswith("!")
+        pattern = pattern.lstrip("!").rstrip("/") or "."
+        for path in root.glob(pattern):
+            if not path.is_dir() or SKIP_DIRS.intersection(path.relative_to(root).parts):
+                continue
+            if not any((path / manifest).is_file() for manifest in MANIFESTS):
+                continue
+            rel_path = path.relative_to(root).as_posix()
+            (excluded if negate else members).add(rel_path)
+
+    members -= excluded
+    members.discard(".")
+
+    return {"root": str(root), "kinds": kinds, "members": sorted(members)}
+
+
+def _summarize(packages: Dict[str, Dict], root_analysis: Dict) -> Dict:
+    """Roll per-package analyses up into a repo-level analysis."""
+    summary = dict(root_analysis)
+    summary["detected_from"] = list(root_analysis["detected_from"])
+
+    for field in ("frontend_framework", "backend_framework", "database", "orm", "testing_framework"):
+        values = sorted({p[field] for p in packages.values() if p.get(field)})
+        if root_analysis.get(field) and root_analysis[field] not in values:
+            values.insert(0, root_analysis[field])
+        summary[field] = ", ".join(values) if values else None
+
+    summary["has_storybook"] = root_analysis["has_storybook"] or any(p["has_storybook"] for p in packages.values())
+
+    types = {p["project_type"] for p in packages.values()}
+    has_frontend = summary["frontend_framework"] is not None
+    has_backend = summary["backend_framework"] is not None
+    if has_frontend and has_backend:
+        summary["project_type"] = "fullstack"
+    elif has_frontend:
+        summary["project_type"] = "frontend"
+    elif has_backend:
+        summary["project_type"] = "backend"
+    elif types - {"unknown"}:
+        summary["project_type"] = "library"
+
+    summary["confidence"] = max([root_analysis["confidence"]] + [p["confidence"] for p in packages.values()])
+    summary["tech_stack"] = format_tech_stack(summary)
+    return summary
+
+
+def analyze_workspace(cwd: str = ".", max_workers: Optional[int] = None) -> Dict:
+    """
+    Analyze a monorepo: every member package concurrently, then aggregate.
+
+    Args:
+        cwd: Repository root
+        max_workers: Thread pool size (default: min(32, cpu_count + 4))
+
+    Returns:
+        Dictionary with workspace info, per-package analyses and a
+        repo-level summary shaped like project_analyzer output
+    """
+    workspace = discover_workspace(cwd)
+    root = Path(workspace["root"])
+    members = workspace["members"]
+
+    root_analysis = analyze_project(str(root))
+
+    packages: Dict[str, Dict] = {}
+    if members:
+        workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=min(workers, len(members))) as pool:
+            for rel_path, analysis in zip(members, pool.map(lambda m: analyze_project(str(root / m)), members)):
+                analysis["tech_stack"] = format_tech_stack(analysis)
+                packages[rel_path] = analysis
+
+    return {
+        "workspace": workspace,
+        "is_monorepo": bool(members),
+        "packages": packages,
+        "summary": _summarize(packages, root_analysis),
+    }
+
+
+if __name__ == "__main__":
+    cwd = sys.argv[1] if len(sys.argv) > 1 else "."
+    print(json.dumps(analyze_workspace(cwd), indent=2))
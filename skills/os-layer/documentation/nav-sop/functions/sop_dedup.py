@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Detect duplicate and near-duplicate SOPs across all categories.
+
+Each SOP body is reduced to a MinHash signature over word shingles, after
+stripping the sop_formatter template scaffolding (headings, placeholder
+bullets, metadata) that every generated SOP shares. The signatures are
+cached in .agent/sops/.sop-minhash.json (recomputed only when a file's
+mtime or size changes) and bucketed with LSH banding, so checking a new SOP
+only compares it against the few SOPs that share a bucket.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+INDEX_FILE = ".sop-minhash.json"
+INDEX_VERSION = 2
+
+SHINGLE_SIZE = 3
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+DEFAULT_THRESHOLD = 0.5
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_rng = random.Random(0x5011)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+# Header lines the formatter stamps on every SOP; they say nothing about content
+METADATA_PATTERN = re.compile(r"^\*\*(Category|Created|Last Updated|Maintained By|Tested With)\*\*:.*$", re.MULTILINE | re.IGNORECASE)
+# Unfilled template placeholders like "[Symptom 1]" (but not link text "[x](url)")
+PLACEHOLDER_PATTERN = re.compile(r"\[[^\]\n]*\](?!\()")
+
+
+@lru_cache(maxsize=1)
+def _template_lines() -> FrozenSet[str]:
+    """Lines of an unfilled sop_formatter template (headings and boilerplate)."""
+    from sop_formatter import format_sop  # sop_formatter imports this module
+
+    return frozenset(
+        line.strip() for line in format_sop("", "").lower().splitlines() if line.strip()
+    )
+
+
+def strip_scaffolding(text: str) -> str:
+    """Drop template lines, metadata and placeholders, keeping what the author wrote."""
+    template = _template_lines()
+    lines = [
+        line for line in METADATA_PATTERN.sub("", text.lower()).splitlines()
+        if line.strip() not in template
+    ]
+    return PLACEHOLDER_PATTERN.sub(" ", "\n".join(lines))
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set:
+    """Hashed word n-grams of SOP text without template scaffolding."""
+    words = WORD_PATTERN.findall(strip_scaffolding(text))
+    if 0 < len(words) < size:
+        grams = {" ".join(words)}
+    else:
+        grams = {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+    return {
+        int.from_bytes(hashlib.blake2b(g.encode("utf-8"), digest_size=4).digest(), "little")
+        for g in grams
+    }
+
+
+def minhash(shingle_hashes: set) -> List[int]:
+    """MinHash signature using universal hashing (a*x + b) mod p."""
+    if not shingle_hashes:
+        return [_MAX_HASH] * NUM_PERM
+
+    return [
+        min(((a * x + b) % _MERSENNE_PRIME) & _MAX_HASH for x in shingle_hashes)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def estimate_similarity(sig_a: List[int], sig_b: List[int]) -> float:
+    """Estimated Jaccard similarity from two signatures."""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / NUM_PERM
+
+
+def band_keys(signature: List[int]) -> List[str]:
+    """LSH bucket keys, one per band."""
+    return [
+        f"{band}:" + ",".join(map(str, signature[band * ROWS:(band + 1) * ROWS]))
+        for band in range(BANDS)
+    ]
+
+
+class SOPIndex:
+    """Cached MinHash signatures for SOPs with an in-memory LSH table."""
+
+    def __init__(self, agent_dir: str = ".agent"):
+        self.sops_dir = os.path.join(agent_dir, "sops")
+        self.path = os.path.join(self.sops_dir, INDEX_FILE)
+        self.entries: Dict[str, Dict] = {}
+        self.buckets: Dict[str, List[str]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get("version") == INDEX_VERSION and data.get("num_perm") == NUM_PERM:
+            self.entries = data.get("sops", {})
+            for rel_path, entry in self.entries.items():
+                self._bucket(rel_path, entry["signature"])
+
+    def save(self):
+        """Persist signatures if anything changed."""
+        if not self._dirty or not os.path.isdir(self.sops_dir):
+            return
+
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"version": INDEX_VERSION, "num_perm": NUM_PERM, "sops": self.entries},
+                      f, separators=(",", ":"))
+        os.replace(temp_path, self.path)
+        self._dirty = False
+
+    def _bucket(self, rel_path: str, signature: List[int]):
+        for key in band_keys(signature):
+            self.buckets.setdefault(key, []).append(rel_path)
+
+    def _unbucket(self, rel_path: str, signature: List[int]):
+        for key in band_keys(signature):
+            members = self.buckets.get(key)
+            if members and rel_path in members:
+                members.remove(rel_path)
+                if not members:
+                    del self.buckets[key]
+
+    def add(self, file_path: str) -> Optional[str]:
+        """
+        Index (or re-index) one SOP file.
+
+        Args:
+            file_path: Path to SOP markdown
+
+        Returns:
+            Path relative to .agent/sops/, or None if unreadable
+        """
+        rel_path = os.path.relpath(file_path, self.sops_dir).replace(os.sep, "/")
+        try:
+            st = os.stat(file_path)
+            entry = self.entries.get(rel_path)
+            if entry and entry["mtime"] == st.st_mtime and entry["size"] == st.st_size:
+                return rel_path
+            with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+                content = f.read()
+        except OSError:
+            return None
+
+        self.remove(rel_path)
+        signature = minhash(shingles(content))
+        self.entries[rel_path] = {"mtime": st.st_mtime, "size": st.st_size, "signature": signature}
+        self._bucket(rel_path, signature)
+        self._dirty = True
+        return rel_path
+
+    def remove(self, rel_path: str):
+        entry = self.entries.pop(rel_path, None)
+        if entry:
+            self._unbucket(rel_path, entry["signature"])
+            self._dirty = True
+
+    def refresh(self):
+        """Sync the index with every SOP under .agent/sops/."""
+        seen = set()
+        for root, dirs, files in os.walk(self.sops_dir):
+            dirs[:] = [d for d in dirs if not d.startswith(".")]
+            for name in files:
+                if name.endswith(".md"):
+                    rel_path = self.add(os.path.join(root, name))
+                    if rel_path:
+                        seen.add(rel_path)
+
+        for rel_path in list(self.entries):
+            if rel_path not in seen:
+                self.remove(rel_path)
+
+    def query(self, signature: List[int], threshold: float = DEFAULT_THRESHOLD,
+              exclude: Optional[str] = None) -> List[Tuple[str, float]]:
+        """
+        Find indexed SOPs similar to a signature.
+
+        Args:
+            signature: MinHash signature to look up
+            threshold: Minimum estimated Jaccard similarity
+            exclude: Relative path to skip (the SOP itself)
+
+        Returns:
+            List of (relative path, similarity), most similar first
+        """
+        candidates = set()
+        for key in band_keys(signature):
+            candidates.update(self.buckets.get(key, ()))
+        candidates.discard(exclude)
+
+        matches = []
+        for rel_path in candidates:
+            similarity = estimate_similarity(signature, self.entries[rel_path]["signature"])
+            if similarity >= threshold:
+                matches.append((rel_path, similarity))
+        return sorted(matches, key=lambda m: (-m[1], m[0]))
+
+    def clusters(self, threshold: float = DEFAULT_THRESHOLD) -> List[List[str]]:
+        """Group near-duplicate SOPs (connected components over LSH candidates)."""
+        parent = {p: p for p in self.entries}
+
+        def find(p):
+            while parent[p] != p:
+                parent[p] = parent[parent[p]]
+                p = parent[p]
+            return p
+
+        for rel_path, entry in self.entries.items():
+            for other, _ in self.query(entry["signature"], threshold, exclude=rel_path):
+                parent[find(other)] = find(rel_path)
+
+        groups: Dict[str, List[str]] = {}
+        for rel_path in self.entries:
+            groups.setdefault(find(rel_path), []).append(rel_path)
+        return sorted((sorted(g) for g in groups.values() if len(g) > 1), key=lambda g: g[0])
+
+
+def find_similar_sops(text: str, agent_dir: str = ".agent",
+                      threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """
+    Check proposed SOP content against existing SOPs.
+
+    Args:
+        text: Proposed SOP content, e.g. format_sop() output (raw field text
+            works too, since scaffolding is stripped from indexed SOPs)
+        agent_dir: Path to .agent directory
+        threshold: Minimum estimated Jaccard similarity
+
+    Returns:
+        Merge candidates: [{"path": ..., "similarity": ...}]
+    """
+    index = SOPIndex(agent_dir)
+    index.refresh()
+    index.save()
+
+    matches = index.query(minhash(shingles(text)), threshold)
+    return [
+        {"path": os.path.join(index.sops_dir, rel_path), "similarity": round(similarity, 2)}
+        for rel_path, similarity in matches
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find duplicate Navigator SOPs")
+    parser.add_argument("command", choices=["check", "add", "clusters"],
+                        help="check: compare a file/text against SOPs; add: index a new SOP; clusters: list duplicate groups")
+    parser.add_argument("target", nargs="?", help="SOP file (check/add) or '-' to read text from stdin (check)")
+    parser.add_argument("--agent-dir", default=".agent", help="Path to .agent directory")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Similarity threshold (0-1)")
+
+    args = parser.parse_args()
+
+    index = SOPIndex(args.agent_dir)
+
+    if args.command == "clusters":
+        index.refresh()
+        index.save()
+        groups = index.clusters(args.threshold)
+        print(json.dumps({"clusters": groups, "count": len(groups)}, indent=2))
+        sys.exit(0)
+
+    if not args.target:
+        parser.error(f"{args.command} requires a target")
+
+    if args.command == "add":
+        rel_path = index.add(args.target)
+        if rel_path is None:
+            print(f"Error: Cannot read {args.target}", file=sys.stderr)
+            sys.exit(1)
+        index.save()
+        matches = index.query(index.entries[rel_path]["signature"], args.threshold, exclude=rel_path)
+    else:
+        if args.target == "-":
+            text = sys.stdin.read()
+        else:
+            try:
+                with open(args.target, "r", encoding="utf-8") as f:
+                    text = f.read()
+            except OSError:
+                print(f"Error: Cannot read {args.target}", file=sys.stderr)
+                sys.exit(1)
+        index.refresh()
+        index.save()
+        exclude = None
+        if args.target != "-":
+            exclude = os.path.relpath(args.target, index.sops_dir).replace(os.sep, "/")
+        matches = index.query(minhash(shingles(text)), args.threshold, exclude=exclude)
+
+    print(json.dumps({
+        "duplicates": [
+            {"path": os.path.join(index.sops_dir, p), "similarity": round(s, 2)} for p, s in matches
+        ]
+    }, indent=2))
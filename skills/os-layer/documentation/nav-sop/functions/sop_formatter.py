@@ -7,6 +7,8 @@ import sys
 import argparse
 from datetime import datetime
 
+from sop_dedup import find_similar_sops
+
 def format_sop(title, category, problem="", solution="", when_to_use=""):
     """
     Generate formatted SOP markdown.
@@ -146,6 +148,8 @@ if __name__ == "__main__":
     parser.add_argument("--problem", default="", help="Problem description")
     parser.add_argument("--solution", default="", help="Solution steps")
     parser.add_argument("--when", default="", help="When to use this SOP")
+    parser.add_argument("--agent-dir", default=".agent", help="Path to .agent directory (for duplicate check)")
+    parser.add_argument("--skip-duplicate-check", action="store_true", help="Don't check for similar existing SOPs")
 
     args = parser.parse_args()
 
@@ -157,4 +161,12 @@ if __name__ == "__main__":
         when_to_use=args.when
     )
 
+    if not args.skip_duplicate_check:
+        # Compare the SOP as it will be written, like the indexed ones
+        similar = find_similar_sops(output, args.agent_dir)
+        if similar:
+            print("⚠️  Similar SOP(s) already exist - consider updating instead:", file=sys.stderr)
+            for match in similar:
+                print(f"   {match['path']} ({match['similarity']:.0%} similar)", file=sys.stderr)
+
     print(output)
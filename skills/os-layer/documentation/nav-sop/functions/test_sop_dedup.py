@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for SOP near-duplicate detection.
+
+Run from this directory: python3 -m pytest test_sop_dedup.py
+"""
+
+from sop_dedup import SOPIndex, find_similar_sops, minhash, shingles, estimate_similarity
+from sop_formatter import format_sop
+
+DEPLOY = dict(
+    title="Deploy to Production",
+    category="deployment",
+    when_to_use="Releasing a tagged build to the production cluster",
+    problem="Manual deploys skipped database migrations and left pods on stale images",
+    solution="Run the release pipeline, apply migrations, then roll the deployment",
+)
+
+WEBSOCKET = dict(
+    title="Debug WebSocket Disconnects",
+    category="debugging",
+    when_to_use="Clients lose realtime updates after a few minutes idle",
+    problem="The load balancer closes idle websocket connections without heartbeat frames",
+    solution="Send ping frames every 30 seconds and raise the proxy idle timeout",
+)
+
+
+def _write_sop(agent_dir, category, name, fields):
+    sop_dir = agent_dir / "sops" / category
+    sop_dir.mkdir(parents=True, exist_ok=True)
+    path = sop_dir / name
+    path.write_text(format_sop(**fields), encoding="utf-8")
+    return path
+
+
+def test_unrelated_formatted_sops_are_not_duplicates(tmp_path):
+    agent_dir = tmp_path / ".agent"
+    _write_sop(agent_dir, "deployment", "deploy-to-production.md", DEPLOY)
+    _write_sop(agent_dir, "debugging", "websocket-disconnects.md", WEBSOCKET)
+
+    similarity = estimate_similarity(
+        minhash(shingles(format_sop(**DEPLOY))),
+        minhash(shingles(format_sop(**WEBSOCKET))),
+    )
+    assert similarity < 0.2
+
+    index = SOPIndex(str(agent_dir))
+    index.refresh()
+    assert index.clusters() == []
+
+
+def test_resubmitted_sop_matches_existing_one(tmp_path):
+    agent_dir = tmp_path / ".agent"
+    path = _write_sop(agent_dir, "deployment", "deploy-to-production.md", DEPLOY)
+    _write_sop(agent_dir, "debugging", "websocket-disconnects.md", WEBSOCKET)
+
+    matches = find_similar_sops(format_sop(**DEPLOY), str(agent_dir))
+
+    assert [m["path"] for m in matches] == [str(path)]
+    assert matches[0]["similarity"] == 1.0
+
+
+def test_scaffolding_only_sop_has_no_shingles():
+    assert shingles(format_sop("", "deployment")) == set()
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Search Navigator task and SOP documentation without loading it into context.
+
+Maintains .agent/.doc-index.json: per-document metadata (title, status,
+created date, tags) plus an inverted index of body terms. Documents are only
+re-read when their mtime or size changes, so refreshing the index on a large
+.agent/ costs a directory stat pass.
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sys
+from collections import Counter
+from typing import Dict, List, Optional
+
+INDEX_FILE = ".doc-index.json"
+INDEX_VERSION = 1
+
+# Document kinds and the .agent/ subdirectory they live in
+DOC_ROOTS = {
+    "task": "tasks",
+    "sop": "sops",
+}
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9_]+")
+STOPWORDS = {
+    "the", "and", "for", "with", "this", "that", "from", "are", "was", "were",
+    "will", "into", "not", "but", "you", "your", "can", "has", "have", "use",
+    "all", "any", "when", "what", "how", "its", "our", "via", "per", "then",
+}
+
+STATUS_PATTERN = re.compile(r"^\*\*Status\*\*:\s*(.+)$", re.MULTILINE)
+CREATED_PATTERN = re.compile(r"^\*\*(?:Created|Date)\*\*:\s*(\d{4}-\d{2}-\d{2})", re.MULTILINE)
+TAGS_PATTERN = re.compile(r"^\*\*Tags\*\*:\s*(.+)$", re.MULTILINE)
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with stopwords removed."""
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOPWORDS]
+
+
+def extract_metadata(content: str, kind: str, rel_path: str) -> Dict:
+    """
+    Pull title, status, created date and tags from a task or SOP document.
+
+    Args:
+        content: Markdown content
+        kind: "task" or "sop"
+        rel_path: Path relative to .agent/
+
+    Returns:
+        Metadata dictionary
+    """
+    title = os.path.splitext(os.path.basename(rel_path))[0]
+    for line in content.splitlines():
+        if line.startswith("# "):
+            title = line[2:].strip()
+            break
+
+    status_match = STATUS_PATTERN.search(content)
+    created_match = CREATED_PATTERN.search(content)
+    tags_match = TAGS_PATTERN.search(content)
+
+    tags = []
+    if tags_match:
+        tags = [t.strip().strip("`#").lower() for t in tags_match.group(1).split(",") if t.strip()]
+
+    # SOP category and archived tasks are implicit tags
+    parts = rel_path.split("/")
+    if kind == "sop" and len(parts) > 2:
+        tags.append(parts[1])
+    if kind == "task" and "archive" in parts[1:-1]:
+        tags.append("archive")
+
+    status = status_match.group(1).strip() if status_match else None
+    if status:
+        # Drop leading emoji so "✅ Completed" filters as "Completed"
+        status = re.sub(r"^[^\w]+", "", status).strip()
+
+    return {
+        "kind": kind,
+        "title": title,
+        "status": status,
+        "created": created_match.group(1) if created_match else None,
+        "tags": sorted(set(tags)),
+    }
+
+
+class DocIndex:
+    """Incrementally maintained metadata and term index over .agent docs."""
+
+    def __init__(self, agent_dir: str = ".agent"):
+        self.agent_dir = agent_dir
+        self.path = os.path.join(agent_dir, INDEX_FILE)
+        self.docs: Dict[str, Dict] = {}
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get("version") != INDEX_VERSION:
+            return
+
+        self.docs = data.get("docs", {})
+        self.postings = data.get("postings", {})
+
+    def save(self):
+        """Atomically write the index back to disk."""
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({
+                "version": INDEX_VERSION,
+                "docs": self.docs,
+                "postings": self.postings,
+            }, f, separators=(",", ":"), ensure_ascii=False)
+        os.replace(temp_path, self.path)
+
+    def _scan(self) -> Dict[str, tuple]:
+        """Stat every markdown file under the indexed roots."""
+        found = {}
+        for kind, root in DOC_ROOTS.items():
+            stack = [os.path.join(self.agent_dir, root)]
+            while stack:
+                directory = stack.pop()
+                try:
+                    entries = os.scandir(directory)
+                except OSError:
+                    continue
+                with entries:
+                    for entry in entries:
+                        if entry.name.startswith("."):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(".md"):
+                            st = entry.stat()
+                            rel_path = os.path.relpath(entry.path, self.agent_dir).replace(os.sep, "/")
+                            found[rel_path] = (kind, st.st_mtime, st.st_size)
+        return found
+
+    def _remove(self, rel_path: str):
+        doc = self.docs.pop(rel_path, None)
+        if not doc:
+            return
+        for term in doc.get("terms", ()):
+            postings = self.postings.get(term)
+            if postings is not None:
+                postings.pop(rel_path, None)
+                if not postings:
+                    del self.postings[term]
+
+    def _add(self, rel_path: str, kind: str, mtime: float, size: int):
+        try:
+            with open(os.path.join(self.agent_dir, rel_path), "r", encoding="utf-8", errors="replace") as f:
+                content = f.read()
+        except OSError:
+            return
+
+        doc = extract_metadata(content, kind, rel_path)
+        terms = Counter(tokenize(content))
+        # Title words count extra so a doc named after the query ranks first
+        for term in tokenize(doc["title"]):
+            terms[term] += 3
+
+        doc.update({"mtime": mtime, "size": size, "length": sum(terms.values()), "terms": sorted(terms)})
+        self.docs[rel_path] = doc
+        for term, tf in terms.items():
+            self.postings.setdefault(term, {})[rel_path] = tf
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Bring the index up to date with the filesystem.
+
+        Returns:
+            Counts of added, updated and removed documents
+        """
+        found = self._scan()
+        stats = {"added": 0, "updated": 0, "removed": 0}
+
+        for rel_path in list(self.docs):
+            if rel_path not in found:
+                self._remove(rel_path)
+                stats["removed"] += 1
+
+        for rel_path, (kind, mtime, size) in found.items():
+            doc = self.docs.get(rel_path)
+            if doc and doc["mtime"] == mtime and doc["size"] == size:
+                continue
+            stats["updated" if doc else "added"] += 1
+            self._remove(rel_path)
+            self._add(rel_path, kind, mtime, size)
+
+        if any(stats.values()) or not os.path.exists(self.path):
+            self.save()
+        return stats
+
+    def _matches_filters(self, doc: Dict, kind: Optional[str], status: Optional[str], tag: Optional[str]) -> bool:
+        if kind and doc["kind"] != kind:
+            return False
+        if status and (doc.get("status") or "").lower() != status.lower():
+            return False
+        if tag and tag.lower() not in doc.get("tags", []):
+            return False
+        return True
+
+    def search(
+        self,
+        query: str,
+        kind: Optional[str] = None,
+        status: Optional[str] = None,
+        tag: Optional[str] = None,
+        limit: int = 3,
+    ) -> List[Dict]:
+        """
+        Rank documents against a free-text query using BM25.
+
+        Args:
+            query: Free-text query (empty to list by metadata filters only)
+            kind: Restrict to "task" or "sop"
+            status: Restrict to documents with this status
+            tag: Restrict to documents with this tag or SOP category
+            limit: Maximum number of results
+
+        Returns:
+            Ranked results with path, metadata, score and snippet
+        """
+        query_terms = list(dict.fromkeys(tokenize(query)))
+        total_docs = len(self.docs) or 1
+        avg_length = sum(d["length"] for d in self.docs.values()) / total_docs or 1
+
+        scores: Dict[str, float] = {}
+        if query_terms:
+            for term in query_terms:
+                postings = self.postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (total_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                for rel_path, tf in postings.items():
+                    doc = self.docs[rel_path]
+                    if not self._matches_filters(doc, kind, status, tag):
+                        continue
+                    norm = tf + K1 * (1 - B + B * doc["length"] / avg_length)
+                    scores[rel_path] = scores.get(rel_path, 0.0) + idf * tf * (K1 + 1) / norm
+        else:
+            for rel_path, doc in self.docs.items():
+                if self._matches_filters(doc, kind, status, tag):
+                    scores[rel_path] = 0.0
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+        results = []
+        for rel_path, score in ranked:
+            doc = self.docs[rel_path]
+            results.append({
+                "path": os.path.join(self.agent_dir, rel_path),
+                "kind": doc["kind"],
+                "title": doc["title"],
+                "status": doc.get("status"),
+                "created": doc.get("created"),
+                "tags": doc.get("tags", []),
+                "score": round(score, 3),
+                "snippet": self._snippet(rel_path, query_terms),
+            })
+        return results
+
+    def _snippet(self, rel_path: str, query_terms: List[str], width: int = 200) -> str:
+        """Return the line that matches the most query terms."""
+        wanted = set(query_terms)
+        best_line, best_hits = "", 0
+
+        try:
+            with open(os.path.join(self.agent_dir, rel_path), "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    stripped = line.strip()
+                    if not stripped or stripped.startswith("#"):
+                        continue
+                    if not best_line:
+                        best_line = stripped
+                    if not wanted:
+                        break
+                    hits = len(wanted.intersection(tokenize(stripped)))
+                    if hits > best_hits:
+                        best_line, best_hits = stripped, hits
+                        if hits == len(wanted):
+                            break
+        except OSError:
+            return ""
+
+        return best_line if len(best_line) <= width else best_line[:width - 3] + "..."
+
+
+def search_docs(query: str, agent_dir: str = ".agent", **filters) -> List[Dict]:
+    """
+    Refresh the index and search it.
+
+    Args:
+        query: Free-text query
+        agent_dir: Path to .agent directory
+        **filters: kind, status, tag, limit
+
+    Returns:
+        Ranked results
+    """
+    index = DocIndex(agent_dir)
+    index.refresh()
+    return index.search(query, **filters)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Search Navigator tasks and SOPs")
+    parser.add_argument("query", nargs="?", default="", help="Free-text query")
+    parser.add_argument("--agent-dir", default=".agent", help="Path to .agent directory")
+    parser.add_argument("--kind", choices=sorted(DOC_ROOTS), help="Restrict to tasks or SOPs")
+    parser.add_argument("--status", help="Restrict to status (e.g. Completed)")
+    parser.add_argument("--tag", help="Restrict to tag or SOP category")
+    parser.add_argument("--limit", type=int, default=3, help="Maximum results (default: 3)")
+    parser.add_argument("--json", action="store_true", help="Output JSON")
+
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.agent_dir):
+        print(f"Error: {args.agent_dir} not found", file=sys.stderr)
+        sys.exit(1)
+
+    results = search_docs(
+        args.query,
+        agent_dir=args.agent_dir,
+        kind=args.kind,
+        status=args.status,
+        tag=args.tag,
+        limit=args.limit,
+    )
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        sys.exit(0)
+
+    if not results:
+        print("No matching documents")
+        sys.exit(0)
+
+    for i, result in enumerate(results, 1):
+        meta = ", ".join(filter(None, [result["kind"], result["status"], result["created"]]))
+        print(f"{i}. {result['title']} ({meta}) [{result['score']}]")
+        print(f"   {result['path']}")
+        if result["snippet"]:
+            print(f"   > {result['snippet']}")
@@ -1,94 +1,383 @@
 #!/usr/bin/env python3
 """
 Update DEVELOPMENT-README.md task index with new task entry.
+
+The structured index in .agent/tasks/.task-index.json is the source of truth.
+The "Implementation Plans" block in DEVELOPMENT-README.md is a rendered view
+of it, rewritten only when the rendered output actually changes. The first
+render imports hand-written entries already in that section, so existing
+tasks are neither listed twice nor lose their dates and notes.
 """
 
+import argparse
+import hashlib
+import json
 import os
-import sys
 import re
+import sys
 from datetime import datetime
 
-def update_task_index(task_file, status="Planning", description=""):
+from section_index import SectionIndex
+
+INDEX_FILE = ".task-index.json"
+SECTION_HEADER = "### Implementation Plans (`tasks/`)"
+BLOCK_START = "<!-- nav-task-index:start -->"
+BLOCK_END = "<!-- nav-task-index:end -->"
+
+STATUS_EMOJI = {
+    "Planning": "📋",
+    "In Progress": "🚧",
+    "Completed": "✅"
+}
+
+# Hand-written README entry heading: #### [TASK-01: Title](./tasks/TASK-01-x.md)
+ENTRY_HEADING = re.compile(r"^#### \[([A-Z][A-Z0-9]*-\d+):\s*(.*?)\]\(\./(tasks(?:/archive)?)/([^)\s]+)\)[ \t]*$", re.M)
+ENTRY_FIELD = re.compile(r"^\*\*(Status|Created|Completed|What)\*\*:\s*(.*?)\s*$")
+
+
+def _task_sort_key(task_id):
+    prefix, _, number = task_id.rpartition("-")
+    return (prefix, int(number) if number.isdigit() else 0)
+
+
+class TaskIndex:
+    """Task entries keyed by task ID, persisted as JSON."""
+
+    def __init__(self, agent_dir=".agent"):
+        self.agent_dir = agent_dir
+        self.path = os.path.join(agent_dir, "tasks", INDEX_FILE)
+        self.tasks = {}
+        self.rendered_hash = None
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, "r") as f:
+            data = json.load(f)
+
+        self.tasks = data.get("tasks", {})
+        self.rendered_hash = data.get("rendered_hash")
+
+    def save(self):
+        """Atomically write the index back to disk."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+
+        with open(temp_path, "w") as f:
+            json.dump({
+                "version": 1,
+                "rendered_hash": self.rendered_hash,
+                "tasks": self.tasks
+            }, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+
+        os.replace(temp_path, self.path)
+
+    def add(self, task_id, task_file, title, status=None, description=""):
+        """
+        Insert a task, or update it in place if the ID is already indexed.
+
+        New tasks default to Planning; an existing task keeps its status
+        unless one is given.
+        """
+        entry = self.tasks.get(task_id)
+
+        if entry is None:
+            self.tasks[task_id] = {
+                "file": task_file,
+                "title": title,
+                "status": "Planning",
+                "created": datetime.now().strftime("%Y-%m-%d"),
+                "description": description,
+                "archived": False
+            }
+        else:
+            entry["file"] = task_file
+            if description:
+                entry["description"] = description
+
+        if status:
+            self.update_status(task_id, status)
+
+    def update_status(self, task_id, status):
+        """Change the status of an indexed task. Returns False if unknown."""
+        entry = self.tasks.get(task_id)
+        if entry is None:
+            return False
+
+        if entry["status"] != status:
+            # Hand-written suffixes like "(v1.3.0)" belonged to the old status
+            entry.pop("status_note", None)
+        entry["status"] = status
+        if status == "Completed" and "completed" not in entry:
+            entry["completed"] = datetime.now().strftime("%Y-%m-%d")
+        return True
+
+    def archive(self, task_id):
+        """Mark an indexed task as archived. Returns False if unknown."""
+        entry = self.tasks.get(task_id)
+        if entry is None:
+            return False
+
+        entry["archived"] = True
+        return True
+
+    def render(self):
+        """Render the index as the markdown block embedded in the README."""
+        lines = [BLOCK_START]
+
+        for task_id in sorted(self.tasks, key=_task_sort_key):
+            entry = self.tasks[task_id]
+            folder = "tasks/archive" if entry.get("archived") else "tasks"
+            status = entry["status"]
+            emoji = STATUS_EMOJI.get(status, "📋")
+
+            lines.append(f"""
+#### [{task_id}: {entry['title']}](./{folder}/{entry['file']})
+**Status**: {emoji} {status}{entry.get('status_note', '')}""")
+            if entry.get("created"):
+                lines.append(f"**Created**: {entry['created']}")
+            if entry.get("completed"):
+                lines.append(f"**Completed**: {entry['completed']}")
+            if entry.get("details"):
+                # Imported hand-written entry: keep its notes verbatim
+                if entry.get("description"):
+                    lines.append(f"\n**What**: {entry['description']}")
+                lines.append(f"\n{entry['details']}\n\n---")
+                continue
+            lines.append(f"""
+**What**: {entry.get('description') or "Description pending"}
+
+---""")
+
+        lines.append(BLOCK_END)
+        return "\n".join(lines)
+
+
+def parse_readme_entries(section_text):
     """
-    Add task entry to DEVELOPMENT-README.md index.
+    Parse hand-written task entries from the Implementation Plans section.
 
     Args:
-        task_file: Task filename (e.g., TASK-10-feature-name.md)
-        status: Task status (Planning, In Progress, Completed)
-        description: Short task description
+        section_text: Section body (after the heading)
 
     Returns:
-        bool: True if updated successfully
+        (entries, span) - task ID -> index entry, and the (start, end) character
+        range the entries cover in section_text (None if there are none)
     """
-    readme_path = ".agent/DEVELOPMENT-README.md"
+    matches = list(ENTRY_HEADING.finditer(section_text))
+    entries = {}
+
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(section_text)
+        task_id, title, folder, task_file = match.groups()
+        entry = {
+            "file": task_file,
+            "title": title,
+            "status": "Planning",
+            "created": None,
+            "description": "",
+            "archived": folder == "tasks/archive"
+        }
+
+        details = []
+        for line in section_text[match.end():end].splitlines():
+            field = ENTRY_FIELD.match(line)
+            if field is None:
+                details.append(line.rstrip())
+                continue
+
+            name, value = field.groups()
+            if name == "Status":
+                # "✅ Completed (v1.3.0)" -> status "Completed", note " (v1.3.0)"
+                value = value.lstrip("".join(STATUS_EMOJI.values()) + " \ufe0f")
+                status = next((known for known in STATUS_EMOJI if value.startswith(known)), None)
+                entry["status"] = status or value
+                if status and value[len(status):]:
+                    entry["status_note"] = value[len(status):]
+            elif name == "What":
+                entry["description"] = value
+            else:
+                entry[name.lower()] = value
+
+        # Trailing separators and blank lines are re-rendered
+        while details and details[-1].strip() in ("", "---"):
+            details.pop()
+        while details and not details[0].strip():
+            details.pop(0)
+        if details:
+            entry["details"] = "\n".join(details)
+
+        entries[task_id] = entry
+
+    span = (matches[0].start(), len(section_text)) if matches else None
+    return entries, span
+
+
+def _locate_section(agent_dir, readme_path):
+    sections = SectionIndex(agent_dir)
+    section = sections.locate(readme_path, SECTION_HEADER.lstrip("# "))
+    sections.save()
+    return section
+
+
+def import_readme_entries(index):
+    """
+    Import hand-written README entries into an index that was never rendered.
+
+    Entries already in the index win, so re-running is harmless.
+
+    Args:
+        index: Loaded TaskIndex
+
+    Returns:
+        int: Number of entries imported
+    """
+    readme_path = os.path.join(index.agent_dir, "DEVELOPMENT-README.md")
+    if index.rendered_hash is not None or not os.path.exists(readme_path):
+        return 0
+
+    with open(readme_path, "rb") as f:
+        content = f.read()
+    if BLOCK_START.encode() in content:
+        return 0
+
+    section = _locate_section(index.agent_dir, readme_path)
+    if section is None:
+        return 0
+
+    entries, _ = parse_readme_entries(content[section[3]:section[4]].decode("utf-8"))
+    imported = 0
+    for task_id, entry in entries.items():
+        if task_id not in index.tasks:
+            index.tasks[task_id] = entry
+            imported += 1
+    return imported
+
+
+def _splice_block(content, block, section=None):
+    """
+    Replace the rendered block in README bytes.
+
+    Without a block yet, hand-written entries in the section are replaced by
+    it (they were imported by import_readme_entries), or it is appended.
+    """
+    start = content.find(BLOCK_START.encode())
+    if start != -1:
+        end = content.find(BLOCK_END.encode(), start)
+        if end != -1:
+            return content[:start] + block + content[end + len(BLOCK_END):]
+
+    if section is None:
+        return None
+
+    body_start, section_end = section[3], section[4]
+    body = content[body_start:section_end].decode("utf-8")
+    _, span = parse_readme_entries(body)
+    # Insert where the hand-written entries started, dropping them
+    insert_at = body_start + len(body[:span[0]].encode("utf-8")) if span else section_end
+
+    return content[:insert_at].rstrip() + b"\n\n" + block + b"\n\n" + content[section_end:].lstrip(b"\n")
+
+
+def render_readme(index):
+    """
+    Regenerate the README block if the index changed since the last render.
+
+    Args:
+        index: Loaded TaskIndex
+
+    Returns:
+        bool: True if the README is up to date (written or unchanged)
+    """
+    readme_path = os.path.join(index.agent_dir, "DEVELOPMENT-README.md")
 
     if not os.path.exists(readme_path):
         print(f"Error: {readme_path} not found", file=sys.stderr)
         return False
 
-    # Extract task ID and title from filename
-    match = re.match(r'(TASK-\d+)-(.*?)\.md', task_file)
-    if not match:
-        print(f"Error: Invalid task filename format: {task_file}", file=sys.stderr)
-        return False
+    block = index.render()
+    block_hash = hashlib.sha256(block.encode("utf-8")).hexdigest()
+    if block_hash == index.rendered_hash:
+        return True
 
-    task_id = match.group(1)
-    task_slug = match.group(2).replace('-', ' ').title()
+    section = _locate_section(index.agent_dir, readme_path)
 
-    # Read current README
-    with open(readme_path, 'r') as f:
+    with open(readme_path, "rb") as f:
         content = f.read()
 
-    # Find the task index section
-    task_section_pattern = r'(### Implementation Plans \(`tasks/`\).*?)(###|\Z)'
-    task_section_match = re.search(task_section_pattern, content, re.DOTALL)
-
-    if not task_section_match:
+    updated_content = _splice_block(content, block.encode("utf-8"), section)
+    if updated_content is None:
         print("Error: Could not find task index section", file=sys.stderr)
         return False
 
-    # Create new task entry
-    status_emoji = {
-        "Planning": "📋",
-        "In Progress": "🚧",
-        "Completed": "✅"
-    }.get(status, "📋")
+    if updated_content != content:
+        with open(readme_path, "wb") as f:
+            f.write(updated_content)
+
+    index.rendered_hash = block_hash
+    index.save()
+    return True
 
-    today = datetime.now().strftime("%Y-%m-%d")
 
-    new_entry = f"""
-#### [{task_id}: {task_slug}](./tasks/{task_file})
-**Status**: {status_emoji} {status}
-**Created**: {today}
+def update_task_index(task_file, status=None, description="", agent_dir=".agent", archive=False):
+    """
+    Add or update a task entry in the index and DEVELOPMENT-README.md.
 
-**What**: {description or "Description pending"}
+    Args:
+        task_file: Task filename (e.g., TASK-10-feature-name.md)
+        status: Task status (Planning, In Progress, Completed); None keeps an
+            indexed task's status and starts new tasks as Planning
+        description: Short task description
+        agent_dir: Path to .agent directory (default: .agent)
+        archive: Move the task to tasks/archive/ and mark it archived
 
----
-"""
+    Returns:
+        bool: True if updated successfully
+    """
+    # Extract task ID and title from filename
+    match = re.match(r'([A-Z][A-Z0-9]*-\d+)-(.*?)\.md', task_file)
+    if not match:
+        print(f"Error: Invalid task filename format: {task_file}", file=sys.stderr)
+        return False
 
-    # Insert before the next section marker
-    task_section = task_section_match.group(1)
-    rest_of_doc = content[task_section_match.end(1):]
+    task_id = match.group(1)
+    task_slug = match.group(2).replace('-', ' ').title()
+
+    index = TaskIndex(agent_dir)
+    import_readme_entries(index)
+    index.add(task_id, task_file, task_slug, status, description)
 
-    # Add new entry at the end of task section
-    updated_section = task_section.rstrip() + "\n" + new_entry
-    updated_content = content[:task_section_match.start(1)] + updated_section + rest_of_doc
+    if archive:
+        tasks_dir = os.path.join(agent_dir, "tasks")
+        source = os.path.join(tasks_dir, task_file)
+        archive_dir = os.path.join(tasks_dir, "archive")
+        if os.path.exists(source):
+            os.makedirs(archive_dir, exist_ok=True)
+            os.replace(source, os.path.join(archive_dir, task_file))
+        index.archive(task_id)
 
-    # Write back
-    with open(readme_path, 'w') as f:
-        f.write(updated_content)
+    index.save()
 
-    print(f"✅ Added {task_id} to DEVELOPMENT-README.md index")
+    if not render_readme(index):
+        return False
+
+    action = "Archived" if archive else "Indexed"
+    print(f"✅ {action} {task_id} in DEVELOPMENT-README.md index")
     return True
 
+
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: index_updater.py <task-file> [status] [description]", file=sys.stderr)
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="Update Navigator task index")
+    parser.add_argument("task_file", help="Task filename (e.g., TASK-10-feature-name.md)")
+    parser.add_argument("status", nargs="?", help="Planning, In Progress, Completed (default: Planning for new tasks, unchanged otherwise)")
+    parser.add_argument("description", nargs="?", default="", help="Short task description")
+    parser.add_argument("--agent-dir", default=".agent", help="Path to .agent directory")
+    parser.add_argument("--archive", action="store_true", help="Move task to tasks/archive/")
 
-    task_file = sys.argv[1]
-    status = sys.argv[2] if len(sys.argv) > 2 else "Planning"
-    description = sys.argv[3] if len(sys.argv) > 3 else ""
+    args = parser.parse_args()
 
-    success = update_task_index(task_file, status, description)
+    success = update_task_index(args.task_file, args.status, args.description, args.agent_dir, args.archive)
     sys.exit(0 if success else 1)
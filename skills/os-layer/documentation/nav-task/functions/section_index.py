@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Load a single markdown section by address instead of reading whole docs.
+
+Builds a byte-offset map of the headers in a markdown file and caches it in
+.agent/.section-index.json, invalidated by mtime and size. A section such as
+"DEVELOPMENT-README.md#Implementation Plans" is then served with one seek and
+one bounded read.
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+
+INDEX_FILE = ".section-index.json"
+INDEX_VERSION = 1
+
+
+def scan_headers(data: bytes) -> List[List]:
+    """
+    Map ATX headers to byte offsets, skipping fenced code blocks.
+
+    Args:
+        data: Raw markdown bytes
+
+    Returns:
+        List of [level, title, header_start, body_start, section_end]
+    """
+    headers = []
+    offset = 0
+    fence = None
+
+    for line in data.splitlines(keepends=True):
+        stripped = line.lstrip()
+        if stripped.startswith((b"```", b"~~~")):
+            marker = stripped[:3]
+            if fence is None:
+                fence = marker
+            elif marker == fence:
+                fence = None
+        elif fence is None and line.startswith(b"#"):
+            level = len(line) - len(line.lstrip(b"#"))
+            rest = line[level:]
+            if level <= 6 and (rest[:1] in (b" ", b"\t") or not rest.strip()):
+                title = rest.strip().decode("utf-8", errors="replace")
+                headers.append([level, title, offset, offset + len(line), len(data)])
+        offset += len(line)
+
+    # A section ends where the next header of the same or higher level starts
+    open_sections: List[List] = []
+    for header in headers:
+        while open_sections and open_sections[-1][0] >= header[0]:
+            open_sections.pop()[4] = header[2]
+        open_sections.append(header)
+
+    return headers
+
+
+class SectionIndex:
+    """Cached header maps for markdown files, keyed by path."""
+
+    def __init__(self, agent_dir: str = ".agent"):
+        self.agent_dir = agent_dir
+        self.path = os.path.join(agent_dir, INDEX_FILE)
+        self.files: Dict[str, Dict] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if data.get("version") == INDEX_VERSION:
+            self.files = data.get("files", {})
+
+    def save(self):
+        """Persist the cache if anything changed (no-op without .agent/)."""
+        if not self._dirty or not os.path.isdir(self.agent_dir):
+            return
+
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"version": INDEX_VERSION, "files": self.files}, f, separators=(",", ":"), ensure_ascii=False)
+        os.replace(temp_path, self.path)
+        self._dirty = False
+
+    def resolve(self, file_path: str) -> str:
+        """Resolve a doc path, falling back to the .agent/ directory."""
+        if not os.path.exists(file_path):
+            candidate = os.path.join(self.agent_dir, file_path)
+            if os.path.exists(candidate):
+                return candidate
+        return file_path
+
+    def headers(self, file_path: str) -> List[List]:
+        """
+        Return the header map for a file, rebuilding it only if it changed.
+
+        Args:
+            file_path: Markdown file path
+
+        Returns:
+            List of [level, title, header_start, body_start, section_end]
+        """
+        st = os.stat(file_path)
+        key = os.path.abspath(file_path)
+        cached = self.files.get(key)
+
+        if cached and cached["mtime"] == st.st_mtime and cached["size"] == st.st_size:
+            return cached["headers"]
+
+        with open(file_path, "rb") as f:
+            headers = scan_headers(f.read())
+
+        self.files[key] = {"mtime": st.st_mtime, "size": st.st_size, "headers": headers}
+        self._dirty = True
+        return headers
+
+    def locate(self, file_path: str, address: str) -> Optional[List]:
+        """
+        Find a section by heading address.
+
+        The address is a heading title, matched case-insensitively (exact
+        match first, then prefix). Nested headings are separated by " > ",
+        e.g. "Standard Operating Procedures > Debugging".
+
+        Args:
+            file_path: Markdown file path
+            address: Heading address
+
+        Returns:
+            [level, title, header_start, body_start, section_end] or None
+        """
+        headers = self.headers(file_path)
+        scope: Tuple[int, int] = (0, float("inf"))
+        found = None
+
+        for part in [p.strip().lower() for p in address.split(" > ") if p.strip()]:
+            candidates = [h for h in headers if scope[0] <= h[2] < scope[1] and h is not found]
+            match = next((h for h in candidates if h[1].lower() == part), None)
+            if match is None:
+                match = next((h for h in candidates if h[1].lower().startswith(part)), None)
+            if match is None:
+                return None
+            found = match
+            scope = (match[3], match[4])
+
+        return found
+
+    def read_section(self, file_path: str, address: str, include_heading: bool = True) -> Optional[str]:
+        """
+        Read one section with a seek and a bounded read.
+
+        Args:
+            file_path: Markdown file path
+            address: Heading address (see locate)
+            include_heading: Include the heading line itself
+
+        Returns:
+            Section text, or None if the heading does not exist
+        """
+        section = self.locate(file_path, address)
+        if section is None:
+            return None
+
+        start = section[2] if include_heading else section[3]
+        with open(file_path, "rb") as f:
+            f.seek(start)
+            return f.read(section[4] - start).decode("utf-8", errors="replace")
+
+
+def load_section(ref: str, agent_dir: str = ".agent", include_heading: bool = True) -> Optional[str]:
+    """
+    Load a section by "path#Heading" reference.
+
+    Args:
+        ref: Reference like "DEVELOPMENT-README.md#Implementation Plans"
+        agent_dir: Path to .agent directory (used for relative doc names and cache)
+        include_heading: Include the heading line itself
+
+    Returns:
+        Section text, or None if the file or heading does not exist
+    """
+    file_path, _, address = ref.partition("#")
+    index = SectionIndex(agent_dir)
+    file_path = index.resolve(file_path)
+
+    if not os.path.isfile(file_path):
+        return None
+
+    try:
+        if not address:
+            return "\n".join(f"{'#' * h[0]} {h[1]}" for h in index.headers(file_path))
+        return index.read_section(file_path, address, include_heading)
+    finally:
+        index.save()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load one markdown section by reference")
+    parser.add_argument("ref", help='Section reference, e.g. "DEVELOPMENT-README.md#Implementation Plans" (omit #... to list headings)')
+    parser.add_argument("--agent-dir", default=".agent", help="Path to .agent directory")
+    parser.add_argument("--no-heading", action="store_true", help="Omit the heading line")
+
+    args = parser.parse_args()
+
+    text = load_section(args.ref, args.agent_dir, include_heading=not args.no_heading)
+    if text is None:
+        print(f"Error: Section not found: {args.ref}", file=sys.stderr)
+        sys.exit(1)
+
+    print(text.rstrip("\n"))
@@ -1,15 +1,142 @@
 #!/usr/bin/env python3
 """
-Generate next sequential TASK-XX ID by scanning existing task files.
+Generate next sequential TASK-XX ID from a persisted task counter.
+
+The counter lives in .agent/tasks/.task-counter.json and is only rebuilt by
+scanning tasks/ and tasks/archive/ when it is missing. Allocation happens
+under an exclusive file lock so parallel sessions never receive the same ID,
+and skips numbers whose task file already exists (e.g. created by hand).
 """
 
+import argparse
+import glob
+import json
 import os
 import re
 import sys
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+COUNTER_FILE = ".task-counter.json"
+LOCK_FILE = ".task-counter.lock"
+
+
+@contextmanager
+def _counter_lock(tasks_dir):
+    """Hold an exclusive lock on the counter for the duration of the block."""
+    os.makedirs(tasks_dir, exist_ok=True)
+    lock_path = os.path.join(tasks_dir, LOCK_FILE)
+
+    with open(lock_path, "a+") as lock:
+        if fcntl:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+        else:
+            lock.seek(0)
+            msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+            else:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def scan_highest_task_number(tasks_dir, prefix="TASK"):
+    """
+    Find the highest task number in tasks/ and tasks/archive/.
+
+    Args:
+        tasks_dir: Path to .agent/tasks directory
+        prefix: Task ID prefix (default: TASK)
+
+    Returns:
+        int: Highest task number found (0 if none)
+    """
+    task_pattern = re.compile(rf"{re.escape(prefix)}-(\d+)-.*\.md")
+    highest = 0
+
+    for directory in (tasks_dir, os.path.join(tasks_dir, "archive")):
+        if not os.path.isdir(directory):
+            continue
+
+        for filename in os.listdir(directory):
+            match = task_pattern.match(filename)
+            if match:
+                highest = max(highest, int(match.group(1)))
+
+    return highest
+
+
+def _read_counters(tasks_dir):
+    """Load the counter file, returning None if it is missing or unreadable."""
+    counter_path = os.path.join(tasks_dir, COUNTER_FILE)
+
+    try:
+        with open(counter_path, "r") as f:
+            counters = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    return counters if isinstance(counters, dict) else None
+
+
+def _write_counters(tasks_dir, counters):
+    """Atomically replace the counter file."""
+    counter_path = os.path.join(tasks_dir, COUNTER_FILE)
+    temp_path = f"{counter_path}.{os.getpid()}.tmp"
+
+    with open(temp_path, "w") as f:
+        json.dump(counters, f, indent=2, sort_keys=True)
+        f.write("\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(temp_path, counter_path)
+
+
+def _last_number(tasks_dir, counters, prefix):
+    """Return the last allocated number for prefix, scanning only if unknown."""
+    if counters is not None and isinstance(counters.get(prefix), int):
+        return counters[prefix]
+    return scan_highest_task_number(tasks_dir, prefix)
+
+
+def _format_id(prefix, number):
+    return f"{prefix}-{number:02d}"
+
+
+def _task_file_exists(tasks_dir, prefix, number):
+    """Whether tasks/ or tasks/archive/ already has a file for this number."""
+    task_pattern = re.compile(rf"{re.escape(prefix)}-(\d+)-.*\.md")
+
+    for directory in (tasks_dir, os.path.join(tasks_dir, "archive")):
+        # Candidates only; the regex check handles padding like TASK-007
+        for path in glob.glob(os.path.join(glob.escape(directory), f"{glob.escape(prefix)}-*{number}-*.md")):
+            match = task_pattern.match(os.path.basename(path))
+            if match and int(match.group(1)) == number:
+                return True
+
+    return False
+
+
+def _next_free_number(tasks_dir, counters, prefix):
+    """First number after the counter without an existing task file."""
+    number = _last_number(tasks_dir, counters, prefix) + 1
+    while _task_file_exists(tasks_dir, prefix, number):
+        number += 1
+    return number
+
 
 def get_next_task_id(agent_dir=".agent", prefix="TASK"):
     """
-    Scan tasks/ directory and return next available TASK-XX ID.
+    Return the next available TASK-XX ID without reserving it.
 
     Args:
         agent_dir: Path to .agent directory (default: .agent)
@@ -21,31 +148,77 @@ def get_next_task_id(agent_dir=".agent", prefix="TASK"):
     tasks_dir = os.path.join(agent_dir, "tasks")
 
     if not os.path.exists(tasks_dir):
-        return f"{prefix}-01"
+        return _format_id(prefix, 1)
 
-    # Find all task files matching pattern TASK-XX-*.md
-    task_pattern = re.compile(rf"{prefix}-(\d+)-.*\.md")
-    task_numbers = []
+    return _format_id(prefix, _next_free_number(tasks_dir, _read_counters(tasks_dir), prefix))
 
-    for filename in os.listdir(tasks_dir):
-        if filename == "archive":  # Skip archive directory
-            continue
 
-        match = task_pattern.match(filename)
-        if match:
-            task_numbers.append(int(match.group(1)))
+def allocate_task_id(agent_dir=".agent", prefix="TASK"):
+    """
+    Reserve and return the next TASK-XX ID.
+
+    Safe to call from parallel sessions: the read-increment-write happens
+    under an exclusive lock, so every caller receives a unique ID. Numbers
+    already taken by task files the counter doesn't know about are skipped.
+
+    Args:
+        agent_dir: Path to .agent directory (default: .agent)
+        prefix: Task ID prefix (default: TASK)
+
+    Returns:
+        str: Reserved task ID (e.g., "TASK-10")
+    """
+    tasks_dir = os.path.join(agent_dir, "tasks")
+
+    with _counter_lock(tasks_dir):
+        counters = _read_counters(tasks_dir) or {}
+        next_num = _next_free_number(tasks_dir, counters, prefix)
+        counters[prefix] = next_num
+        _write_counters(tasks_dir, counters)
 
-    if not task_numbers:
-        return f"{prefix}-01"
+    return _format_id(prefix, next_num)
+
+
+def rebuild_counter(agent_dir=".agent", prefix="TASK"):
+    """
+    Re-seed the counter from a scan of tasks/ and tasks/archive/.
+
+    Use after task files were created or renamed by hand. The counter never
+    moves backwards, so IDs that were already handed out stay reserved.
+
+    Args:
+        agent_dir: Path to .agent directory (default: .agent)
+        prefix: Task ID prefix (default: TASK)
+
+    Returns:
+        int: Last allocated task number after the rebuild
+    """
+    tasks_dir = os.path.join(agent_dir, "tasks")
+
+    with _counter_lock(tasks_dir):
+        counters = _read_counters(tasks_dir) or {}
+        scanned = scan_highest_task_number(tasks_dir, prefix)
+        counters[prefix] = max(scanned, counters.get(prefix, 0))
+        _write_counters(tasks_dir, counters)
+
+    return counters[prefix]
 
-    # Get next sequential number
-    next_num = max(task_numbers) + 1
-    return f"{prefix}-{next_num:02d}"
 
 if __name__ == "__main__":
-    # Support optional arguments
-    agent_dir = sys.argv[1] if len(sys.argv) > 1 else ".agent"
-    prefix = sys.argv[2] if len(sys.argv) > 2 else "TASK"
+    parser = argparse.ArgumentParser(description="Generate next Navigator task ID")
+    parser.add_argument("agent_dir", nargs="?", default=".agent", help="Path to .agent directory")
+    parser.add_argument("prefix", nargs="?", default="TASK", help="Task ID prefix")
+    parser.add_argument("--allocate", action="store_true", help="Reserve the ID so parallel sessions cannot reuse it")
+    parser.add_argument("--rebuild", action="store_true", help="Re-seed the counter from existing task files")
+
+    args = parser.parse_args()
+
+    if args.rebuild:
+        last = rebuild_counter(args.agent_dir, args.prefix)
+        print(f"✅ Counter rebuilt: last {args.prefix} number is {last}", file=sys.stderr)
 
-    next_id = get_next_task_id(agent_dir, prefix)
+    if args.allocate:
+        next_id = allocate_task_id(args.agent_dir, args.prefix)
+    else:
+        next_id = get_next_task_id(args.agent_dir, args.prefix)
     print(next_id)
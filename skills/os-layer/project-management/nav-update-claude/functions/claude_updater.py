@@ -7,6 +7,7 @@ Extracts customizations and generates updated CLAUDE.md with v3.1 template
 import sys
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 from urllib import request
@@ -113,27 +114,54 @@ def get_template_path(bundled_template_dir: str, version: Optional[str] = None)
 
     raise FileNotFoundError(f"No template found (GitHub failed, bundled not at {bundled_path})")
 
+@lru_cache(maxsize=4)
+def _header_map(content: str) -> tuple:
+    """
+    Map level 1-2 headers to offsets in a single pass, skipping code fences.
+
+    Cached per content so repeated extract_section calls on the same
+    document share one scan instead of re-running regexes over the text.
+
+    Returns:
+        Tuple of (title, header_start, body_start)
+    """
+    headers = []
+    offset = 0
+    in_fence = False
+
+    for line in content.splitlines(keepends=True):
+        stripped = line.strip()
+        if stripped.startswith('```'):
+            in_fence = not in_fence
+        elif not in_fence:
+            match = re.match(r'#{1,2}\s+(.+?)\s*$', line)
+            if match:
+                headers.append((match.group(1), offset, offset + len(line)))
+        offset += len(line)
+
+    return tuple(headers)
+
 def extract_section(content: str, header: str, next_headers: List[str]) -> Optional[str]:
     """Extract content between header and next section header"""
-    # Find header (supports ## or # with various markdown formats)
-    header_pattern = r'^#{1,2}\s+' + re.escape(header) + r'.*?$'
-    match = re.search(header_pattern, content, re.MULTILINE | re.IGNORECASE)
+    headers = _header_map(content)
+    header_lower = header.lower()
+    next_lower = tuple(h.lower() for h in next_headers)
 
-    if not match:
+    # Find header (supports ## or # with various markdown formats)
+    for i, (title, _, body_start) in enumerate(headers):
+        if title.lower().startswith(header_lower):
+            break
+    else:
         return None
 
-    start = match.end()
-
     # Find next header
-    next_pattern = r'^#{1,2}\s+(' + '|'.join(re.escape(h) for h in next_headers) + r').*?$'
-    next_match = re.search(next_pattern, content[start:], re.MULTILINE | re.IGNORECASE)
-
-    if next_match:
-        end = start + next_match.start()
-    else:
-        end = len(content)
+    end = len(content)
+    for title, header_start, _ in headers[i + 1:]:
+        if title.lower().startswith(next_lower):
+            end = header_start
+            break
 
-    section = content[start:end].strip()
+    section = content[body_start:end].strip()
     return section if section else None
 
 def extract_customizations(claude_md_path: str) -> Dict:
@@ -282,7 +310,7 @@ def extract_customizations(claude_md_path: str) -> Dict:
     ]
 
     # Find all ## headers
-    headers = re.findall(r'^##\s+(.+?)$', content, re.MULTILINE)
+    headers = [title for title, start, _ in _header_map(content) if content.startswith('## ', start)]
     for header in headers:
         if header.strip() not in standard_sections:
             section_content = extract_section(content, header, standard_sections + headers)